@@ -6,9 +6,125 @@ References for Creation of Application
     https://www.ecfr.gov/current/title-38/chapter-I/part-4/subpart-A/section-4.25
     https://www.knowva.ebenefits.va.gov/system/templates/selfservice/va_ssnew/help/customer/locale/en-US/portal/554400000001018/content/554400000180525/M21-1-Part-V-Subpart-iv-Chapter-1-Section-C-Coded-Conclusion#4b
 '''
-import tkinter as tk
-from tkinter import messagebox
-from typing import List, Dict, Optional, Any
+import argparse
+import bisect
+import collections
+import csv
+import functools
+import importlib
+import importlib.util
+import io
+import itertools
+import json
+import mmap
+import operator
+import os
+import random
+import struct
+import sys
+import threading
+import time
+from array import array
+from decimal import Decimal
+from fractions import Fraction
+from typing import List, Dict, Optional, Any, NamedTuple, Sequence, Iterable, Iterator, TextIO, Tuple, Callable, Union, Set
+
+class _LazyModule:
+    """Stands in for a module and imports it on first attribute access, so headless use never loads the GUI stack."""
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attribute: str) -> Any:
+        module = importlib.import_module(self._name)
+        self.__dict__.update(vars(module))  # later lookups skip __getattr__ entirely
+        return getattr(module, attribute)
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self._name}'>"
+
+# Only the calculation core is imported eagerly. The GUI and its worker queue, the HTTP service and NumPy load on first use.
+tk = _LazyModule('tkinter')
+messagebox = _LazyModule('tkinter.messagebox')
+filedialog = _LazyModule('tkinter.filedialog')
+ttk = _LazyModule('tkinter.ttk')
+asyncio = _LazyModule('asyncio')
+queue = _LazyModule('queue')
+sqlite3 = _LazyModule('sqlite3')
+# NumPy is optional; batch scoring falls back to the scalar path.
+np = _LazyModule('numpy') if importlib.util.find_spec('numpy') is not None else None
+
+# --- Instrumentation ---
+class ScoringStats:
+    """
+    Opt-in counters and per-stage timers for the scoring paths. While disabled, every
+    instrumented point costs a single attribute check. enable() starts collection,
+    optionally under cProfile and/or with a trace callback receiving (stage, elapsed_ns).
+    """
+    STAGES = ('parse', 'group', 'bilateral', 'combine', 'report')
+
+    def __init__(self):
+        self.enabled = False
+        self.trace: Optional[Callable[[str, int], None]] = None
+        self.profiler: Optional["cProfile.Profile"] = None
+        self.reset()
+
+    def reset(self):
+        self.counters: "collections.Counter[str]" = collections.Counter()
+        self.stage_ns: "collections.Counter[str]" = collections.Counter()
+        self.stage_calls: "collections.Counter[str]" = collections.Counter()
+        self.worker_cache: "collections.Counter[str]" = collections.Counter()
+
+    def enable(self, profile: bool = False, trace: Optional[Callable[[str, int], None]] = None):
+        self.enabled = True
+        self.trace = trace
+        if profile:
+            if self.profiler is None:
+                import cProfile
+                self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def disable(self):
+        self.enabled = False
+        if self.profiler is not None:
+            self.profiler.disable()
+
+    def record(self, stage: str, start_ns: int, calls: int = 1):
+        """Adds the time since start_ns (from time.perf_counter_ns) to a stage."""
+        elapsed = time.perf_counter_ns() - start_ns
+        self.stage_ns[stage] += elapsed
+        self.stage_calls[stage] += calls
+        if self.trace is not None:
+            self.trace(stage, elapsed)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters, per-stage totals and the result-cache statistics, as plain data."""
+        stages = {stage: {'calls': self.stage_calls[stage], 'total_ms': self.stage_ns[stage] / 1e6,
+                          'mean_us': self.stage_ns[stage] / self.stage_calls[stage] / 1e3 if self.stage_calls[stage] else 0.0}
+                  for stage in self.STAGES if self.stage_calls[stage]}
+        counters = {name: self.counters[name] for name in ('claims_scored', 'bilateral_claims', 'early_exits_100')}
+        cache = CLAIM_SCORE_CACHE.stats()
+        for name, value in self.worker_cache.items():
+            cache[name] += value
+        return {'enabled': self.enabled, 'counters': counters, 'stages': stages, 'cache': cache}
+
+    def merge(self, snapshot: Dict[str, Any]):
+        """Adds a worker process's snapshot into this one; its cache hits, misses and evictions are added too."""
+        self.counters.update(snapshot['counters'])
+        for stage, values in snapshot['stages'].items():
+            self.stage_calls[stage] += values['calls']
+            self.stage_ns[stage] += int(values['total_ms'] * 1e6)
+        for name in ('hits', 'misses', 'evictions'):
+            self.worker_cache[name] += snapshot['cache'].get(name, 0)
+
+    def profile_report(self, sort: str = 'cumulative', limit: int = 25) -> str:
+        if self.profiler is None:
+            return ''
+        import pstats
+        buffer = io.StringIO()
+        pstats.Stats(self.profiler, stream=buffer).sort_stats(sort).print_stats(limit)
+        return buffer.getvalue()
+
+SCORING_STATS = ScoringStats()
 
 # --- Calculation functions ---
 def corrected_va_disability_precise(ratings: List[float]) -> float: 
@@ -23,6 +139,7 @@ def corrected_va_disability_precise(ratings: List[float]) -> float:
     for r_val in valid_ratings[1:]:
         if combined >= 100: 
             combined = 100 
+            if SCORING_STATS.enabled: SCORING_STATS.counters['early_exits_100'] += 1
             break
         remaining = 100.0 - combined
         combined += remaining * (float(r_val) / 100.0)
@@ -45,12 +162,59 @@ def corrected_va_disability_table_method(ratings: List[float]) -> int:
     for r_int in valid_ratings_int[1:]:
         if combined_val >= 100: 
             combined_val = 100 
+            if SCORING_STATS.enabled: SCORING_STATS.counters['early_exits_100'] += 1
             break 
         precise_addition = (100.0 - combined_val) * (float(r_int) / 100.0)
         combined_val = int(combined_val + precise_addition + 0.5) 
             
     return int(combined_val + 0.5)
 
+@functools.lru_cache(maxsize=None)
+def combined_ratings_table() -> array:
+    """
+    The 101x101 Combined Ratings Table, built once per process as a flat array of bytes.
+    Entry [c * 101 + r] is one step of corrected_va_disability_table_method: running value c combined with rating r.
+    """
+    table = array('B', bytes(101 * 101))
+    for c in range(101):
+        for r in range(101):
+            table[c * 101 + r] = 100 if c >= 100 else int(float(c) + (100.0 - c) * (float(r) / 100.0) + 0.5)
+    return table
+
+def va_disability_table_lookup(ratings: List[float]) -> int:
+    """
+    Same result as corrected_va_disability_table_method, with each step read from the Combined Ratings Table.
+    Inputs are rounded to integers first, as the reference does; anything above 100 falls back to the reference.
+    """
+    valid_ratings_int = sorted([int(float(r) + 0.5) for r in ratings if float(r) > 0], reverse=True)
+    if not valid_ratings_int:
+        return 0
+    if valid_ratings_int[0] > 100:
+        return corrected_va_disability_table_method(ratings)
+
+    table = combined_ratings_table()
+    combined_val = valid_ratings_int[0]
+    for r_int in valid_ratings_int[1:]:
+        if combined_val == 100:
+            if SCORING_STATS.enabled: SCORING_STATS.counters['early_exits_100'] += 1
+            break
+        combined_val = table[combined_val * 101 + r_int]
+    return combined_val
+
+def verify_combined_ratings_table(random_samples: int = 10000, max_ratings: int = 12, seed: int = 0) -> List[List[int]]:
+    """
+    Compares va_disability_table_lookup against corrected_va_disability_table_method on every
+    pair of integer ratings and on random multisets. Returns the inputs where they disagree.
+    """
+    disagreements = [[a, b] for a in range(101) for b in range(101)
+                     if va_disability_table_lookup([a, b]) != corrected_va_disability_table_method([a, b])]
+    rng = random.Random(seed)
+    for _ in range(random_samples):
+        ratings = [rng.randint(0, 100) for _ in range(rng.randint(1, max_ratings))]
+        if va_disability_table_lookup(ratings) != corrected_va_disability_table_method(ratings):
+            disagreements.append(ratings)
+    return disagreements
+
 def round_to_va_award(n: float) -> int:
     """Rounds the combined rating to the nearest 10% for the final award."""
     n_rounded_to_integer = int(n + 0.5) 
@@ -60,17 +224,1674 @@ def round_to_va_award(n: float) -> int:
     else:
         return (n_rounded_to_integer // 10) * 10
 
+# --- Claim grouping and bilateral factor (38 CFR § 4.26) ---
+class ClaimRatings(NamedTuple):
+    """A claim's positive ratings split into the general list and the four extremity lists."""
+    general: List[float]
+    upper_left: List[float]
+    upper_right: List[float]
+    lower_left: List[float]
+    lower_right: List[float]
+
+class BilateralResult(NamedTuple):
+    """Outcome of combining one extremity group (upper or lower) for the bilateral factor."""
+    rounded: int
+    factor: float
+    base: float
+    unrounded: float
+    is_bilateral: bool
+
+    @property
+    def applied(self) -> bool:
+        """True when the group is replaced by its single bilateral value in the final list."""
+        return self.is_bilateral and self.factor > 0
+
+class ClaimScore(NamedTuple):
+    """Final numbers for one claim under all three methods shown by the GUI."""
+    combined_bva: float
+    award_bva: int
+    combined_table: float
+    award_table: int
+    combined_no_bilateral: Optional[float]
+    award_no_bilateral: Optional[int]
+    upper_bva: BilateralResult
+    lower_bva: BilateralResult
+    upper_table: BilateralResult
+    lower_table: BilateralResult
+
+# Small integer codes for where a rating applies.
+SIDE_NONE, SIDE_LEFT, SIDE_RIGHT = 0, 1, 2
+EXTREMITY_NONE, EXTREMITY_UPPER, EXTREMITY_LOWER = 0, 1, 2
+SIDE_CODES = {None: SIDE_NONE, 'L': SIDE_LEFT, 'R': SIDE_RIGHT}
+EXTREMITY_CODES = {None: EXTREMITY_NONE, 'Upper': EXTREMITY_UPPER, 'Lower': EXTREMITY_LOWER}
+# ClaimRatings field index by extremity * 3 + side; -1 marks an extremity without a side, which is never combined.
+_GROUP_BY_CODES = (0, 0, 0, -1, 1, 2, -1, 3, 4)
+# (extremity, side) codes of each ClaimRatings field, in field order.
+_CODES_BY_GROUP = ((EXTREMITY_NONE, SIDE_NONE), (EXTREMITY_UPPER, SIDE_LEFT), (EXTREMITY_UPPER, SIDE_RIGHT),
+                   (EXTREMITY_LOWER, SIDE_LEFT), (EXTREMITY_LOWER, SIDE_RIGHT))
+_CODE_BYTES = bytes((0, 1, 2))  # every valid side and extremity code, as int8 bytes
+_BODY_PART_BY_CODES = {(EXTREMITY_UPPER, SIDE_LEFT): 'Left Arm', (EXTREMITY_UPPER, SIDE_RIGHT): 'Right Arm',
+                       (EXTREMITY_LOWER, SIDE_LEFT): 'Left Leg', (EXTREMITY_LOWER, SIDE_RIGHT): 'Right Leg'}
+
+class Disability:
+    """One entered rating, with its side and extremity type as small integer codes."""
+    __slots__ = ('rating', 'side', 'extremity')
+
+    def __init__(self, rating: float, side: int = SIDE_NONE, extremity: int = EXTREMITY_NONE):
+        self.rating = rating
+        self.side = side
+        self.extremity = extremity
+
+    @classmethod
+    def from_labels(cls, rating: float, side: Optional[str], extremity_type: Optional[str]) -> "Disability":
+        """From the GUI's labels: side 'L'/'R'/None and extremity type 'Upper'/'Lower'/None."""
+        return cls(rating, SIDE_CODES.get(side, SIDE_NONE), EXTREMITY_CODES.get(extremity_type, EXTREMITY_NONE))
+
+    @classmethod
+    def from_dict(cls, disc: Dict[str, Any]) -> "Disability":
+        return cls.from_labels(disc['rating'], disc.get('side'), disc.get('extremity_type'))
+
+    @property
+    def group(self) -> Optional[int]:
+        """The ClaimRatings field this rating is combined in, or None if it never is."""
+        group = _GROUP_BY_CODES[self.extremity * 3 + self.side]
+        return group if group >= 0 else None
+
+    @property
+    def body_part(self) -> str:
+        return 'General' if self.extremity == EXTREMITY_NONE else _BODY_PART_BY_CODES.get((self.extremity, self.side), 'Extremity')
+
+    def __repr__(self) -> str:
+        return f"Disability({self.rating!r}, side={self.side}, extremity={self.extremity})"
+
+def group_disabilities(disabilities: Sequence[Union[Disability, Dict[str, Any]]]) -> ClaimRatings:
+    """Splits disability entries (Disability records or GUI-style dicts) into general and extremity rating lists (zero ratings dropped)."""
+    claim = ClaimRatings([], [], [], [], [])
+    for disc in disabilities:
+        if not isinstance(disc, Disability):
+            disc = Disability.from_dict(disc)
+        rating = float(disc.rating)
+        group = disc.group
+        if rating > 0 and group is not None:
+            claim[group].append(rating)
+    return claim
+
+class ClaimColumns:
+    """
+    Many claims stored column-wise: every entry's rating (float64), side code and extremity
+    code (int8) in parallel arrays, plus one offset per claim. That is 10 bytes per rating
+    and 8 per claim, with no per-claim Python objects. Indexing yields ClaimRatings, so it
+    works anywhere a sequence of claims does; score_claims_batch reads the arrays directly.
+    """
+    __slots__ = ('ratings', 'sides', 'extremities', 'offsets')
+
+    def __init__(self):
+        self.ratings = array('d')
+        self.sides = array('b')
+        self.extremities = array('b')
+        self.offsets = array('q', [0])
+
+    @classmethod
+    def from_claims(cls, claims: Iterable[ClaimRatings]) -> "ClaimColumns":
+        columns = cls()
+        for claim in claims:
+            columns.append_claim(claim)
+        return columns
+
+    def append_claim(self, claim: ClaimRatings):
+        for (extremity, side), ratings in zip(_CODES_BY_GROUP, claim):
+            if ratings:
+                self.ratings.extend(ratings)
+                self.sides.extend([side] * len(ratings))
+                self.extremities.extend([extremity] * len(ratings))
+        self.offsets.append(len(self.ratings))
+
+    def append(self, disabilities: Iterable[Disability]):
+        """Adds one claim made of these entries."""
+        for disc in disabilities:
+            self.ratings.append(disc.rating)
+            self.sides.append(disc.side)
+            self.extremities.append(disc.extremity)
+        self.offsets.append(len(self.ratings))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.itemsize * len(column) for column in (self.ratings, self.sides, self.extremities, self.offsets))
+
+    def _check(self, start: int, end: int):
+        """Raises ValueError if entries start..end are out of range or hold an unknown side or extremity code (a corrupt caseload)."""
+        if not 0 <= start <= end <= len(self.ratings):
+            raise ValueError("corrupt record offset")
+        # Deleting the valid code bytes leaves any unknown ones behind.
+        if self.sides[start:end].tobytes().translate(None, _CODE_BYTES) or self.extremities[start:end].tobytes().translate(None, _CODE_BYTES):
+            raise ValueError("unknown side or extremity code")
+
+    def _check_all(self):
+        """_check over every claim at once: offsets must never decrease, and all codes must be known."""
+        self._check(self.offsets[0], self.offsets[-1])
+        if not all(map(operator.le, self.offsets, itertools.islice(self.offsets, 1, None))):
+            raise ValueError("corrupt record offset")
+
+    def _groups(self, index: int, checked: bool = False) -> List[List[float]]:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        if not checked:
+            self._check(start, end)
+        groups: List[List[float]] = [[], [], [], [], []]
+        for rating, side, extremity in zip(self.ratings[start:end], self.sides[start:end], self.extremities[start:end]):
+            group = _GROUP_BY_CODES[extremity * 3 + side]
+            if group >= 0:
+                groups[group].append(rating)
+        return groups
+
+    def __getitem__(self, index: int) -> ClaimRatings:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("claim index out of range")
+        return ClaimRatings(*self._groups(index))
+
+    def __iter__(self) -> Iterator[ClaimRatings]:
+        for index in range(len(self)):
+            yield ClaimRatings(*self._groups(index))
+
+    def disabilities(self, index: int) -> List[Disability]:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return [Disability(*entry) for entry in zip(self.ratings[start:end], self.sides[start:end], self.extremities[start:end])]
+
+    def canonical_keys(self) -> List[tuple]:
+        """ClaimScoreCache.canonical_key of every claim, read straight from the columns."""
+        self._check_all()
+        keys = []
+        for index in range(len(self)):
+            keys.append(tuple(tuple(sorted(rating for rating in group if rating > 0)) for group in self._groups(index, checked=True)))
+        return keys
+
+    def take(self, indices: Iterable[int]) -> "ClaimColumns":
+        """A new ClaimColumns holding just these claims, in this order."""
+        subset = ClaimColumns()
+        offsets = self.offsets
+        for index in indices:
+            start, end = offsets[index], offsets[index + 1]
+            subset.ratings.extend(self.ratings[start:end])
+            subset.sides.extend(self.sides[start:end])
+            subset.extremities.extend(self.extremities[start:end])
+            subset.offsets.append(len(subset.ratings))
+        return subset
+
+    def padded_groups(self) -> List["np.ndarray"]:
+        """The five zero-padded (claims x ratings) matrices score_claims_batch works on, built without a per-claim loop."""
+        count = len(self)
+        ratings = np.array(self.ratings, dtype=float)
+        sides, extremities = np.array(self.sides, dtype=np.intp), np.array(self.extremities, dtype=np.intp)
+        if ((sides < 0) | (sides > 2) | (extremities < 0) | (extremities > 2)).any():
+            raise ValueError("unknown side or extremity code")
+        groups = np.array(_GROUP_BY_CODES, dtype=np.int8)[extremities * 3 + sides]
+        owners = np.repeat(np.arange(count), np.diff(np.array(self.offsets, dtype=np.intp)))
+        matrices = []
+        for group in range(5):
+            selected = groups == group
+            claim_ids = owners[selected]
+            lengths = np.bincount(claim_ids, minlength=count)
+            matrix = np.zeros((count, max(int(lengths.max(initial=0)), 1)))
+            if len(claim_ids):
+                columns = np.arange(len(claim_ids)) - (np.cumsum(lengths) - lengths)[claim_ids]
+                matrix[claim_ids, columns] = ratings[selected]
+            matrices.append(matrix)
+        return matrices
+
+def process_bilateral_bva(left_ratings: List[float], right_ratings: List[float]) -> BilateralResult:
+    is_truly_bilateral = bool(left_ratings and right_ratings) # Bilateral factor ONLY if ratings on BOTH sides
+
+    all_limb_ratings_for_base_calc = left_ratings + right_ratings
+    base_combined_precise = float(corrected_va_disability_precise(all_limb_ratings_for_base_calc))
+
+    factor_precise = 0.0
+    value_with_factor_unrounded = base_combined_precise # Start with base
+
+    if is_truly_bilateral and base_combined_precise > 0:
+        factor_precise = round(base_combined_precise * 0.1, 4)
+        value_with_factor_unrounded = base_combined_precise + factor_precise
+
+    rounded_value_int = int(value_with_factor_unrounded + 0.5)
+    return BilateralResult(rounded_value_int, factor_precise, base_combined_precise, value_with_factor_unrounded, is_truly_bilateral)
+
+def process_bilateral_table(left_ratings: List[float], right_ratings: List[float]) -> BilateralResult:
+    is_truly_bilateral = bool(left_ratings and right_ratings)
+
+    all_limb_ratings_for_base_calc = left_ratings + right_ratings
+    base_combined_int = va_disability_table_lookup(all_limb_ratings_for_base_calc)
+
+    factor_precise = 0.0
+    value_with_factor_unrounded = float(base_combined_int)
+
+    if is_truly_bilateral and base_combined_int > 0:
+        factor_precise = round(float(base_combined_int) * 0.1, 4)
+        value_with_factor_unrounded = float(base_combined_int) + factor_precise
+
+    rounded_value_int = int(value_with_factor_unrounded + 0.5)
+    return BilateralResult(rounded_value_int, factor_precise, float(base_combined_int), value_with_factor_unrounded, is_truly_bilateral)
+
+# --- Headless scoring ---
+def final_values_bva(bilateral: BilateralResult, left: List[float], right: List[float]) -> List[float]:
+    """What one extremity group contributes to the BVA final combination list."""
+    if bilateral.applied:
+        return [float(bilateral.rounded)] if bilateral.rounded > 0 else []
+    return left + right
+
+def final_values_table(bilateral: BilateralResult, left: List[float], right: List[float]) -> List[float]:
+    """What one extremity group contributes to the table-method final combination list (inputs rounded)."""
+    if bilateral.applied:
+        return [float(bilateral.rounded)] if bilateral.rounded > 0 else []
+    return [float(int(r + 0.5)) for r in left + right]
+
+def score_claim(claim: ClaimRatings) -> ClaimScore:
+    """
+    Scores one claim exactly as VADisabilityCalculatorApp.calculate_total_disability does.
+    This is the reference path; score_claims_batch must agree with it claim for claim.
+    """
+    stats = SCORING_STATS if SCORING_STATS.enabled else None
+    if stats is not None:
+        start = time.perf_counter_ns()
+    claim = ClaimRatings(*([float(r) for r in group if float(r) > 0] for group in claim))
+    if stats is not None:
+        stats.record('group', start)
+        start = time.perf_counter_ns()
+    upper_bva = process_bilateral_bva(claim.upper_left, claim.upper_right)
+    lower_bva = process_bilateral_bva(claim.lower_left, claim.lower_right)
+    upper_tbl = process_bilateral_table(claim.upper_left, claim.upper_right)
+    lower_tbl = process_bilateral_table(claim.lower_left, claim.lower_right)
+    if stats is None:
+        return combine_claim(claim, upper_bva, lower_bva, upper_tbl, lower_tbl)
+    stats.record('bilateral', start)
+    start = time.perf_counter_ns()
+    score = combine_claim(claim, upper_bva, lower_bva, upper_tbl, lower_tbl)
+    stats.record('combine', start)
+    stats.counters['claims_scored'] += 1
+    stats.counters['bilateral_claims'] += upper_bva.is_bilateral or lower_bva.is_bilateral
+    return score
+
+def combine_claim(claim: ClaimRatings, upper_bva: BilateralResult, lower_bva: BilateralResult,
+                  upper_tbl: BilateralResult, lower_tbl: BilateralResult) -> ClaimScore:
+    """The final-combination half of score_claim, for a claim of positive ratings whose bilateral groups are already processed."""
+    general, upper_l, upper_r, lower_l, lower_r = claim
+
+    final_bva = final_values_bva(upper_bva, upper_l, upper_r) + final_values_bva(lower_bva, lower_l, lower_r)
+    combined_bva = float(corrected_va_disability_precise(final_bva + general))
+
+    final_table = final_values_table(upper_tbl, upper_l, upper_r) + final_values_table(lower_tbl, lower_l, lower_r)
+    combined_table = float(va_disability_table_lookup(final_table + general))
+
+    combined_no_bilateral, award_no_bilateral = None, None
+    all_ratings = upper_l + upper_r + lower_l + lower_r + general
+    if all_ratings:
+        combined_no_bilateral = float(corrected_va_disability_precise(all_ratings))
+        award_no_bilateral = round_to_va_award(combined_no_bilateral)
+
+    return ClaimScore(combined_bva, round_to_va_award(combined_bva),
+                      combined_table, round_to_va_award(combined_table),
+                      combined_no_bilateral, award_no_bilateral,
+                      upper_bva, lower_bva, upper_tbl, lower_tbl)
+
+def _pad_rows(rows: Sequence[Sequence[float]]) -> "np.ndarray":
+    """Packs ragged rating lists into a zero-padded (claims x ratings) matrix without a per-row loop."""
+    lengths = np.array(list(map(len, rows)), dtype=np.intp)
+    total = int(lengths.sum())
+    matrix = np.zeros((len(rows), max(int(lengths.max(initial=0)), 1)))
+    if total:
+        starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        columns = np.arange(total) - starts
+        matrix[np.repeat(np.arange(len(rows)), lengths), columns] = np.fromiter(
+            itertools.chain.from_iterable(rows), dtype=float, count=total)
+    return matrix
+
+def _round4_rows(values: "np.ndarray") -> "np.ndarray":
+    """Row-wise round(x, 4), bit-identical to Python's correctly rounded round()."""
+    scaled = values * 10000.0
+    rounded = np.rint(scaled) / 10000.0
+    # rint() only picks the wrong last digit next to a .5 tie; those few go through round() itself.
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(v, 4) for v in values[near_tie].tolist()]
+    return rounded
+
+def _precise_rows(matrix: "np.ndarray") -> "np.ndarray":
+    """Row-wise corrected_va_disability_precise; ratings <= 0 are treated as absent."""
+    ordered = -np.sort(-matrix, axis=1)
+    combined = ordered[:, 0].copy()
+    exited = np.zeros(len(ordered), dtype=bool) if SCORING_STATS.enabled else None
+    for column in ordered[:, 1:].T:
+        active = column > 0
+        if exited is not None:
+            exited |= active & (combined >= 100)
+        stepped = combined + (100.0 - combined) * (column / 100.0)
+        combined = np.where(active & (combined >= 100), 100.0, np.where(active, stepped, combined))
+    if exited is not None:
+        SCORING_STATS.counters['early_exits_100'] += int(np.count_nonzero(exited))
+    return _round4_rows(np.where(ordered[:, 0] > 0, combined, 0.0))
+
+def _table_rows(matrix: "np.ndarray") -> "np.ndarray":
+    """Row-wise va_disability_table_lookup; ratings <= 0 are treated as absent."""
+    # Inputs that round to 0 still take part in the loop, so absent slots are marked with -1.
+    ordered = -np.sort(-np.where(matrix > 0, np.floor(matrix + 0.5), -1.0), axis=1).astype(np.intp)
+    table = np.frombuffer(combined_ratings_table(), dtype=np.uint8).reshape(101, 101)
+    combined = np.clip(ordered[:, 0], 0, 100)
+    exited = np.zeros(len(ordered), dtype=bool) if SCORING_STATS.enabled else None
+    for column in ordered[:, 1:].T:
+        if exited is not None:
+            exited |= (column >= 0) & (combined >= 100)
+        combined = np.where(column >= 0, table[combined, np.clip(column, 0, 100)], combined)
+    if exited is not None:
+        SCORING_STATS.counters['early_exits_100'] += int(np.count_nonzero(exited))
+    # A leading value above 100 (e.g. a 110 bilateral replacement) caps to 100 as soon as anything follows it.
+    oversized = ordered[:, 0] > 100
+    if oversized.any():
+        followed = ordered[:, 1] >= 0 if ordered.shape[1] > 1 else np.zeros_like(oversized)
+        combined = np.where(oversized, np.where(followed, 100, ordered[:, 0]), combined)
+    return combined.astype(float)
+
+def _award_rows(combined: "np.ndarray") -> "np.ndarray":
+    """Row-wise round_to_va_award."""
+    rounded = np.floor(combined + 0.5).astype(np.int64)
+    return (rounded // 10 + (rounded % 10 >= 5)) * 10
+
+def _bilateral_rows(left: "np.ndarray", right: "np.ndarray", base: "np.ndarray"):
+    """Row-wise factor step shared by process_bilateral_bva and process_bilateral_table."""
+    is_bilateral = (left > 0).any(axis=1) & (right > 0).any(axis=1)
+    wants_factor = is_bilateral & (base > 0)
+    factor = np.zeros_like(base)
+    factor[wants_factor] = _round4_rows(base[wants_factor] * 0.1)
+    unrounded = base + factor
+    rounded = np.floor(unrounded + 0.5).astype(np.int64)
+    return rounded, factor, unrounded, is_bilateral, is_bilateral & (factor > 0)
+
+def _bilateral_results(rounded, factor, base, unrounded, is_bilateral) -> List[BilateralResult]:
+    return [BilateralResult(*row) for row in zip(rounded.tolist(), factor.tolist(), base.tolist(),
+                                                  unrounded.tolist(), is_bilateral.tolist())]
+
+def score_claims_batch(claims: Union[Sequence[ClaimRatings], ClaimColumns]) -> List[ClaimScore]:
+    """
+    Scores many claims at once. With NumPy available every method runs as column-wise
+    passes over padded rating matrices (built straight from the arrays of a ClaimColumns);
+    without it each claim goes through score_claim. Results are identical either way.
+    """
+    if np is None or not claims:
+        return [score_claim(claim) for claim in claims]
+
+    stats = SCORING_STATS if SCORING_STATS.enabled else None
+    if stats is not None:
+        start = time.perf_counter_ns()
+    if isinstance(claims, ClaimColumns):
+        general, upper_l, upper_r, lower_l, lower_r = claims.padded_groups()
+    else:
+        general, upper_l, upper_r, lower_l, lower_r = (_pad_rows(group) for group in zip(*claims))
+    if stats is not None:
+        stats.record('group', start, len(claims))
+        start = time.perf_counter_ns()
+    groups = {}
+    for name, left, right in (("upper", upper_l, upper_r), ("lower", lower_l, lower_r)):
+        limbs = np.hstack([left, right])
+        base_bva = _precise_rows(limbs)
+        base_tbl = _table_rows(limbs)
+        groups[name] = (left, right, base_bva, _bilateral_rows(left, right, base_bva),
+                        base_tbl, _bilateral_rows(left, right, base_tbl))
+    if stats is not None:
+        stats.record('bilateral', start, len(claims))
+        start = time.perf_counter_ns()
+
+    bva_columns, table_columns = [general], [general]
+    for left, right, _, bva, _, tbl in groups.values():
+        rounded, _, _, _, applied = bva
+        bva_columns += [np.where(applied & (rounded > 0), rounded, 0.0)[:, None],
+                        np.where(applied[:, None], 0.0, left), np.where(applied[:, None], 0.0, right)]
+        rounded, _, _, _, applied = tbl
+        individual = np.where(applied[:, None], 0.0, np.floor(np.hstack([left, right]) + 0.5))
+        table_columns += [np.where(applied & (rounded > 0), rounded, 0.0)[:, None], individual]
+
+    combined_bva = _precise_rows(np.hstack(bva_columns))
+    combined_table = _table_rows(np.hstack(table_columns))
+    everything = np.hstack([general, upper_l, upper_r, lower_l, lower_r])
+    has_ratings = (everything > 0).any(axis=1).tolist()
+    combined_no_bilateral = _precise_rows(everything)
+
+    bilateral = {}
+    for name, (_, _, base_bva, bva, base_tbl, tbl) in groups.items():
+        bilateral[name + "_bva"] = _bilateral_results(bva[0], bva[1], base_bva, bva[2], bva[3])
+        bilateral[name + "_table"] = _bilateral_results(tbl[0], tbl[1], base_tbl, tbl[2], tbl[3])
+
+    no_bilateral = [(c, a) if has else (None, None) for c, a, has in zip(
+        combined_no_bilateral.tolist(), _award_rows(combined_no_bilateral).tolist(), has_ratings)]
+    scores = [ClaimScore(*row[:4], *row[4], *row[5:]) for row in zip(
+        combined_bva.tolist(), _award_rows(combined_bva).tolist(),
+        combined_table.tolist(), _award_rows(combined_table).tolist(), no_bilateral,
+        bilateral["upper_bva"], bilateral["lower_bva"], bilateral["upper_table"], bilateral["lower_table"])]
+    if stats is not None:
+        stats.record('combine', start, len(claims))
+        stats.counters['claims_scored'] += len(claims)
+        stats.counters['bilateral_claims'] += int(np.count_nonzero(groups["upper"][3][3] | groups["lower"][3][3]))
+    return scores
+
+# --- Exact arithmetic ---
+# The float methods above round with round(x, 4), whose .5 ties depend on binary representation, and with
+# int(x + 0.5). The exact kernel does the same steps on exact decimal values, rounding every .5 up.
+# Combined ratings are kept as integers in units of EXACT_SCALE (ten-thousandths of a percent).
+EXACT_SCALE = 10000
+_EXACT_HALF = EXACT_SCALE // 2
+_EXACT_INT64_MAX_RATINGS = 9  # 2 * 100**9 still fits in an int64
+
+class ExactClaimScore(NamedTuple):
+    """score_claim's combined ratings and awards, computed with exact arithmetic."""
+    combined_bva: Decimal
+    award_bva: int
+    combined_table: Decimal
+    award_table: int
+    combined_no_bilateral: Optional[Decimal]
+    award_no_bilateral: Optional[int]
+
+def _exact_rating(rating: float) -> Fraction:
+    """The decimal value a rating was written as (33.3 is 333/10, not the nearest binary double)."""
+    return Fraction(repr(float(rating)))
+
+def _half_up(value: Fraction) -> int:
+    return (2 * value.numerator + value.denominator) // (2 * value.denominator)
+
+def exact_precise_units(ratings: Iterable[Any]) -> int:
+    """corrected_va_disability_precise in EXACT_SCALE units, rounded half up."""
+    values = sorted((value for value in map(_exact_rating, ratings) if value > 0), reverse=True)
+    if not values:
+        return 0
+    if values[0] >= 100:
+        return 100 * EXACT_SCALE if len(values) > 1 else _half_up(values[0] * EXACT_SCALE)
+    remaining = Fraction(1)
+    for value in values:
+        remaining *= 1 - value / 100
+    return _half_up((100 - 100 * remaining) * EXACT_SCALE)
+
+def exact_table_method(ratings: Iterable[Any]) -> int:
+    """corrected_va_disability_table_method with every step rounded half up in integer arithmetic."""
+    values = sorted((_half_up(value) for value in map(_exact_rating, ratings) if value > 0), reverse=True)
+    if not values:
+        return 0
+    combined = values[0]
+    for value in values[1:]:
+        if combined >= 100:
+            return 100
+        combined = (100 * combined + (100 - combined) * value + 50) // 100
+    return combined
+
+def exact_award(units: int) -> int:
+    """round_to_va_award for a combined rating in EXACT_SCALE units."""
+    return ((units + _EXACT_HALF) // EXACT_SCALE + 5) // 10 * 10
+
+def _exact_bilateral(left: List[float], right: List[float], base: int) -> Tuple[int, bool]:
+    """The factor step of process_bilateral_*: (rounded value, applied) for a base in EXACT_SCALE units."""
+    factor = (base + 5) // 10 if left and right and base > 0 else 0
+    return (base + factor + _EXACT_HALF) // EXACT_SCALE, factor > 0
+
+def _exact_decimal(units: int) -> Decimal:
+    return Decimal(units).scaleb(-4)
+
+def score_claim_exact(claim: ClaimRatings) -> ExactClaimScore:
+    """score_claim with exact arithmetic; the result never depends on floating-point rounding."""
+    claim = ClaimRatings(*([r for r in group if float(r) > 0] for group in claim))
+    general, upper_l, upper_r, lower_l, lower_r = claim
+    final_bva, final_table = list(general), list(general)
+    for left, right in ((upper_l, upper_r), (lower_l, lower_r)):
+        rounded, applied = _exact_bilateral(left, right, exact_precise_units(left + right))
+        final_bva += ([rounded] if rounded > 0 else []) if applied else left + right
+        rounded, applied = _exact_bilateral(left, right, exact_table_method(left + right) * EXACT_SCALE)
+        # As in final_values_table, unbilateral extremity ratings are rounded before the final combination.
+        final_table += ([rounded] if rounded > 0 else []) if applied else [_half_up(_exact_rating(r)) for r in left + right]
+
+    combined_bva = exact_precise_units(final_bva)
+    combined_table = exact_table_method(final_table) * EXACT_SCALE
+    combined_no_bilateral, award_no_bilateral = None, None
+    if any(claim):
+        units = exact_precise_units(itertools.chain(*claim))
+        combined_no_bilateral, award_no_bilateral = _exact_decimal(units), exact_award(units)
+    return ExactClaimScore(_exact_decimal(combined_bva), exact_award(combined_bva),
+                           _exact_decimal(combined_table), exact_award(combined_table),
+                           combined_no_bilateral, award_no_bilateral)
+
+def _exact_precise_rows(matrix: "np.ndarray") -> "np.ndarray":
+    """Row-wise exact_precise_units for int64 ratings (0 = absent), at most _EXACT_INT64_MAX_RATINGS per row."""
+    ordered = -np.sort(-matrix, axis=1)
+    count = (ordered > 0).sum(axis=1)
+    remaining = np.where(ordered > 0, 100 - ordered, 1).prod(axis=1)
+    # 100 * remaining / 100**count, in EXACT_SCALE units, is remaining / 100**(count - 3); round half up.
+    numerator = remaining * 100 ** np.clip(3 - count, 0, None)
+    denominator = 100 ** np.clip(count - 3, 0, None)
+    combined = 100 * EXACT_SCALE + (denominator - 2 * numerator) // (2 * denominator)
+    leading = ordered[:, 0]
+    combined = np.where(leading >= 100, np.where(count > 1, 100, leading) * EXACT_SCALE, combined)
+    return np.where(count > 0, combined, 0)
+
+def _exact_table_rows(matrix: "np.ndarray") -> "np.ndarray":
+    """Row-wise exact_table_method for int64 ratings (0 = absent)."""
+    ordered = -np.sort(-matrix, axis=1)
+    combined = ordered[:, 0]
+    for column in ordered[:, 1:].T:
+        stepped = np.where(combined >= 100, 100, (100 * combined + (100 - combined) * column + 50) // 100)
+        combined = np.where(column > 0, stepped, combined)
+    return combined
+
+def _exact_award_rows(units: "np.ndarray") -> "np.ndarray":
+    return ((units + _EXACT_HALF) // EXACT_SCALE + 5) // 10 * 10
+
+def _exact_bilateral_rows(left: "np.ndarray", right: "np.ndarray", base: "np.ndarray"):
+    factor = np.where((left > 0).any(axis=1) & (right > 0).any(axis=1) & (base > 0), (base + 5) // 10, 0)
+    return (base + factor + _EXACT_HALF) // EXACT_SCALE, factor > 0
+
+def score_claims_exact_batch(claims: Sequence[ClaimRatings]) -> List[ExactClaimScore]:
+    """
+    score_claim_exact over many claims. With NumPy available, claims whose ratings are all whole
+    numbers and number at most nine run as int64 column passes; the rest take the scalar path.
+    """
+    if np is None or not claims:
+        return [score_claim_exact(claim) for claim in claims]
+
+    matrices = [_pad_rows(group) for group in zip(*claims)]
+    everything = np.hstack(matrices)
+    eligible = ((everything == np.floor(everything)).all(axis=1)
+                & ((everything > 0).sum(axis=1) <= _EXACT_INT64_MAX_RATINGS))
+    results: List[Optional[ExactClaimScore]] = [None] * len(claims)
+    for position in np.flatnonzero(~eligible).tolist():
+        results[position] = score_claim_exact(claims[position])
+    if not eligible.any():
+        return results
+
+    general, upper_l, upper_r, lower_l, lower_r = (m[eligible].astype(np.int64) for m in matrices)
+    bva_columns, table_columns = [general], [general]
+    for left, right in ((upper_l, upper_r), (lower_l, lower_r)):
+        limbs = np.hstack([left, right])
+        rounded, applied = _exact_bilateral_rows(left, right, _exact_precise_rows(limbs))
+        bva_columns += [np.where(applied, rounded, 0)[:, None], np.where(applied[:, None], 0, limbs)]
+        rounded, applied = _exact_bilateral_rows(left, right, _exact_table_rows(limbs) * EXACT_SCALE)
+        table_columns += [np.where(applied, rounded, 0)[:, None], np.where(applied[:, None], 0, limbs)]
+
+    combined_bva = _exact_precise_rows(np.hstack(bva_columns))
+    combined_table = _exact_table_rows(np.hstack(table_columns)) * EXACT_SCALE
+    combined_no_bilateral = _exact_precise_rows(np.hstack([general, upper_l, upper_r, lower_l, lower_r]))
+    has_ratings = (everything[eligible] > 0).any(axis=1).tolist()
+
+    rows = zip(combined_bva.tolist(), _exact_award_rows(combined_bva).tolist(),
+               combined_table.tolist(), _exact_award_rows(combined_table).tolist(),
+               combined_no_bilateral.tolist(), _exact_award_rows(combined_no_bilateral).tolist(), has_ratings)
+    for position, (bva, award_bva, table, award_table, none, award_none, has) in zip(np.flatnonzero(eligible).tolist(), rows):
+        results[position] = ExactClaimScore(_exact_decimal(bva), award_bva, _exact_decimal(table), award_table,
+                                            _exact_decimal(none) if has else None, award_none if has else None)
+    return results
+
+def exact_award_differences(claims: Sequence[ClaimRatings]) -> List[Tuple[int, str, ClaimScore, ExactClaimScore]]:
+    """
+    Checker mode: scores claims on the float path and the exact path and returns
+    (index, method, float score, exact score) for every award they disagree on.
+    Methods are 'bva', 'table' and 'no_bilateral'.
+    """
+    differences = []
+    for index, (score, exact) in enumerate(zip(score_claims_batch(claims), score_claims_exact_batch(claims))):
+        for method in ('bva', 'table', 'no_bilateral'):
+            if getattr(score, 'award_' + method) != getattr(exact, 'award_' + method):
+                differences.append((index, method, score, exact))
+    return differences
+
+# --- Result cache ---
+class ClaimScoreCache:
+    """
+    Bounded LRU cache of ClaimScore values, keyed by a claim's canonical form: every rating
+    list sorted, zero ratings dropped. Entry order and left/right placement within a list
+    never change a score, so claims that differ only in that way share one entry. The GUI
+    scores on a background thread, so every change to the entries is made under a lock.
+    """
+    def __init__(self, maxsize: int = 65536):
+        self.maxsize = maxsize
+        self._entries: "collections.OrderedDict[tuple, ClaimScore]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def canonical_key(claim: ClaimRatings) -> tuple:
+        key = []
+        for group in claim:
+            ordered = sorted(group)
+            if ordered and ordered[0] <= 0:
+                ordered = ordered[bisect.bisect_right(ordered, 0):]
+            key.append(tuple(ordered))
+        return tuple(key)
+
+    def lookup(self, key: tuple) -> Optional[ClaimScore]:
+        with self._lock:
+            score = self._entries.get(key)
+            if score is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return score
+
+    def store(self, key: tuple, score: ClaimScore):
+        with self._lock:
+            self._entries[key] = score
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def score(self, claim: ClaimRatings) -> ClaimScore:
+        """score_claim, answered from the cache when this rating set has been seen before."""
+        if self.maxsize <= 0:
+            return score_claim(claim)
+        key = self.canonical_key(claim)
+        score = self.lookup(key)
+        if score is None:
+            score = score_claim(claim)
+            self.store(key, score)
+        return score
+
+    def score_batch(self, claims: Union[Sequence[ClaimRatings], ClaimColumns]) -> List[ClaimScore]:
+        """score_claims_batch over only the distinct rating sets the cache has not seen."""
+        if self.maxsize <= 0:
+            return score_claims_batch(claims)
+        columnar = isinstance(claims, ClaimColumns)
+        keys = claims.canonical_keys() if columnar else [self.canonical_key(claim) for claim in claims]
+        found: Dict[tuple, ClaimScore] = {}
+        missing: Dict[tuple, int] = {}
+        entries = self._entries
+        with self._lock:
+            for index, key in enumerate(keys):
+                if key in found or key in missing:
+                    self.hits += 1
+                elif key in entries:
+                    self.hits += 1
+                    entries.move_to_end(key)
+                    found[key] = entries[key]
+                else:
+                    self.misses += 1
+                    missing[key] = index
+        subset = claims.take(missing.values()) if columnar else [claims[index] for index in missing.values()]
+        for key, score in zip(missing, score_claims_batch(subset)):
+            found[key] = score
+            self.store(key, score)
+        return [found[key] for key in keys]
+
+    def resize(self, maxsize: int):
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'size': len(self._entries), 'maxsize': self.maxsize}
+
+# Shared by the GUI and the batch paths (each worker process has its own copy).
+CLAIM_SCORE_CACHE = ClaimScoreCache()
+
+# --- Incremental claim state ---
+class IncrementalClaim:
+    """
+    A claim kept in canonical form while single entries are added, edited or removed. Each rating
+    group stays sorted (bisect), the upper/lower bilateral results are redone only when their own
+    group changes, and the score is recomputed only after a change.
+    """
+    GENERAL, UPPER_LEFT, UPPER_RIGHT, LOWER_LEFT, LOWER_RIGHT = range(5)
+
+    def __init__(self, cache: Optional[ClaimScoreCache] = None):
+        self.cache = CLAIM_SCORE_CACHE if cache is None else cache
+        self.clear()
+
+    def clear(self):
+        self._groups: List[List[float]] = [[] for _ in range(5)]
+        self._upper: Optional[Tuple[BilateralResult, BilateralResult]] = None
+        self._lower: Optional[Tuple[BilateralResult, BilateralResult]] = None
+        self._score: Optional[ClaimScore] = None
+
+    def copy(self) -> "IncrementalClaim":
+        other = IncrementalClaim(self.cache)
+        other._groups = [list(group) for group in self._groups]
+        other._upper, other._lower, other._score = self._upper, self._lower, self._score
+        return other
+
+    def adopt(self, scored: "IncrementalClaim"):
+        """
+        Takes over the bilateral results and score a copy computed (e.g. on a worker thread),
+        for whichever of them still match this claim's current groups.
+        """
+        if self._upper is None and scored._upper is not None and self._groups[1:3] == scored._groups[1:3]:
+            self._upper = scored._upper
+        if self._lower is None and scored._lower is not None and self._groups[3:5] == scored._groups[3:5]:
+            self._lower = scored._lower
+        if self._score is None and scored._score is not None and self._groups == scored._groups:
+            self._score = scored._score
+
+    def _changed(self, group: int):
+        self._score = None
+        if group in (self.UPPER_LEFT, self.UPPER_RIGHT): self._upper = None
+        elif group in (self.LOWER_LEFT, self.LOWER_RIGHT): self._lower = None
+
+    def add(self, group: Optional[int], rating: float):
+        if group is None or float(rating) <= 0: return
+        bisect.insort(self._groups[group], float(rating))
+        self._changed(group)
+
+    def remove(self, group: Optional[int], rating: float):
+        if group is None or float(rating) <= 0: return
+        ratings = self._groups[group]
+        index = bisect.bisect_left(ratings, float(rating))
+        if index < len(ratings) and ratings[index] == float(rating):
+            del ratings[index]
+            self._changed(group)
+
+    def replace(self, group: Optional[int], old_rating: float, new_rating: float):
+        self.remove(group, old_rating)
+        self.add(group, new_rating)
+
+    def claim(self) -> ClaimRatings:
+        return ClaimRatings(*(list(group) for group in self._groups))
+
+    def key(self) -> tuple:
+        """Same value as ClaimScoreCache.canonical_key(self.claim()), without re-sorting."""
+        return tuple(tuple(group) for group in self._groups)
+
+    def score(self) -> ClaimScore:
+        if self._score is None:
+            key = self.key()
+            score = self.cache.lookup(key) if self.cache.maxsize > 0 else None
+            if score is None:
+                groups = self._groups
+                if self._upper is None:
+                    self._upper = (process_bilateral_bva(groups[1], groups[2]), process_bilateral_table(groups[1], groups[2]))
+                if self._lower is None:
+                    self._lower = (process_bilateral_bva(groups[3], groups[4]), process_bilateral_table(groups[3], groups[4]))
+                score = combine_claim(self.claim(), self._upper[0], self._lower[0], self._upper[1], self._lower[1])
+                if self.cache.maxsize > 0: self.cache.store(key, score)
+            self._score = score
+        return self._score
+
+# --- Next-award sensitivity ---
+class AwardChange(NamedTuple):
+    """One way to reach the next 10% band: raise an existing rating, or add a new one."""
+    group: str                   # ClaimRatings field the rating is in (or would be added to)
+    old_rating: Optional[float]  # None for an added rating
+    new_rating: float
+    award: int
+
+class NextAwardReport(NamedTuple):
+    """For one method: the current award and the smallest changes that reach target_award."""
+    method: str                  # 'bva' or 'table'
+    award: int
+    target_award: Optional[int]  # None once the award is 100
+    raises: List[AwardChange]    # each distinct existing rating whose one-step raise reaches target_award
+    additions: List[AwardChange] # per group, the smallest new rating (a multiple of the step) that does
+
+class NextAwardThresholds(NamedTuple):
+    bva: NextAwardReport
+    table: NextAwardReport
+
+def _award_floor(award: int) -> float:
+    """Smallest combined value round_to_va_award lifts to award: n >= award - 5.5 (int(n + 0.5) reaches award - 5)."""
+    return award - 5.5
+
+def _multiset_difference(old: List[float], new: List[float]) -> Tuple[List[float], List[float]]:
+    removed, added = list(old), []
+    for value in new:
+        if value in removed: removed.remove(value)
+        else: added.append(value)
+    return removed, added
+
+class _PreciseModel:
+    """
+    The BVA final combination written as a product of remaining-ability factors, (1 - r/100).
+    General ratings keep prefix/suffix products so any one of them can be swapped in O(1);
+    each extremity group is a small block multiplied in whole.
+    """
+    # round(..., 4) and float order can move the sequential result by ~5e-5 from the product form.
+    BORDERLINE = 1e-3
+
+    def __init__(self, general: List[float], blocks: Dict[str, List[float]]):
+        self.general = sorted(general)
+        self.prefix = [1.0]
+        for r in self.general: self.prefix.append(self.prefix[-1] * (1 - r / 100.0))
+        self.suffix = [1.0]
+        for r in reversed(self.general): self.suffix.append(self.suffix[-1] * (1 - r / 100.0))
+        self.suffix.reverse()
+        self.blocks = {name: self._product(values) for name, values in blocks.items()}
+        self.block_sizes = {name: len(values) for name, values in blocks.items()}
+        self.block_max = {name: max(values, default=0.0) for name, values in blocks.items()}
+        self.block_max['general'] = self.general[-1] if self.general else 0.0
+        self.count = len(self.general) + sum(self.block_sizes.values())
+        # Product and largest value of everything outside each block, fixed for the whole search.
+        self.others = {name: self._others(name) for name in self.block_max}
+        self.others_max = {name: self._others_max(name) for name in self.block_max}
+
+    @staticmethod
+    def _product(values: List[float]) -> float:
+        product = 1.0
+        for r in values: product *= (1 - r / 100.0)
+        return product
+
+    def _others(self, block: str) -> float:
+        product = 1.0
+        for name, value in self.blocks.items():
+            if name != block: product *= value
+        return product
+
+    def _others_max(self, block: str) -> float:
+        return max((value for name, value in self.block_max.items() if name != block), default=0.0)
+
+    def evaluate(self, product: float, values_max: float, count: int) -> Tuple[float, bool]:
+        """Combined value for a final list with the given product, largest value and length, and whether it is too close to a band edge to trust."""
+        if count == 0:
+            return 0.0, False
+        if values_max >= 100:  # precise caps at 100 as soon as a second value follows
+            return (100.0 if count > 1 else values_max), False
+        combined = 100.0 - 100.0 * product
+        edge = _award_floor(round((combined + 5.5) / 10) * 10)  # the nearest band edge
+        return combined, abs(combined - edge) < self.BORDERLINE
+
+    def with_general_replaced(self, rating: float, new_rating: float) -> Tuple[float, bool]:
+        """One general rating swapped for a value at least as large."""
+        index = bisect.bisect_left(self.general, rating)
+        product = self.prefix[index] * self.suffix[index + 1] * (1 - new_rating / 100.0) * self.others['general']
+        return self.evaluate(product, max(self.block_max['general'], self.others_max['general'], new_rating), self.count)
+
+    def with_general_added(self, new_rating: float) -> Tuple[float, bool]:
+        product = self.prefix[-1] * (1 - new_rating / 100.0) * self.others['general']
+        return self.evaluate(product, max(self.block_max['general'], self.others_max['general'], new_rating), self.count + 1)
+
+    def with_block(self, block: str, new_values: List[float]) -> Tuple[float, bool]:
+        product = self.prefix[-1] * self.others[block] * self._product(new_values)
+        count = self.count - self.block_sizes[block] + len(new_values)
+        return self.evaluate(product, max(self.others_max[block], max(new_values, default=0.0)), count)
+
+    # Starting guesses for the additions search: the product form solved for a band edge. They
+    # ignore the rounding the real rules apply, so the search checks them before trusting them.
+    def general_rating_needed(self, combined: float) -> float:
+        """The new general rating that brings the combined value to combined (may fall outside 0-100)."""
+        return self._rating_needed(self.prefix[-1] * self.others['general'], combined)
+
+    def bilateral_rating_needed(self, block: str, limbs: List[float], combined: float) -> float:
+        """The rating that, added to a bilateral pair with these limb ratings, brings the combined value to combined."""
+        final = self._rating_needed(self.prefix[-1] * self.others[block], combined)  # the pair's final value
+        return self._rating_needed(self._product(limbs), (final - 0.5) / 1.1)     # before the 10% factor
+
+    @staticmethod
+    def _rating_needed(product: float, combined: float) -> float:
+        return 100.0 * (1.0 - (100.0 - combined) / (100.0 * product)) if product > 0 else 0.0
+
+class _StepModel:
+    """
+    The table-method final combination as a sequence of Combined Ratings Table lookups. Prefix
+    states are stored, and folds over a suffix are memoized by (position, running value), so
+    swapping or inserting one value costs a lookup or two instead of a full pass.
+    """
+    def __init__(self, values: List[float]):
+        self.values = sorted((int(v + 0.5) for v in values if int(v + 0.5) > 0), reverse=True)
+        self.negated = [-v for v in self.values]
+        self.table = combined_ratings_table()
+        self.prefix: List[Optional[int]] = [None]
+        for v in self.values: self.prefix.append(self._apply(self.prefix[-1], v))
+        self.memo: Dict[Tuple[int, Optional[int]], int] = {}
+
+    def _apply(self, state: Optional[int], value: int) -> int:
+        if state is None: return value
+        if state >= 100: return 100
+        return self.table[state * 101 + value]  # values above 100 (a 100/100 bilateral pair) only ever come first
+
+    def fold(self, position: int, state: Optional[int]) -> int:
+        path = []
+        while position < len(self.values):
+            if state is not None and state >= 100:
+                state = 100
+                break
+            cached = self.memo.get((position, state))
+            if cached is not None:
+                state = cached
+                break
+            path.append((position, state))
+            state = self._apply(state, self.values[position])
+            position += 1
+        result = 0 if state is None else state
+        for key in path: self.memo[key] = result
+        return result
+
+    def _position(self, value: int) -> int:
+        """Index a new value takes in the descending sequence (after any equal values)."""
+        return bisect.bisect_right(self.negated, -value)
+
+    def with_inserted(self, value: int) -> int:
+        position = self._position(value)
+        return self.fold(position, self._apply(self.prefix[position], value))
+
+    def with_changes(self, removed: List[float], added: List[float]) -> int:
+        """
+        Final value after taking the removed values out of the list and putting the added ones in.
+        Only the run of positions the change touches is folded afresh; the prefix state before it
+        and the memoized folds after it are reused.
+        """
+        removed, added = _multiset_difference([int(v + 0.5) for v in removed if int(v + 0.5) > 0],
+                                              [int(v + 0.5) for v in added if int(v + 0.5) > 0])
+        if not removed and not added:
+            return self.fold(0, None)
+        if not removed and len(added) == 1:
+            return self.with_inserted(added[0])
+        changed = [-v for v in removed + added]
+        start = min(bisect.bisect_left(self.negated, v) for v in changed)
+        end = max(bisect.bisect_right(self.negated, v) for v in changed)
+        segment = list(self.values[start:end])
+        for v in removed: segment.remove(v)
+        state = self.prefix[start]
+        for v in sorted(segment + added, reverse=True):
+            state = self._apply(state, v)
+        return self.fold(end, state)
+
+_PAIRS = {'upper_left': ('upper', 1, 2), 'upper_right': ('upper', 1, 2),
+          'lower_left': ('lower', 3, 4), 'lower_right': ('lower', 3, 4)}
+
+def _with_rating(claim: ClaimRatings, group: str, old_rating: Optional[float], new_rating: float) -> ClaimRatings:
+    ratings = list(getattr(claim, group))
+    if old_rating is not None: ratings.remove(old_rating)
+    return claim._replace(**{group: ratings + [new_rating]})
+
+def _first_reaching(count: int, reaches: Callable[[int], bool], guess: Optional[int] = None) -> Optional[int]:
+    """
+    Smallest index below count for which the monotone predicate reaches holds, or None. A good
+    guess settles it in two calls (guess and guess - 1); otherwise it bisects what is left.
+    """
+    low, high = 0, count
+    if guess is not None and 0 <= guess < count:
+        if not reaches(guess):
+            low = guess + 1
+        elif guess == 0 or not reaches(guess - 1):
+            return guess
+        else:
+            high = guess - 1
+    while low < high:
+        middle = (low + high) // 2
+        if reaches(middle): high = middle
+        else: low = middle + 1
+    return low if low < count else None
+
+def next_award_thresholds(claim: ClaimRatings, step: float = 10.0) -> NextAwardThresholds:
+    """
+    Finds, for the BVA and table methods, which existing ratings reach the next award band when
+    raised by one step, and the smallest new rating (per group) that would. Candidates are
+    evaluated with prefix/suffix products (BVA) and memoized table folds (table) rather than
+    by rescoring the claim; only BVA results within rounding distance of a band edge are
+    confirmed with score_claim. A changed extremity pair's bilateral outcome is worked out once
+    per candidate value and shared by both methods. The smallest addition is searched for, not
+    scanned: an award only grows with the added rating, and for general ratings the BVA product
+    can be solved for the band edge directly.
+    """
+    claim = ClaimRatings(*([float(r) for r in group if float(r) > 0] for group in claim))
+    score = score_claim(claim)
+    awards = {'bva': score.award_bva, 'table': score.award_table}
+    targets = {method: award + 10 if award < 100 else None for method, award in awards.items()}
+    raises: Dict[str, List[AwardChange]] = {'bva': [], 'table': []}
+    additions: Dict[str, List[AwardChange]] = {'bva': [], 'table': []}
+    methods = [method for method in ('bva', 'table') if targets[method] is not None]
+    if not methods:
+        return NextAwardThresholds(*(NextAwardReport(method, awards[method], None, [], []) for method in ('bva', 'table')))
+
+    bilateral = {'upper': (score.upper_bva, score.upper_table), 'lower': (score.lower_bva, score.lower_table)}
+    pair_lists = {'upper': (claim.upper_left, claim.upper_right), 'lower': (claim.lower_left, claim.lower_right)}
+    bva_blocks = {name: final_values_bva(bilateral[name][0], *pair_lists[name]) for name in pair_lists}
+    table_blocks = {name: final_values_table(bilateral[name][1], *pair_lists[name]) for name in pair_lists}
+    precise = _PreciseModel(claim.general, bva_blocks)
+    stepped = _StepModel(claim.general + table_blocks['upper'] + table_blocks['lower'])
+
+    blocks_after: Dict[Tuple[str, Optional[float], float], Tuple[str, List[float], List[float]]] = {}
+
+    def block_after(group: str, old_rating: Optional[float], new_rating: float) -> Tuple[str, List[float], List[float]]:
+        """The changed pair's name and its final values for each method."""
+        key = (group, old_rating, new_rating)
+        block = blocks_after.get(key)
+        if block is None:
+            name, left_index, right_index = _PAIRS[group]
+            left, right = claim[left_index], claim[right_index]
+            changed = list(left if group.endswith('left') else right)
+            if old_rating is not None: changed.remove(old_rating)
+            changed.append(new_rating)
+            if group.endswith('left'): left = changed
+            else: right = changed
+            block = blocks_after[key] = (name, final_values_bva(process_bilateral_bva(left, right), left, right),
+                                         final_values_table(process_bilateral_table(left, right), left, right))
+        return block
+
+    def bva_award(group: str, old_rating: Optional[float], new_rating: float) -> int:
+        if group != 'general':
+            name, new_bva, _ = block_after(group, old_rating, new_rating)
+            combined, borderline = precise.with_block(name, new_bva)
+        elif old_rating is None:
+            combined, borderline = precise.with_general_added(new_rating)
+        else:
+            combined, borderline = precise.with_general_replaced(old_rating, new_rating)
+        if borderline:
+            return CLAIM_SCORE_CACHE.score(_with_rating(claim, group, old_rating, new_rating)).award_bva
+        return round_to_va_award(round(combined, 4))
+
+    def table_award(group: str, old_rating: Optional[float], new_rating: float) -> int:
+        if group != 'general':
+            name, _, new_table = block_after(group, old_rating, new_rating)
+            return round_to_va_award(stepped.with_changes(*_multiset_difference(table_blocks[name], new_table)))
+        if old_rating is None:
+            return round_to_va_award(stepped.with_inserted(int(new_rating + 0.5)))
+        return round_to_va_award(stepped.with_changes([old_rating], [new_rating]))
+
+    award_of = {'bva': bva_award, 'table': table_award}
+    # The added ratings tried, built up exactly as a scan from step to 100 would.
+    grid: List[float] = []
+    new_rating = step
+    while new_rating <= 100:
+        grid.append(float(new_rating))
+        new_rating += step
+
+    general_additions: Dict[str, AwardChange] = {}
+    for group, ratings in zip(ClaimRatings._fields, claim):
+        for rating in sorted(set(ratings)):
+            if rating >= 100: continue
+            raised = min(rating + step, 100.0)
+            for method in methods:
+                award = award_of[method](group, rating, raised)
+                if award >= targets[method]:
+                    raises[method].append(AwardChange(group, rating, raised, award))
+        if group != 'general':
+            name, left_index, right_index = _PAIRS[group]
+            opposite = claim[right_index if group.endswith('left') else left_index]
+            if not opposite:
+                # No bilateral factor either way, so a rating added here lands in the final list
+                # exactly as a general one would: same awards, same smallest addition.
+                for method, change in general_additions.items():
+                    additions[method].append(AwardChange(group, None, change.new_rating, change.award))
+                continue
+        for method in methods:
+            found: Dict[int, int] = {}
+
+            def reaches(index: int) -> bool:
+                found[index] = award_of[method](group, None, grid[index])
+                return found[index] >= targets[method]
+
+            floor = _award_floor(targets[method])
+            if group == 'general':
+                needed = precise.general_rating_needed(floor)
+            else:
+                needed = precise.bilateral_rating_needed(name, claim[left_index] + claim[right_index], floor)
+            index = _first_reaching(len(grid), reaches, bisect.bisect_left(grid, needed))
+            if index is not None:
+                additions[method].append(AwardChange(group, None, grid[index], found[index]))
+                if group == 'general':
+                    general_additions[method] = additions[method][-1]
+
+    return NextAwardThresholds(*(NextAwardReport(method, awards[method], targets[method], raises[method], additions[method])
+                                 for method in ('bva', 'table')))
+
+def next_award_thresholds_by_rescoring(claim: ClaimRatings, step: float = 10.0) -> NextAwardThresholds:
+    """
+    The reference for next_award_thresholds: every candidate change is applied and the claim
+    rescored with score_claim, trying additions upward from step until both methods are answered.
+    """
+    claim = ClaimRatings(*([float(r) for r in group if float(r) > 0] for group in claim))
+    score = score_claim(claim)
+    awards = {'bva': score.award_bva, 'table': score.award_table}
+    targets = {method: award + 10 if award < 100 else None for method, award in awards.items()}
+    raises: Dict[str, List[AwardChange]] = {'bva': [], 'table': []}
+    additions: Dict[str, List[AwardChange]] = {'bva': [], 'table': []}
+
+    def changed_awards(group: str, old_rating: Optional[float], new_rating: float) -> Dict[str, int]:
+        changed = score_claim(_with_rating(claim, group, old_rating, new_rating))
+        return {'bva': changed.award_bva, 'table': changed.award_table}
+
+    for group, ratings in zip(ClaimRatings._fields, claim):
+        pending = {method for method in targets if targets[method] is not None}
+        if not pending: break
+        for rating in sorted(set(ratings)):
+            if rating >= 100: continue
+            raised = min(rating + step, 100.0)
+            for method, award in changed_awards(group, rating, raised).items():
+                if method in pending and award >= targets[method]:
+                    raises[method].append(AwardChange(group, rating, raised, award))
+        new_rating = step
+        while pending and new_rating <= 100:
+            for method, award in changed_awards(group, None, float(new_rating)).items():
+                if method in pending and award >= targets[method]:
+                    additions[method].append(AwardChange(group, None, float(new_rating), award))
+                    pending.discard(method)
+            new_rating += step
+
+    return NextAwardThresholds(*(NextAwardReport(method, awards[method], targets[method], raises[method], additions[method])
+                                 for method in ('bva', 'table')))
+
+# --- Result reports ---
+_RULE = "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+REPORT_CSV_FIELDS = ('award_bva', 'award_table', 'award_no_bilateral', 'combined_bva', 'combined_table', 'combined_no_bilateral',
+                     'upper_factor_bva', 'lower_factor_bva', 'upper_factor_table', 'lower_factor_table')
+
+class ClaimReport:
+    """
+    One claim's calculation with every intermediate: the ratings, the ClaimScore (bilateral bases,
+    factors, unrounded and rounded values, combined ratings and awards) and the final combination
+    list of each method. Nothing is formatted until render() is called, and each format is
+    rendered at most once.
+    """
+    __slots__ = ('claim', 'score', '_final_bva', '_final_table', '_rendered')
+
+    def __init__(self, claim: ClaimRatings, score: Optional[ClaimScore] = None):
+        self.claim = ClaimRatings(*([float(r) for r in group if float(r) > 0] for group in claim))
+        self.score = score if score is not None else score_claim(self.claim)
+        self._final_bva: Optional[List[Tuple[float, str]]] = None
+        self._final_table: Optional[List[Tuple[float, str]]] = None
+        self._rendered: Dict[str, str] = {}
+
+    def _final_list(self, upper: BilateralResult, lower: BilateralResult, rounding: Callable[[float], float]) -> List[Tuple[float, str]]:
+        final = []
+        for bilateral, left, right, name, limb in ((upper, self.claim.upper_left, self.claim.upper_right, "Upper", "Arm"),
+                                                   (lower, self.claim.lower_left, self.claim.lower_right, "Lower", "Leg")):
+            if bilateral.applied:
+                if bilateral.rounded > 0:
+                    final.append((float(bilateral.rounded), f"{name} Ext. (Bilateral)"))
+            else:
+                final += [(rounding(r), f"{name} {limb} - Left") for r in sorted(left, reverse=True)]
+                final += [(rounding(r), f"{name} {limb} - Right") for r in sorted(right, reverse=True)]
+        final += [(r, 'General') for r in self.claim.general]
+        final.sort(key=lambda item: item[0], reverse=True)
+        return final
+
+    @property
+    def final_bva(self) -> List[Tuple[float, str]]:
+        """The BVA method's final combination list as (value, source) pairs, largest first."""
+        if self._final_bva is None:
+            self._final_bva = self._final_list(self.score.upper_bva, self.score.lower_bva, float)
+        return self._final_bva
+
+    @property
+    def final_table(self) -> List[Tuple[float, str]]:
+        """The table method's final combination list; individual extremity ratings are rounded to integers."""
+        if self._final_table is None:
+            self._final_table = self._final_list(self.score.upper_table, self.score.lower_table, lambda r: float(int(r + 0.5)))
+        return self._final_table
+
+    def render(self, report_format: str = 'text') -> str:
+        """The report in one of the REPORT_RENDERERS formats ('text', 'json' or 'csv')."""
+        rendered = self._rendered.get(report_format)
+        if rendered is None:
+            start = time.perf_counter_ns() if SCORING_STATS.enabled else 0
+            rendered = self._rendered[report_format] = REPORT_RENDERERS[report_format](self)
+            if start:
+                SCORING_STATS.record('report', start)
+        return rendered
+
+    def to_dict(self) -> Dict[str, Any]:
+        score = self.score
+        return {
+            'ratings': self.claim._asdict(),
+            'bva': {'upper': score.upper_bva._asdict(), 'lower': score.lower_bva._asdict(),
+                    'final': [{'value': value, 'source': source} for value, source in self.final_bva],
+                    'combined': score.combined_bva, 'award': score.award_bva},
+            'table': {'upper': score.upper_table._asdict(), 'lower': score.lower_table._asdict(),
+                      'final': [{'value': value, 'source': source} for value, source in self.final_table],
+                      'combined': score.combined_table, 'award': score.award_table},
+            'no_bilateral': {'combined': score.combined_no_bilateral, 'award': score.award_no_bilateral},
+        }
+
+def _render_bilateral_text(parts: List[str], bilateral: BilateralResult, name: str, limb: str,
+                           left: List[float], right: List[float], table: bool):
+    if bilateral.applied:
+        if table:
+            parts.append(("\n" if name == 'Lower' else "") + f"***{name} Extremities (Bilateral):***\n")
+            parts.append(f"\tCombining Bilateral Factor Disabilities (Inputs Rounded):\n\t\t {sorted([int(float(r)+0.5) for r in left + right], reverse=True)}\n")
+            parts.append(f"\tBase Value (Step-Rounded):\n\t\t {bilateral.base:.0f}%\n")
+            parts.append(f"\t10% Bonus Factor:\n\t\t +{bilateral.factor:.2f}%\n")
+            prefix = "% " if name == 'Upper' else ""
+            parts.append(f"\t{prefix}Before Bilateral Factor Rounding:\n\t\t {bilateral.unrounded:.2f}%\n")
+            parts.append(f"\t{prefix}After Bilateral Factor Rounding:\n\t\t {bilateral.rounded}%\n\n")
+        else:
+            parts.append(f"***{name} Extremities (Bilateral):***\n")
+            parts.append(f"\tCombining {name} Bilateral Factor Disabilities:\n\t\t {sorted([float(r) for r in left + right], reverse=True)}\n")
+            parts.append(f"\tBase Value Bilateral Factor (Precise):\n\t\t {bilateral.base:.2f}%\n")
+            indent = "\t" if name == 'Upper' else "\t\t"
+            parts.append(f"\t10% Bonus Factor:\n{indent} +{bilateral.factor:.2f}%\n")
+            parts.append(f"\t% Before Bilateral Factor Integer Rounding:\n\t\t {bilateral.unrounded:.2f}%\n")
+            label = "% Rounded Bilateral Integer Replacement Value" if name == 'Upper' else "% After Bilateral Factor Integer Rounding"
+            parts.append(f"\t{label}:\n\t\t {bilateral.rounded}%\n\n")
+    elif left or right:
+        parts.append(f"***{name} {limb} (Individual Ratings - Bilateral Factor Not Applied):***\n")
+        spacing = "\n" if table and name == 'Upper' else "\n\n"
+        for side, ratings in (("Left", left), ("Right", right)):
+            for r in sorted(ratings, reverse=True):
+                parts.append(f"\t{side} {limb} Disability:\n\t\t {int(float(r) + 0.5) if table else r}%{spacing}")
+
+def render_text_report(report: ClaimReport) -> str:
+    """The decorated report shown in the GUI and copied to the clipboard."""
+    score, claim = report.score, report.claim
+    parts = ["▂ ▃ ▄ ▅ ▆ ▇ █ BVA-Accurate Method (Precise Combinations) █ ▇ ▆ ▅ ▄ ▃ ▂\n\n"]
+    _render_bilateral_text(parts, score.upper_bva, "Upper", "Arm", claim.upper_left, claim.upper_right, False)
+    _render_bilateral_text(parts, score.lower_bva, "Lower", "Leg", claim.lower_left, claim.lower_right, False)
+    breakdown = []
+    for value, source in report.final_bva:
+        display_val = f"{int(value)}" if value == int(value) else f"{value:.2f}".rstrip('0').rstrip('.')
+        source_text = f" ({source})" if source != 'General' else ""
+        bold_char = " " if "Ext. (Bilateral)" in source else ""
+        breakdown.append(f"{bold_char}{display_val}%{source_text}{bold_char}")
+    if breakdown: parts.append(f"***Final Combination List:***\n\t [{', '.join(breakdown)}]\n")
+    parts.append(f"Final Unrounded (Precise):\n\t {score.combined_bva:.2f}%\n")
+    parts.append(f"Final Award:\n\t {score.award_bva}%\n\n{_RULE}")
+
+    parts.append("\n▂ ▃ ▄ ▅ ▆ ▇ █ Combined Ratings Table Method (Step-Wise Rounding) █ ▇ ▆ ▅ ▄ ▃ ▂\n\n")
+    _render_bilateral_text(parts, score.upper_table, "Upper", "Arm", claim.upper_left, claim.upper_right, True)
+    _render_bilateral_text(parts, score.lower_table, "Lower", "Leg", claim.lower_left, claim.lower_right, True)
+    breakdown = []
+    for value, source in report.final_table:
+        source_text = f" ({source})" if source != 'General' else ""
+        bold_char = " " if "Ext. (Bilateral)" in source else ""
+        breakdown.append(f"{bold_char}{int(value + 0.5)}%{source_text}{bold_char}")
+    if breakdown: parts.append(f"***Final Combination List:***\n\t [{', '.join(breakdown)}]\n")
+    parts.append(f"Final Unrounded (Step-Rounded):\n\t {score.combined_table:.0f}%\n")
+    parts.append(f"Final Award:\n\t {score.award_table}%\n")
+
+    award_no_bilateral = score.award_no_bilateral
+    if award_no_bilateral is not None and (score.award_bva != award_no_bilateral or score.award_table != award_no_bilateral):
+        parts.append("\n\nSee Current Rates: https://www.va.gov/disability/compensation-rates/veteran-rates/\n\n***For Comparison (Original Ratings, No Bilateral Factor Applied)***\n")
+        parts.append(f"Final Award Would Be:\n\t {award_no_bilateral}%\n")
+    return ''.join(parts)
+
+def render_json_report(report: ClaimReport) -> str:
+    return json.dumps(report.to_dict())
+
+def render_csv_report(report: ClaimReport) -> str:
+    """A header line and one compact row of awards, combined ratings and bilateral factors."""
+    score = report.score
+    row = (score.award_bva, score.award_table, score.award_no_bilateral,
+           score.combined_bva, score.combined_table, score.combined_no_bilateral,
+           score.upper_bva.factor, score.lower_bva.factor, score.upper_table.factor, score.lower_table.factor)
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='\n').writerows([REPORT_CSV_FIELDS, row])
+    return buffer.getvalue()
+
+# Renderers by format name; add an entry here to give ClaimReport.render() another format.
+REPORT_RENDERERS: Dict[str, Callable[[ClaimReport], str]] = {
+    'text': render_text_report,
+    'json': render_json_report,
+    'csv': render_csv_report,
+}
+
+# --- Bulk import and list view ---
+BODY_PARTS: Dict[str, Tuple[str, int, int]] = {
+    'general': ('General', SIDE_NONE, EXTREMITY_NONE),
+    'left arm': ('Left Arm', SIDE_LEFT, EXTREMITY_UPPER),
+    'right arm': ('Right Arm', SIDE_RIGHT, EXTREMITY_UPPER),
+    'left leg': ('Left Leg', SIDE_LEFT, EXTREMITY_LOWER),
+    'right leg': ('Right Leg', SIDE_RIGHT, EXTREMITY_LOWER),
+}
+
+def parse_bulk_ratings(text: str) -> Tuple[List[Disability], List[str]]:
+    """
+    Reads pasted or file text with one body part per line, e.g. "Left Arm: 20 10" or "General 30, 10".
+    A line of bare numbers is general ratings; blank lines and lines starting with '#' are skipped.
+    Validates everything in one pass and returns the valid disability entries plus one message per problem.
+    """
+    disabilities, errors = [], []
+    for number, line in enumerate(text.splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        lowered = line.lower()
+        part = next((name for name in BODY_PARTS if lowered.startswith(name)), None)
+        if part is None:
+            first = line.replace(',', ' ').split()[0]
+            try:
+                float(first)
+            except ValueError:
+                errors.append(f"Line {number}: unknown body part '{first}'.")
+                continue
+            part, rest = 'general', line
+        else:
+            rest = line[len(part):].lstrip(' \t:=,')
+        body_part, side, extremity = BODY_PARTS[part]
+        tokens = rest.replace(',', ' ').split()
+        if not tokens:
+            errors.append(f"Line {number}: no ratings given for {body_part}.")
+        for token in tokens:
+            try:
+                rating = float(token)
+            except ValueError:
+                errors.append(f"Line {number}: '{token}' is not a number.")
+                continue
+            if 0 <= rating <= 100:
+                disabilities.append(Disability(rating, side, extremity))
+            else:
+                errors.append(f"Line {number}: rating '{rating}' is out of range (0-100).")
+    return disabilities, errors
+
+class ClaimListView:
+    """
+    Keeps the disabilities Listbox in step with the list one row at a time, so adding, editing
+    or deleting a rating costs O(1) widget operations however long the list grows.
+    """
+    PLACEHOLDER = "No disabilities entered yet."
+
+    def __init__(self, listbox: "tk.Listbox"):
+        self.listbox = listbox
+        self.rows = 0
+        self._show_placeholder()
+
+    @staticmethod
+    def row_text(disc: Disability) -> str:
+        display_rating = f"{disc.rating:.2f}".rstrip('0').rstrip('.') if isinstance(disc.rating, float) else f"{int(disc.rating)}"
+        return f"{disc.body_part}: {display_rating}%"
+
+    def _show_placeholder(self):
+        self.listbox.insert(tk.END, self.PLACEHOLDER)
+        self.listbox.config(fg='grey')
+
+    def append(self, discs: Sequence[Disability]):
+        if not discs:
+            return
+        if self.rows == 0:
+            self.listbox.delete(0, tk.END)
+            self.listbox.config(fg='black')
+        self.listbox.insert(tk.END, *map(self.row_text, discs))
+        self.rows += len(discs)
+
+    def replace(self, index: int, disc: Disability):
+        self.listbox.delete(index)
+        self.listbox.insert(index, self.row_text(disc))
+
+    def remove(self, index: int):
+        self.listbox.delete(index)
+        self.rows -= 1
+        if self.rows == 0:
+            self._show_placeholder()
+
+    def reset(self, discs: Sequence[Disability]):
+        self.listbox.delete(0, tk.END)
+        self.rows = 0
+        if discs:
+            self.append(discs)
+        else:
+            self._show_placeholder()
+
+# --- Binary caseload format ---
+CASELOAD_SUFFIX = '.vacl'
+_CASELOAD_MAGIC = b'VACL'
+_CASELOAD_HEADER = struct.Struct('<4sHHQQQ')  # magic, version, record size, claims, records, claim-id bytes
+_CASELOAD_VERSION = 2
+_CASELOAD_RECORD = struct.Struct('<dbb')      # rating, side code, extremity code
+
+def write_caseload(path: str, claims: Iterable[Tuple[str, Union[ClaimRatings, Sequence[Disability]]]]):
+    """
+    Writes claims as a binary caseload: the header, the fixed-width records, zero padding to an
+    8-byte boundary, then the index -- one int64 record offset and one int64 claim-id offset per
+    claim (plus an end offset each) -- and the UTF-8 claim ids. Records go to the file as the
+    claims arrive and the header is written last, so only the index is held in memory.
+    A claim is either a ClaimRatings or its Disability entries, which are kept exactly as given.
+    """
+    offsets, id_offsets = array('q', [0]), array('q', [0])
+    ids = bytearray()
+    pack = _CASELOAD_RECORD.pack
+    records = 0
+    with open(path, 'wb') as handle:
+        handle.write(bytes(_CASELOAD_HEADER.size))  # no magic until the run completes
+        for claim_id, claim in claims:
+            if isinstance(claim, ClaimRatings):
+                # A zero rating never changes a score.
+                block = b''.join(pack(rating, side, extremity) for (extremity, side), ratings in zip(_CODES_BY_GROUP, claim)
+                                 for rating in ratings if rating > 0)
+            else:
+                block = b''.join(pack(disc.rating, disc.side, disc.extremity) for disc in claim)
+            handle.write(block)
+            records += len(block) // _CASELOAD_RECORD.size
+            ids += str(claim_id).encode('utf-8')
+            offsets.append(records)
+            id_offsets.append(len(ids))
+        handle.write(bytes(-handle.tell() % 8))
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+            id_offsets.byteswap()
+        handle.write(offsets.tobytes())
+        handle.write(id_offsets.tobytes())
+        handle.write(ids)
+        handle.seek(0)
+        handle.write(_CASELOAD_HEADER.pack(_CASELOAD_MAGIC, _CASELOAD_VERSION, _CASELOAD_RECORD.size,
+                                           len(offsets) - 1, records, len(ids)))
+
+class CaseloadFile:
+    """
+    A binary caseload opened through mmap. Nothing is read up front: indexing a claim unpacks only
+    its own records, and columns() hands a range of claims to score_claims_batch without a parse step.
+    """
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._file.close()
+            raise ValueError(f"{path} is not a caseload file")
+        if len(self._map) < _CASELOAD_HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a caseload file")
+        magic, version, record_size, claims, records, id_bytes = _CASELOAD_HEADER.unpack_from(self._map)
+        position = _CASELOAD_HEADER.size + record_size * records
+        position += -position % 8  # the index follows the records, 8-byte aligned
+        end = position + 16 * (claims + 1) + id_bytes
+        if (magic != _CASELOAD_MAGIC or version != _CASELOAD_VERSION or record_size != _CASELOAD_RECORD.size
+                or len(self._map) < end):
+            self.close()
+            raise ValueError(f"{path} is not a caseload file")
+        view = memoryview(self._map)
+        self._views = [view]
+        self.offsets = self._index(view, position, claims + 1)
+        self.id_offsets = self._index(view, position + 8 * (claims + 1), claims + 1)
+        if (self.offsets[0], self.offsets[claims], self.id_offsets[0], self.id_offsets[claims]) != (0, records, 0, id_bytes):
+            self.close()
+            raise ValueError(f"{path} has a corrupt claim index")
+        self.records = view[_CASELOAD_HEADER.size:_CASELOAD_HEADER.size + record_size * records]
+        self._ids = view[position + 16 * (claims + 1):end]
+        self._views += [self.records, self._ids]
+
+    def _index(self, view: memoryview, position: int, count: int) -> Sequence[int]:
+        raw = view[position:position + 8 * count]
+        if sys.byteorder == 'little':
+            index = raw.cast('q')
+            self._views += [raw, index]
+            return index
+        swapped = array('q', raw.tobytes())
+        swapped.byteswap()
+        raw.release()
+        return swapped
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def claim_id(self, index: int) -> str:
+        return str(self._ids[self.id_offsets[index]:self.id_offsets[index + 1]], 'utf-8', 'replace')
+
+    def disabilities(self, index: int) -> List[Disability]:
+        """Claim index's entries as written; raises ValueError if its records are corrupt."""
+        size = _CASELOAD_RECORD.size
+        start, end = self.offsets[index], self.offsets[index + 1]
+        if not 0 <= start <= end <= len(self.records) // size:
+            raise ValueError(f"claim {index} has a corrupt record offset")
+        discs = [Disability(*entry) for entry in _CASELOAD_RECORD.iter_unpack(self.records[start * size:end * size])]
+        for disc in discs:
+            if not (0 <= disc.side <= 2 and 0 <= disc.extremity <= 2):
+                raise ValueError(f"claim {index} has an unknown side or extremity code ({disc.side}/{disc.extremity})")
+        return discs
+
+    def __getitem__(self, index: int) -> ClaimRatings:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("claim index out of range")
+        return group_disabilities(self.disabilities(index))
+
+    def __iter__(self) -> Iterator[ClaimRatings]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def columns(self, start: int = 0, stop: Optional[int] = None) -> ClaimColumns:
+        """Claims start..stop as a ClaimColumns. With NumPy the record fields are split with one strided copy each."""
+        stop = len(self) if stop is None else stop
+        first, last = self.offsets[start], self.offsets[stop]
+        columns = ClaimColumns()
+        columns.offsets = array('q', [offset - first for offset in self.offsets[start:stop + 1]])
+        block = self.records[first * _CASELOAD_RECORD.size:last * _CASELOAD_RECORD.size]
+        if np is not None:
+            fields = np.frombuffer(block, dtype=np.dtype([('rating', '<f8'), ('side', 'i1'), ('extremity', 'i1')]))
+            columns.ratings.frombytes(fields['rating'].astype(float).tobytes())
+            columns.sides.frombytes(fields['side'].tobytes())
+            columns.extremities.frombytes(fields['extremity'].tobytes())
+        else:
+            for rating, side, extremity in _CASELOAD_RECORD.iter_unpack(block):
+                columns.ratings.append(rating)
+                columns.sides.append(side)
+                columns.extremities.append(extremity)
+        return columns
+
+    def close(self):
+        for view in reversed(getattr(self, '_views', [])):
+            view.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "CaseloadFile":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# --- Background calculation ---
+class CalculationCancelled(Exception):
+    """Raised inside a background job once a newer job of the same kind has replaced it."""
+
+class BackgroundCalculator:
+    """
+    Runs GUI calculations on one worker thread so the Tk main loop stays responsive. Every job
+    has a kind ('report', 'preview'); submitting a job supersedes the unfinished one of the same
+    kind. Jobs send progress and results back through a thread-safe queue, which the GUI drains
+    with poll() from an after() callback. Superseded or cancelled jobs stop at their next
+    progress call, and their results are never delivered.
+    """
+    def __init__(self):
+        self.messages: "queue.Queue[tuple]" = queue.Queue()
+        self._jobs: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._current: Dict[str, int] = {}  # kind -> id of the job whose result is still wanted
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, kind: str, function: Callable[..., Any], *args: Any) -> int:
+        """Queues function(progress, *args); progress(fraction) reports 0..1 and raises CalculationCancelled once superseded."""
+        job_id = next(self._ids)
+        with self._lock:
+            self._current[kind] = job_id
+        self._jobs.put((kind, job_id, function, args))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='calculation', daemon=True)
+            self._thread.start()
+        return job_id
+
+    def cancel(self, kind: Optional[str] = None):
+        with self._lock:
+            if kind is None:
+                self._current.clear()
+            else:
+                self._current.pop(kind, None)
+
+    def pending(self, kind: Optional[str] = None) -> bool:
+        with self._lock:
+            return bool(self._current) if kind is None else kind in self._current
+
+    def _is_current(self, kind: str, job_id: int) -> bool:
+        with self._lock:
+            return self._current.get(kind) == job_id
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            kind, job_id, function, args = job
+            if not self._is_current(kind, job_id):
+                continue
+
+            def progress(fraction: float):
+                if not self._is_current(kind, job_id):
+                    raise CalculationCancelled()
+                self.messages.put((kind, job_id, 'progress', fraction))
+            try:
+                result = function(progress, *args)
+            except CalculationCancelled:
+                continue
+            except Exception as exc:
+                self.messages.put((kind, job_id, 'error', exc))
+            else:
+                self.messages.put((kind, job_id, 'done', result))
+
+    def poll(self) -> List[Tuple[str, str, Any]]:
+        """(kind, 'progress' | 'done' | 'error', value) for every waiting message from a job still wanted. Call from the Tk thread."""
+        delivered = []
+        while True:
+            try:
+                kind, job_id, status, value = self.messages.get_nowait()
+            except queue.Empty:
+                return delivered
+            with self._lock:
+                if self._current.get(kind) != job_id:
+                    continue
+                if status != 'progress':
+                    del self._current[kind]
+            delivered.append((kind, status, value))
+
+    def stop(self):
+        self.cancel()
+        self._jobs.put(None)
+
+def build_claim_report(progress: Callable[[float], None], state: IncrementalClaim) -> ClaimReport:
+    """Background job behind the Calculate button: scores a snapshot of the claim and renders its text report."""
+    progress(0.0)
+    score = state.score()
+    progress(0.5)
+    report = ClaimReport(state.claim(), score)
+    report.render('text')  # rendered here so the Tk thread only inserts the text
+    progress(1.0)
+    return report
+
+def score_preview(progress: Callable[[float], None], state: IncrementalClaim) -> ClaimScore:
+    """Background job behind the live preview."""
+    progress(0.0)
+    return state.score()
+
 class VADisabilityCalculatorApp:
-    def __init__(self, master: tk.Tk):
+    POLL_MS = 25            # how often the Tk thread checks for background results
+    PROGRESS_DELAY = 0.2    # seconds a calculation runs before the progress bar appears
+
+    def __init__(self, master: "tk.Tk"):
         self.master = master
         master.title("VA Disability Calculator (Corrected Bilateral Logic)")
         master.minsize(550, 700) 
 
-        self.disabilities: List[Dict[str, Any]] = []
+        self.disabilities: List[Disability] = []
+        self.claim_state = IncrementalClaim()
         self.selected_display_index: int = -1
-        self.last_result_text: str = ""
+        self.last_report: Optional[ClaimReport] = None
+        self.live_results = tk.BooleanVar(master, value=False)
+        self.calculator = BackgroundCalculator()
+        self._poll_id: Optional[str] = None
+        self._job_states: Dict[str, IncrementalClaim] = {}  # kind -> snapshot the pending job is scoring
+        self._calculation_started = 0.0
 
         self._setup_widgets()
+        self.list_view = ClaimListView(self.ratings_listbox)
         self._bind_events()
         self.update_display()
 
@@ -110,6 +1931,7 @@ class VADisabilityCalculatorApp:
         lower_frame.pack(fill=tk.X, pady=5)
         
         self.extremity_entries: Dict[str, tk.Entry] = {}
+        self.extremity_groups: Dict[str, tuple] = {}
         extremity_layout = [
             ("Left Arm", "L", "Upper", upper_frame), 
             ("Right Arm", "R", "Upper", upper_frame),
@@ -129,6 +1951,7 @@ class VADisabilityCalculatorApp:
             entry = tk.Entry(sub_frame)
             entry.pack(side=tk.LEFT, expand=True, fill=tk.X)
             self.extremity_entries[part] = entry
+            self.extremity_groups[part] = (side, ext_type)
             tk.Button(sub_frame, text="Add", command=lambda p=part, s=side, e=ext_type: self.add_extremity_rating(p, s, e)).pack(side=tk.LEFT, padx=(5,0))
 
         list_frame = tk.Frame(main_frame, padx=10, pady=5)
@@ -162,7 +1985,14 @@ class VADisabilityCalculatorApp:
         tk.Button(action_button_frame, text="Calculate", command=self.calculate_total_disability, font=("Arial", 10, "bold")).pack(side=tk.LEFT)
         self.copy_button = tk.Button(action_button_frame, text="Copy Results", command=self.copy_results_to_clipboard, state=tk.DISABLED)
         self.copy_button.pack(side=tk.LEFT, padx=10)
+        tk.Checkbutton(action_button_frame, text="Live Results", variable=self.live_results, command=self._on_live_toggle).pack(side=tk.LEFT)
+        self.progress_bar = ttk.Progressbar(action_button_frame, mode='determinate', maximum=100, length=100)  # packed only while a long calculation runs
         tk.Button(action_button_frame, text="Clear All", command=self.clear_all).pack(side=tk.RIGHT)
+        tk.Button(action_button_frame, text="Import...", command=self.open_bulk_import).pack(side=tk.RIGHT, padx=10)
+        tk.Button(action_button_frame, text="Save...", command=self.save_session).pack(side=tk.RIGHT)
+        tk.Button(action_button_frame, text="Open...", command=self.open_session).pack(side=tk.RIGHT, padx=(0, 5))
+        self.live_label = tk.Label(results_frame, text="", fg='gray', anchor="w")
+        self.live_label.pack(fill=tk.X)
         
         text_area_frame = tk.Frame(results_frame)
         text_area_frame.pack(pady=10, fill=tk.BOTH, expand=True) 
@@ -187,72 +2017,204 @@ class VADisabilityCalculatorApp:
             _, side, ext_type = next(p for p in [("Left Arm", "L", "Upper"), ("Right Arm", "R", "Upper"),
                                                  ("Left Leg", "L", "Lower"), ("Right Leg", "R", "Lower")] if p[0] == part)
             entry.bind('<Return>', lambda event, p=part, s=side, e=ext_type: self.add_extremity_rating(p, s, e))
+        for entry in [self.entry_general, self.edit_entry, *self.extremity_entries.values()]:
+            entry.bind('<KeyRelease>', self._preview_pending, add='+')
         self.ratings_listbox.bind('<<ListboxSelect>>', self.on_listbox_select)
         self.ratings_listbox.bind('<Double-Button-1>', self._handle_delete_action)
         self.ratings_listbox.bind('<Delete>', self._handle_delete_action)
 
     def copy_results_to_clipboard(self):
-        if not self.last_result_text:
+        if self.last_report is None:
             messagebox.showwarning("No Results", "There are no results to copy. Please calculate first.")
             return
         self.master.clipboard_clear()
-        self.master.clipboard_append(self.last_result_text)
+        self.master.clipboard_append(self.last_report.render('text'))
         messagebox.showinfo("Copied", "The results have been copied to your clipboard.")
 
-    def add_general_ratings(self, event: Optional[tk.Event] = None):
+    def add_general_ratings(self, event: Optional["tk.Event"] = None):
         ratings_str = self.entry_general.get()
         if not ratings_str.strip(): return
         try:
             ratings = [float(r) for r in ratings_str.split()]
-            for rating in ratings:
-                if 0 <= rating <= 100: self.disabilities.append({'body_part': 'General', 'rating': rating, 'side': None, 'extremity_type': None})
-                else: messagebox.showwarning("Invalid Rating", f"Rating '{rating}' is out of range (0-100) and was skipped.")
+            self._add_disabilities([Disability(rating) for rating in ratings if 0 <= rating <= 100])
             self.entry_general.delete(0, tk.END)
-            self.update_display()
+            self._after_change()
+            self._warn_out_of_range(ratings)
         except ValueError: messagebox.showerror("Invalid Input", "Please enter valid numbers separated by spaces.")
 
-    def add_extremity_rating(self, body_part: str, side: str, extremity_type: str, event: Optional[tk.Event] = None):
+    def add_extremity_rating(self, body_part: str, side: str, extremity_type: str, event: Optional["tk.Event"] = None):
         entry_widget = self.extremity_entries[body_part]
         ratings_str = entry_widget.get()
         if not ratings_str.strip(): return
         try:
             ratings = [float(r) for r in ratings_str.split()]
-            for rating in ratings:
-                if 0 <= rating <= 100: self.disabilities.append({'body_part': body_part, 'rating': rating, 'side': side, 'extremity_type': extremity_type})
-                else: messagebox.showwarning("Invalid Rating", f"Rating '{rating}' is out of range (0-100) and was skipped.")
+            self._add_disabilities([Disability.from_labels(rating, side, extremity_type) for rating in ratings if 0 <= rating <= 100])
             entry_widget.delete(0, tk.END)
-            self.update_display()
+            self._after_change()
+            self._warn_out_of_range(ratings)
         except ValueError: messagebox.showerror("Invalid Input", f"Please enter valid numbers for {body_part}.")
 
+    @staticmethod
+    def _warn_out_of_range(ratings: List[float]):
+        """One dialog for every out-of-range value in an entry, instead of one dialog each."""
+        skipped = [rating for rating in ratings if not 0 <= rating <= 100]
+        if len(skipped) == 1:
+            messagebox.showwarning("Invalid Rating", f"Rating '{skipped[0]}' is out of range (0-100) and was skipped.")
+        elif skipped:
+            messagebox.showwarning("Invalid Ratings", f"{len(skipped)} ratings are out of range (0-100) and were skipped: "
+                                   + ", ".join(f"'{rating}'" for rating in skipped))
+
+    def _add_disabilities(self, discs: List[Disability]):
+        self.disabilities.extend(discs)
+        for disc in discs:
+            self.claim_state.add(disc.group, disc.rating)
+        self.list_view.append(discs)
+
+    def open_bulk_import(self):
+        """A dialog to paste, or load from a file, many ratings at once (one body part per line)."""
+        dialog = tk.Toplevel(self.master)
+        dialog.title("Import Ratings")
+        dialog.transient(self.master)
+        tk.Label(dialog, justify=tk.LEFT, anchor="w",
+                 text="One body part per line, e.g.  General: 30 20   or   Left Arm: 10\n"
+                      "Lines of bare numbers are general ratings. Body parts: General, Left/Right Arm, Left/Right Leg.").pack(fill=tk.X, padx=10, pady=(10, 5))
+        text_area = tk.Text(dialog, height=15, width=60)
+        text_area.pack(fill=tk.BOTH, expand=True, padx=10)
+
+        def load_file():
+            path = filedialog.askopenfilename(parent=dialog, filetypes=[("Text files", "*.txt *.csv"), ("All files", "*.*")])
+            if not path: return
+            try:
+                with open(path, encoding='utf-8') as handle:
+                    content = handle.read()
+            except (OSError, UnicodeDecodeError) as exc:
+                messagebox.showerror("Import Failed", f"Could not read {path}:\n{exc}", parent=dialog)
+                return
+            text_area.delete('1.0', tk.END)
+            text_area.insert(tk.END, content)
+
+        def do_import():
+            if self.import_ratings_text(text_area.get('1.0', tk.END)):
+                dialog.destroy()
+
+        button_frame = tk.Frame(dialog)
+        button_frame.pack(fill=tk.X, padx=10, pady=10)
+        tk.Button(button_frame, text="Load File...", command=load_file).pack(side=tk.LEFT)
+        tk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.RIGHT)
+        tk.Button(button_frame, text="Import", command=do_import).pack(side=tk.RIGHT, padx=5)
+
+    def import_ratings_text(self, text: str) -> int:
+        """Adds every valid rating in text; problems are reported together in a single dialog. Returns the number added."""
+        discs, errors = parse_bulk_ratings(text)
+        if errors:
+            shown = "\n".join(errors[:15]) + (f"\n...and {len(errors) - 15} more." if len(errors) > 15 else "")
+            if not discs:
+                messagebox.showerror("Import Failed", f"No ratings were imported:\n\n{shown}")
+                return 0
+            if not messagebox.askyesno("Import Problems", f"{len(errors)} problem(s) found:\n\n{shown}\n\n"
+                                                          f"Import the {len(discs)} valid rating(s) anyway?"):
+                return 0
+        self._add_disabilities(discs)
+        self._after_change()
+        return len(discs)
+
+    def save_session(self):
+        """Saves the entered ratings, in order and with their body parts, as a one-claim binary caseload."""
+        if not self.disabilities:
+            messagebox.showwarning("Nothing to Save", "There are no ratings to save.")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=CASELOAD_SUFFIX,
+                                            filetypes=[("Caseload files", "*" + CASELOAD_SUFFIX), ("All files", "*.*")])
+        if not path: return
+        try:
+            write_caseload(path, [('session', self.disabilities)])
+        except OSError as exc:
+            messagebox.showerror("Save Failed", f"Could not write {path}:\n{exc}")
+
+    def open_session(self):
+        path = filedialog.askopenfilename(filetypes=[("Caseload files", "*" + CASELOAD_SUFFIX), ("All files", "*.*")])
+        if not path: return
+        try:
+            with CaseloadFile(path) as caseload:
+                if not len(caseload):
+                    raise ValueError("the file holds no claims")
+                discs = caseload.disabilities(0)
+        except (OSError, ValueError, struct.error) as exc:
+            messagebox.showerror("Open Failed", f"Could not open {path}:\n{exc}")
+            return
+        if self.disabilities and not messagebox.askyesno("Replace Ratings", f"Replace the {len(self.disabilities)} current rating(s) with the saved session?"):
+            return
+        self.restore_session(discs)
+
+    def restore_session(self, discs: List[Disability]):
+        self.disabilities = list(discs)
+        self.claim_state.clear()
+        for disc in self.disabilities:
+            self.claim_state.add(disc.group, disc.rating)
+        self.update_display()
+
     def update_display(self):
-        self.ratings_listbox.delete(0, tk.END)
+        """Rebuilds the whole list; edits go through list_view row by row instead."""
+        self.list_view.reset(self.disabilities)
+        self._after_change()
+
+    def _after_change(self):
         if not self.disabilities:
-            self.ratings_listbox.insert(tk.END, "No disabilities entered yet.")
-            self.ratings_listbox.config(fg='grey')
             self._set_edit_controls_state(tk.DISABLED)
         else:
-            self.ratings_listbox.config(fg='black')
-            for i, disc in enumerate(self.disabilities):
-                display_rating = f"{disc['rating']:.2f}".rstrip('0').rstrip('.') if isinstance(disc['rating'], float) else f"{int(disc['rating'])}"
-                display_text = f"{i+1}. {disc['body_part']}: {display_rating}%"
-                self.ratings_listbox.insert(tk.END, display_text)
             self.on_listbox_select()
         
+        self.calculator.cancel('report')
         if hasattr(self, 'result_text_area'):
             self.result_text_area.config(state=tk.NORMAL)
             self.result_text_area.delete('1.0', tk.END)
             self.result_text_area.config(state=tk.DISABLED)
-        self.last_result_text = ""
+        self.last_report = None
         if hasattr(self, 'copy_button'): 
             self.copy_button.config(state=tk.DISABLED)
+        if self.live_results.get() and self.disabilities:
+            self.calculate_total_disability()
+        self._preview_pending()
+
+    def _on_live_toggle(self):
+        if self.live_results.get() and self.disabilities:
+            self.calculate_total_disability()
+        self._preview_pending()
+
+    def _preview_pending(self, event: Optional["tk.Event"] = None):
+        """In live mode, shows the awards as they would be with whatever is typed but not yet added."""
+        if not hasattr(self, 'live_label'): return
+        if not self.live_results.get():
+            self.calculator.cancel('preview')
+            self.live_label.config(text="")
+            return
+        preview = self.claim_state.copy()
+        pending = [(IncrementalClaim.GENERAL, self.entry_general.get())]
+        pending += [(Disability.from_labels(0, *self.extremity_groups[part]).group, entry.get()) for part, entry in self.extremity_entries.items()]
+        for group, text in pending:
+            for token in text.split():
+                try: rating = float(token)
+                except ValueError: continue
+                if 0 <= rating <= 100: preview.add(group, rating)
+        if self.selected_display_index != -1 and self.selected_display_index < len(self.disabilities):
+            try: new_rating = float(self.edit_entry.get())
+            except ValueError: new_rating = None
+            if new_rating is not None and 0 <= new_rating <= 100:
+                disc = self.disabilities[self.selected_display_index]
+                preview.replace(disc.group, disc.rating, new_rating)
+        if not any(preview.key()):
+            self.calculator.cancel('preview')
+            self.live_label.config(text="")
+            return
+        self._submit('preview', score_preview, preview)
 
-    def on_listbox_select(self, event: Optional[tk.Event] = None):
+    def on_listbox_select(self, event: Optional["tk.Event"] = None):
         selected_indices = self.ratings_listbox.curselection()
         if selected_indices and self.disabilities:
             self.selected_display_index = selected_indices[0]
             selected_disability = self.disabilities[self.selected_display_index]
             self.edit_entry.delete(0, tk.END)
-            self.edit_entry.insert(0, str(selected_disability['rating']))
+            self.edit_entry.insert(0, str(selected_disability.rating))
             self._set_edit_controls_state(tk.NORMAL)
         else:
             self.selected_display_index = -1
@@ -264,24 +2226,30 @@ class VADisabilityCalculatorApp:
         try:
             new_rating = float(self.edit_entry.get())
             if 0 <= new_rating <= 100:
-                self.disabilities[self.selected_display_index]['rating'] = new_rating
-                self.update_display()
+                disc = self.disabilities[self.selected_display_index]
+                self.claim_state.replace(disc.group, disc.rating, new_rating)
+                disc.rating = new_rating
+                self.list_view.replace(self.selected_display_index, disc)
+                self._after_change()
             else: messagebox.showerror("Invalid Input", "Rating must be between 0 and 100.")
         except ValueError: messagebox.showerror("Invalid Input", "Please enter a valid number.")
 
-    def _handle_delete_action(self, event: Optional[tk.Event] = None):
+    def _handle_delete_action(self, event: Optional["tk.Event"] = None):
         selected_indices = self.ratings_listbox.curselection()
         if not selected_indices or not self.disabilities: return
         index_to_delete = selected_indices[0] 
         disability_to_delete = self.disabilities[index_to_delete] 
-        prompt = f"Are you sure you want to delete this disability?\n\n- {disability_to_delete['body_part']}: {disability_to_delete['rating']}%"
+        prompt = f"Are you sure you want to delete this disability?\n\n- {disability_to_delete.body_part}: {disability_to_delete.rating}%"
         if messagebox.askyesno("Confirm Delete", prompt):
             del self.disabilities[index_to_delete]
-            self.update_display()
+            self.claim_state.remove(disability_to_delete.group, disability_to_delete.rating)
+            self.list_view.remove(index_to_delete)
+            self._after_change()
 
     def clear_all(self):
         if self.disabilities and messagebox.askyesno("Confirm Clear", "Are you sure you want to clear ALL ratings?"):
             self.disabilities = []
+            self.claim_state.clear()
             self.update_display()
             for entry_widget in self.extremity_entries.values(): entry_widget.delete(0, tk.END)
             self.entry_general.delete(0, tk.END)
@@ -297,223 +2265,1452 @@ class VADisabilityCalculatorApp:
             messagebox.showwarning("No Ratings", "Please enter at least one disability rating.")
             return
 
-        general_ratings_orig, upper_l_orig, upper_r_orig, lower_l_orig, lower_r_orig = [], [], [], [], []
-        for disc in self.disabilities:
-            rating = float(disc['rating'])
-            if rating > 0:
-                if disc['extremity_type'] == 'Upper':
-                    if disc['side'] == 'L': upper_l_orig.append(rating)
-                    elif disc['side'] == 'R': upper_r_orig.append(rating)
-                elif disc['extremity_type'] == 'Lower':
-                    if disc['side'] == 'L': lower_l_orig.append(rating)
-                    elif disc['side'] == 'R': lower_r_orig.append(rating)
-                else:
-                    general_ratings_orig.append(rating)
-        
-        # *** Corrected process_bilateral_... functions to handle the condition properly ***
-        def process_bilateral_bva(left_ratings, right_ratings):
-            is_truly_bilateral = bool(left_ratings and right_ratings) # Bilateral factor ONLY if ratings on BOTH sides
-            
-            all_limb_ratings_for_base_calc = left_ratings + right_ratings
-            base_combined_precise = corrected_va_disability_precise(all_limb_ratings_for_base_calc)
-            
-            factor_precise = 0.0
-            value_with_factor_unrounded = base_combined_precise # Start with base
-
-            if is_truly_bilateral and base_combined_precise > 0:
-                factor_precise = round(base_combined_precise * 0.1, 4)
-                value_with_factor_unrounded = base_combined_precise + factor_precise
-            
-            rounded_value_int = int(value_with_factor_unrounded + 0.5)
-            return (rounded_value_int, factor_precise, base_combined_precise, value_with_factor_unrounded, is_truly_bilateral)
-
-        def process_bilateral_table(left_ratings, right_ratings):
-            is_truly_bilateral = bool(left_ratings and right_ratings)
-
-            all_limb_ratings_for_base_calc = left_ratings + right_ratings
-            base_combined_int = corrected_va_disability_table_method(all_limb_ratings_for_base_calc)
-            
-            factor_precise = 0.0
-            value_with_factor_unrounded = float(base_combined_int)
-
-            if is_truly_bilateral and base_combined_int > 0:
-                factor_precise = round(float(base_combined_int) * 0.1, 4)
-                value_with_factor_unrounded = float(base_combined_int) + factor_precise
-            
-            rounded_value_int = int(value_with_factor_unrounded + 0.5)
-            return (rounded_value_int, factor_precise, float(base_combined_int), value_with_factor_unrounded, is_truly_bilateral)
+        # Scored and rendered on the worker thread from a snapshot; a change before it finishes cancels it.
+        self._submit('report', build_claim_report, self.claim_state.copy())
+        self.progress_bar['value'] = 0
+        self._calculation_started = time.perf_counter()
 
-        result_text = ""
-        
-        # --- Method 1: BVA-Accurate Calculation ---
-        result_text += "▂ ▃ ▄ ▅ ▆ ▇ █ BVA-Accurate Method (Precise Combinations) █ ▇ ▆ ▅ ▄ ▃ ▂\n\n"
-        final_ratings_bva = []
-        
-        upper_rounded_bva, upper_factor_bva, upper_base_bva, upper_unrounded_bva, upper_is_bilateral = process_bilateral_bva(upper_l_orig, upper_r_orig)
-        if upper_is_bilateral and upper_factor_bva > 0: # Bilateral processing occurred
-            result_text += "***Upper Extremities (Bilateral):***\n"
-            result_text += f"\tCombining Upper Bilateral Factor Disabilities:\n\t\t {sorted([float(r) for r in upper_l_orig + upper_r_orig], reverse=True)}\n"
-            result_text += f"\tBase Value Bilateral Factor (Precise):\n\t\t {upper_base_bva:.2f}%\n"
-            result_text += f"\t10% Bonus Factor:\n\t +{upper_factor_bva:.2f}%\n"
-            result_text += f"\t% Before Bilateral Factor Integer Rounding:\n\t\t {upper_unrounded_bva:.2f}%\n"
-            result_text += f"\t% Rounded Bilateral Integer Replacement Value:\n\t\t {upper_rounded_bva}%\n\n"
-            if upper_rounded_bva > 0:
-                 final_ratings_bva.append({'value': float(upper_rounded_bva), 'source': "Upper Ext. (Bilateral)"})
-        elif upper_l_orig or upper_r_orig: # Ratings exist but not bilateral, or bilateral but 0% result
-            result_text += "***Upper Arm (Individual Ratings - Bilateral Factor Not Applied):***\n"
-            for r in sorted(upper_l_orig, reverse=True):
-                result_text += f"\tLeft Arm Disability:\n\t\t {r}%\n\n"
-                final_ratings_bva.append({'value': float(r), 'source': 'Upper Arm - Left'})
-            for r in sorted(upper_r_orig, reverse=True):
-                result_text += f"\tRight Arm Disability:\n\t\t {r}%\n\n"
-                final_ratings_bva.append({'value': float(r), 'source': 'Upper Arm - Right'})
-            if not (upper_l_orig or upper_r_orig): # If somehow base was 0 from no inputs
-                 if upper_rounded_bva > 0 : final_ratings_bva.append({'value': float(upper_rounded_bva), 'source': "Upper Arm"})
-
-
-        lower_rounded_bva, lower_factor_bva, lower_base_bva, lower_unrounded_bva, lower_is_bilateral = process_bilateral_bva(lower_l_orig, lower_r_orig)
-        if lower_is_bilateral and lower_factor_bva > 0:
-            result_text += "***Lower Extremities (Bilateral):***\n"
-            result_text += f"\tCombining Lower Bilateral Factor Disabilities:\n\t\t {sorted([float(r) for r in lower_l_orig + lower_r_orig], reverse=True)}\n"
-            result_text += f"\tBase Value Bilateral Factor (Precise):\n\t\t {lower_base_bva:.2f}%\n"
-            result_text += f"\t10% Bonus Factor:\n\t\t +{lower_factor_bva:.2f}%\n"
-            result_text += f"\t% Before Bilateral Factor Integer Rounding:\n\t\t {lower_unrounded_bva:.2f}%\n"
-            result_text += f"\t% After Bilateral Factor Integer Rounding:\n\t\t {lower_rounded_bva}%\n\n"
-            if lower_rounded_bva > 0:
-                final_ratings_bva.append({'value': float(lower_rounded_bva), 'source': "Lower Ext. (Bilateral)"})
-        elif lower_l_orig or lower_r_orig:
-            result_text += "***Lower Leg (Individual Ratings - Bilateral Factor Not Applied):***\n"
-            for r in sorted(lower_l_orig, reverse=True):
-                result_text += f"\tLeft Leg Disability:\n\t\t {r}%\n\n"
-                final_ratings_bva.append({'value': float(r), 'source': 'Lower Leg - Left'})
-            for r in sorted(lower_r_orig, reverse=True):
-                result_text += f"\tRight Leg Disability:\n\t\t {r}%\n\n"
-                final_ratings_bva.append({'value': float(r), 'source': 'Lower Leg - Right'})
-            if not (lower_l_orig or lower_r_orig):
-                if lower_rounded_bva > 0 : final_ratings_bva.append({'value': float(lower_rounded_bva), 'source': "Lower Leg"})
-
-
-        for r_gen_val in general_ratings_orig: final_ratings_bva.append({'value': float(r_gen_val), 'source': 'General'})
-        final_ratings_bva.sort(key=lambda x: x['value'], reverse=True)
-        
-        # Filter out 0% values before final combination for BVA method, unless it's the only rating.
-        bva_math_ratings = [item['value'] for item in final_ratings_bva if item['value'] > 0]
-        if not bva_math_ratings and final_ratings_bva: # Handle case where all ratings are 0
-            bva_math_ratings = [0.0] if final_ratings_bva else []
-
-        combined_bva = corrected_va_disability_precise(bva_math_ratings)
-        award_bva = round_to_va_award(combined_bva) 
-
-        bva_breakdown_list = []
-        for item in final_ratings_bva:
-            display_val = f"{int(item['value'])}" if item['value'] == int(item['value']) else f"{item['value']:.2f}".rstrip('0').rstrip('.')
-            source_text = f" ({item['source']})" if item['source'] != 'General' else ""
-            bold_char = " " if "Ext. (Bilateral)" in item['source'] else ""
-            bva_breakdown_list.append(f"{bold_char}{display_val}%{source_text}{bold_char}")
-        
-        if final_ratings_bva: result_text += f"***Final Combination List:***\n\t [{', '.join(bva_breakdown_list)}]\n"
-        result_text += f"Final Unrounded (Precise):\n\t {combined_bva:.2f}%\n"
-        result_text += f"Final Award:\n\t {award_bva}%\n\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-
-        # --- Method 2: Online Calculator (Table Method) Simulation ---
-        result_text += "\n▂ ▃ ▄ ▅ ▆ ▇ █ Combined Ratings Table Method (Step-Wise Rounding) █ ▇ ▆ ▅ ▄ ▃ ▂\n\n"
-        final_ratings_table = []
-
-        upper_rounded_tbl, upper_factor_tbl, upper_base_tbl, upper_unrounded_tbl, upper_is_bilateral_tbl = process_bilateral_table(upper_l_orig, upper_r_orig)
-        if upper_is_bilateral_tbl and upper_factor_tbl > 0:
-            result_text += "***Upper Extremities (Bilateral):***\n"
-            result_text += f"\tCombining Bilateral Factor Disabilities (Inputs Rounded):\n\t\t {sorted([int(float(r)+0.5) for r in upper_l_orig + upper_r_orig], reverse=True)}\n"
-            result_text += f"\tBase Value (Step-Rounded):\n\t\t {upper_base_tbl:.0f}%\n"
-            result_text += f"\t10% Bonus Factor:\n\t\t +{upper_factor_tbl:.2f}%\n"
-            result_text += f"\t% Before Bilateral Factor Rounding:\n\t\t {upper_unrounded_tbl:.2f}%\n"
-            result_text += f"\t% After Bilateral Factor Rounding:\n\t\t {upper_rounded_tbl}%\n\n"
-            if upper_rounded_tbl > 0:
-                final_ratings_table.append({'value': float(upper_rounded_tbl), 'source': "Upper Ext. (Bilateral)"})
-        elif upper_l_orig or upper_r_orig:
-            result_text += "***Upper Arm (Individual Ratings - Bilateral Factor Not Applied):***\n"
-            for r_orig_val in sorted(upper_l_orig, reverse=True):
-                r = int(float(r_orig_val) + 0.5)
-                result_text += f"\tLeft Arm Disability:\n\t\t {r}%\n"
-                final_ratings_table.append({'value': float(r), 'source': 'Upper Arm - Left'})
-            for r_orig_val in sorted(upper_r_orig, reverse=True):
-                r = int(float(r_orig_val) + 0.5)
-                result_text += f"\tRight Arm Disability:\n\t\t {r}%\n"
-                final_ratings_table.append({'value': float(r), 'source': 'Upper Arm - Right'})
-            if not (upper_l_orig or upper_r_orig):
-                 if upper_rounded_tbl > 0 : final_ratings_table.append({'value': float(upper_rounded_tbl), 'source': "Upper Arm"})
-
-        lower_rounded_tbl, lower_factor_tbl, lower_base_tbl, lower_unrounded_tbl, lower_is_bilateral_tbl = process_bilateral_table(lower_l_orig, lower_r_orig)
-        if lower_is_bilateral_tbl and lower_factor_tbl > 0:
-            result_text += "\n***Lower Extremities (Bilateral):***\n"
-            result_text += f"\tCombining Bilateral Factor Disabilities (Inputs Rounded):\n\t\t {sorted([int(float(r)+0.5) for r in lower_l_orig + lower_r_orig], reverse=True)}\n"
-            result_text += f"\tBase Value (Step-Rounded):\n\t\t {lower_base_tbl:.0f}%\n"
-            result_text += f"\t10% Bonus Factor:\n\t\t +{lower_factor_tbl:.2f}%\n"
-            result_text += f"\tBefore Bilateral Factor Rounding:\n\t\t {lower_unrounded_tbl:.2f}%\n"
-            result_text += f"\tAfter Bilateral Factor Rounding:\n\t\t {lower_rounded_tbl}%\n\n"
-            if lower_rounded_tbl > 0:
-                final_ratings_table.append({'value': float(lower_rounded_tbl), 'source': "Lower Ext. (Bilateral)"})
-        elif lower_l_orig or lower_r_orig:
-            result_text += "***Lower Leg (Individual Ratings - Bilateral Factor Not Applied):***\n"
-            for r_orig_val in sorted(lower_l_orig, reverse=True):
-                r = int(float(r_orig_val) + 0.5)
-                result_text += f"\tLeft Leg Disability:\n\t\t {r}%\n\n"
-                final_ratings_table.append({'value': float(r), 'source': 'Lower Leg - Left'})
-            for r_orig_val in sorted(lower_r_orig, reverse=True):
-                r = int(float(r_orig_val) + 0.5)
-                result_text += f"\tRight Leg Disability:\n\t\t {r}%\n\n"
-                final_ratings_table.append({'value': float(r), 'source': 'Lower Leg - Right'})
-            if not (lower_l_orig or lower_r_orig):
-                if lower_rounded_tbl > 0 : final_ratings_table.append({'value': float(lower_rounded_tbl), 'source': "Lower Leg"})
-
-        for r_gen_val in general_ratings_orig: final_ratings_table.append({'value': float(r_gen_val), 'source': 'General'})
-        final_ratings_table.sort(key=lambda x: x['value'], reverse=True)
-
-        table_breakdown_list = []
-        for item in final_ratings_table:
-            display_val = f"{int(item['value']+0.5)}" 
-            source_text = f" ({item['source']})" if item['source'] != 'General' else ""
-            bold_char = " " if "Ext. (Bilateral)" in item['source'] else ""
-            table_breakdown_list.append(f"{bold_char}{display_val}%{source_text}{bold_char}")
-
-        if final_ratings_table: result_text += f"***Final Combination List:***\n\t [{', '.join(table_breakdown_list)}]\n"
-        
-        ratings_for_table_math = [item['value'] for item in final_ratings_table if item['value'] > 0]
-        if not ratings_for_table_math and final_ratings_table:
-            ratings_for_table_math = [0.0] if final_ratings_table else []
-
-        combined_table_method = float(corrected_va_disability_table_method(ratings_for_table_math))
-        award_table_method = round_to_va_award(combined_table_method) 
-        result_text += f"Final Unrounded (Step-Rounded):\n\t {combined_table_method:.0f}%\n" 
-        result_text += f"Final Award:\n\t {award_table_method}%\n"
-
-        # --- Method 3: Without Bilateral Factor (for comparison) ---
-        ratings_without_any_bilateral_factor = []
-        # Use BVA method's base values (precise, then rounded) before any factor
-        if upper_l_orig or upper_r_orig: # If there were any upper ratings
-            for r in upper_l_orig + upper_r_orig:
-                 ratings_without_any_bilateral_factor.append(float(r))
-        if lower_l_orig or lower_r_orig: # If there were any lower ratings
-            for r in lower_l_orig + lower_r_orig:
-                 ratings_without_any_bilateral_factor.append(float(r))
-        ratings_without_any_bilateral_factor.extend([float(r) for r in general_ratings_orig])
-        
-        if ratings_without_any_bilateral_factor:
-            combined_no_bilateral = corrected_va_disability_precise(ratings_without_any_bilateral_factor)
-            award_no_bilateral = round_to_va_award(combined_no_bilateral)
-            if award_bva != award_no_bilateral or award_table_method != award_no_bilateral : 
-                result_text += "\n\nSee Current Rates: https://www.va.gov/disability/compensation-rates/veteran-rates/\n\n***For Comparison (Original Ratings, No Bilateral Factor Applied)***\n"
-                result_text += f"Final Award Would Be:\n\t {award_no_bilateral}%\n"
-        
-        self.last_result_text = result_text
+    def _show_report(self, report: ClaimReport):
+        self.last_report = report
         self.result_text_area.config(state=tk.NORMAL)
         self.result_text_area.delete('1.0', tk.END)
-        self.result_text_area.insert(tk.END, self.last_result_text)
+        self.result_text_area.insert(tk.END, report.render('text'))
         self.result_text_area.config(state=tk.DISABLED)
         
         if hasattr(self, 'copy_button'): 
              self.copy_button.config(state=tk.NORMAL)
 
-if __name__ == "__main__":
+    def _submit(self, kind: str, job: Callable[..., Any], state: IncrementalClaim):
+        """Starts job on a snapshot of the claim; what it computes is handed back to claim_state when it finishes."""
+        self._job_states[kind] = state
+        self.calculator.submit(kind, job, state)
+        self._schedule_poll()
+
+    def _schedule_poll(self):
+        if self._poll_id is None:
+            self._poll_id = self.master.after(self.POLL_MS, self._poll_calculations)
+
+    def _poll_calculations(self):
+        """Applies finished background results and keeps the progress bar current; reschedules itself while jobs are pending."""
+        self._poll_id = None
+        for kind, status, value in self.calculator.poll():
+            if status == 'done':
+                # The snapshot's bilateral results and score are reused for the groups that have not changed since.
+                self.claim_state.adopt(self._job_states.pop(kind))
+            elif status == 'error':
+                self._job_states.pop(kind, None)
+            if status == 'progress':
+                self.progress_bar['value'] = value * 100
+            elif status == 'error':
+                messagebox.showerror("Calculation Failed", f"The calculation could not be completed:\n{value}")
+            elif kind == 'report':
+                self._show_report(value)
+            elif self.live_results.get():
+                self.live_label.config(text=f"Live: BVA-Accurate {value.award_bva}%  |  Table Method {value.award_table}%")
+        if self.calculator.pending('report') and time.perf_counter() - self._calculation_started >= self.PROGRESS_DELAY:
+            self.progress_bar.pack(side=tk.LEFT, padx=10)
+        else:
+            self.progress_bar.pack_forget()
+        if self.calculator.pending():
+            self._schedule_poll()
+
+# --- Command-line batch scoring ---
+CLAIM_FIELDS = ('general', 'upper_left', 'upper_right', 'lower_left', 'lower_right')
+SCORE_FIELDS = ('claim_id', 'award_bva', 'award_table', 'award_no_bilateral',
+                'combined_bva', 'combined_table', 'combined_no_bilateral',
+                'upper_factor_bva', 'lower_factor_bva', 'upper_factor_table', 'lower_factor_table', 'error')
+
+def parse_ratings(value: Any) -> List[float]:
+    """Accepts a JSON list of numbers or a GUI-style space-separated string. Ratings must be within 0-100."""
+    if value is None or value == '':
+        return []
+    if isinstance(value, (int, float)):
+        value = [value]
+    ratings = list(map(float, value.split() if isinstance(value, str) else value))
+    if not all(0 <= rating <= 100 for rating in ratings):
+        bad = next(rating for rating in ratings if not 0 <= rating <= 100)
+        raise ValueError(f"Rating '{bad}' is out of range (0-100).")
+    return ratings
+
+def parse_claim_record(record: Dict[str, Any]) -> ClaimRatings:
+    return ClaimRatings(*(parse_ratings(record.get(field)) for field in CLAIM_FIELDS))
+
+def _json_records(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            record = {'_error': f"Invalid JSON: {exc}"}
+        yield record if isinstance(record, dict) else {'_error': "Record is not a JSON object."}
+
+def read_claim_records(stream: TextIO, input_format: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yields one raw record per claim, reading the stream lazily. Records without a claim_id get their
+    1-based position. Lines that cannot be read still yield a record, carrying the reason under '_error'.
+    """
+    records = csv.DictReader(stream) if input_format == 'csv' else _json_records(stream)
+    for number, record in enumerate(records, 1):
+        if not record.get('claim_id'):
+            record['claim_id'] = str(number)
+        yield record
+
+def iter_chunks(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def score_to_row(claim_id: str, score: ClaimScore) -> tuple:
+    """One output row, in SCORE_FIELDS order."""
+    return (claim_id, score.award_bva, score.award_table, score.award_no_bilateral,
+            score.combined_bva, score.combined_table, score.combined_no_bilateral,
+            score.upper_bva.factor, score.lower_bva.factor, score.upper_table.factor, score.lower_table.factor, None)
+
+def error_row(claim_id: str, error: Exception) -> tuple:
+    return (claim_id,) + (None,) * (len(SCORE_FIELDS) - 2) + (str(error),)
+
+def score_record_chunk(chunk: List[Dict[str, Any]]) -> List[tuple]:
+    """
+    Scores one chunk of raw records through score_claims_batch. A record that cannot be parsed
+    or scored gets an error row instead; the rest of the chunk is unaffected.
+    """
+    rows: List[Optional[tuple]] = [None] * len(chunk)
+    claims, positions = ClaimColumns(), []
+    start = time.perf_counter_ns() if SCORING_STATS.enabled else 0
+    for position, record in enumerate(chunk):
+        try:
+            if '_error' in record:
+                raise ValueError(record['_error'])
+            claims.append_claim(parse_claim_record(record))
+            positions.append(position)
+        except (ValueError, TypeError) as exc:
+            rows[position] = error_row(record['claim_id'], exc)
+    if start:
+        SCORING_STATS.record('parse', start, len(chunk))
+
+    for position, score in zip(positions, _score_columns(claims)):
+        claim_id = chunk[position]['claim_id']
+        rows[position] = error_row(claim_id, score) if isinstance(score, Exception) else score_to_row(claim_id, score)
+    return rows
+
+def _score_columns(claims: ClaimColumns) -> List[Any]:
+    """CLAIM_SCORE_CACHE.score_batch, except that a claim which cannot be scored gets its exception in place of a score."""
+    try:
+        return CLAIM_SCORE_CACHE.score_batch(claims)
+    except Exception:
+        # Find the culprit(s) by scoring the chunk one claim at a time; reading a corrupt claim fails too.
+        scores: List[Any] = []
+        for index in range(len(claims)):
+            try:
+                scores.append(score_claim(claims[index]))
+            except Exception as exc:
+                scores.append(exc)
+        return scores
+
+def score_caseload_slice(caseload: "CaseloadFile", start: int, stop: int, positions: Optional[List[int]] = None) -> List[tuple]:
+    """
+    Scores claims start..stop of a binary caseload straight from its records; there is nothing to parse.
+    With positions, only those claims of the range (counted from start) are scored, in that order.
+    """
+    columns = caseload.columns(start, stop)
+    indices: Sequence[int] = range(start, stop)
+    if positions is not None:
+        columns = columns.take(positions)
+        indices = [start + position for position in positions]
+    return [error_row(caseload.claim_id(index), score) if isinstance(score, Exception) else score_to_row(caseload.claim_id(index), score)
+            for index, score in zip(indices, _score_columns(columns))]
+
+def _score_caseload_task(task: Tuple[str, int, int, Optional[List[int]]]) -> List[tuple]:
+    """score_caseload_slice for a (path, start, stop, positions) task; each worker maps the file itself, so no records are pickled."""
+    path, start, stop, positions = task
+    with CaseloadFile(path) as caseload:
+        return score_caseload_slice(caseload, start, stop, positions)
+
+def ordered_parallel_map(function: Callable[[Any], Any], items: Iterable[Any], workers: int,
+                         initializer: Optional[Callable[..., None]] = None, initargs: tuple = ()) -> Iterator[Any]:
+    """
+    Like map(), but runs function across a process pool. Results come back in input order and at most
+    two items per worker are in flight, so a lazy input is never read far ahead of the output.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        pending: collections.deque = collections.deque()
+        for item in items:
+            pending.append(pool.submit(function, item))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def _init_score_worker(cache_size: int, collect_stats: bool):
+    CLAIM_SCORE_CACHE.resize(cache_size)
+    if collect_stats:
+        SCORING_STATS.enable()
+
+def _score_with_stats(job: Tuple[Callable[[Any], List[tuple]], Any]) -> Tuple[List[tuple], Dict[str, Any]]:
+    """function(argument) in a worker, also handing back (and resetting) the worker's stats for this chunk."""
+    function, argument = job
+    before = CLAIM_SCORE_CACHE.stats()
+    rows = function(argument)
+    snapshot = SCORING_STATS.snapshot()
+    snapshot['cache'] = {name: snapshot['cache'][name] - before[name] for name in ('hits', 'misses', 'evictions')}
+    SCORING_STATS.reset()
+    return rows, snapshot
+
+def _merge_worker_stats(results: Iterator[Tuple[List[tuple], Dict[str, Any]]]) -> Iterator[List[tuple]]:
+    for rows, snapshot in results:
+        SCORING_STATS.merge(snapshot)
+        yield rows
+
+def score_record_chunks(records: Iterable[Dict[str, Any]], chunk_size: int = 4096, workers: int = 1,
+                        store: Optional["ScoreStore"] = None) -> Iterator[List[tuple]]:
+    """
+    Scores records a chunk at a time, yielding one list of result rows per chunk in input order.
+    With a store, claims it already holds a result for are answered from it and only the rest are scored.
+    """
+    chunks = iter_chunks(records, chunk_size)
+    if store is not None:
+        return store.rescore_chunks(chunks, lambda pending: _score_chunks(pending, workers))
+    return _score_chunks(chunks, workers)
+
+def _score_chunks(chunks: Iterable[List[Dict[str, Any]]], workers: int) -> Iterator[List[tuple]]:
+    return _map_scoring(score_record_chunk, chunks, workers)
+
+def _map_scoring(function: Callable[[Any], List[tuple]], items: Iterable[Any], workers: int) -> Iterator[List[tuple]]:
+    """map(function, items), on a process pool of scoring workers when workers is above 1."""
+    if workers > 1:
+        initargs = (CLAIM_SCORE_CACHE.maxsize, SCORING_STATS.enabled)
+        if SCORING_STATS.enabled:
+            return _merge_worker_stats(ordered_parallel_map(_score_with_stats, ((function, item) for item in items), workers,
+                                                            initializer=_init_score_worker, initargs=initargs))
+        return ordered_parallel_map(function, items, workers, initializer=_init_score_worker, initargs=initargs)
+    return map(function, items)
+
+def score_caseload(path: str, sink: TextIO, output_format: str = 'csv', chunk_size: int = 4096, workers: int = 1,
+                   store: Optional["ScoreStore"] = None) -> Tuple[int, int]:
+    """score_stream for a binary caseload file: chunks are claim ranges read straight from the mapped file."""
+    with CaseloadFile(path) as caseload:
+        count = len(caseload)
+        ranges = ((start, min(start + chunk_size, count)) for start in range(0, count, chunk_size))
+
+        def score_ranges(tasks: Iterable[Tuple[int, int, Optional[List[int]]]]) -> Iterator[List[tuple]]:
+            if workers > 1:
+                return _map_scoring(_score_caseload_task, ((path,) + task for task in tasks), workers)
+            return (score_caseload_slice(caseload, *task) for task in tasks)
+
+        if store is not None:
+            results = store.rescore_chunks(ranges, score_ranges, identify=lambda chunk: caseload_chunk_hashes(caseload, *chunk),
+                                           select=lambda chunk, positions: chunk + (positions,))
+        else:
+            results = score_ranges(chunk + (None,) for chunk in ranges)
+        written, failed = 0, 0
+        for chunk_number, rows in enumerate(results):
+            sink.write(format_rows(rows, output_format, header=chunk_number == 0))
+            written += len(rows)
+            failed += sum(1 for row in rows if row[-1] is not None)
+    if written == 0 and output_format == 'csv':
+        sink.write(format_rows([], output_format, header=True))
+    sink.flush()
+    return written, failed
+
+def format_rows(rows: List[tuple], output_format: str, header: bool = False) -> str:
+    """Renders a chunk of result rows as one string so it can be written in a single call."""
+    if output_format == 'jsonl':
+        return ''.join(json.dumps(dict(zip(SCORE_FIELDS, row))) + '\n' for row in rows)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    if header:
+        writer.writerow(SCORE_FIELDS)
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+def score_stream(source: TextIO, sink: TextIO, input_format: str = 'csv', output_format: str = 'csv',
+                 chunk_size: int = 4096, workers: int = 1, store: Optional["ScoreStore"] = None) -> Tuple[int, int]:
+    """
+    Streams claims from source to sink with memory bounded by chunk_size (times the worker count).
+    Returns the number of records written and how many of them are error rows.
+    """
+    written, failed = 0, 0
+    records = read_claim_records(source, input_format)
+    for chunk_number, rows in enumerate(score_record_chunks(records, chunk_size, workers, store)):
+        sink.write(format_rows(rows, output_format, header=chunk_number == 0))
+        written += len(rows)
+        failed += sum(1 for row in rows if row[-1] is not None)
+    if written == 0 and output_format == 'csv':
+        sink.write(format_rows([], output_format, header=True))
+    sink.flush()
+    return written, failed
+
+def _infer_format(path: str, default: str = 'csv') -> str:
+    if path.lower().endswith(('.jsonl', '.ndjson', '.json')):
+        return 'jsonl'
+    if path.lower().endswith('.csv'):
+        return 'csv'
+    if path.lower().endswith(CASELOAD_SUFFIX):
+        return 'vacl'
+    return default
+
+def _open_input(path: str) -> TextIO:
+    if path == '-':
+        return io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', newline='')
+    return open(path, encoding='utf-8', newline='', buffering=1 << 20)
+
+def _open_output(path: str) -> TextIO:
+    return sys.stdout if path == '-' else open(path, 'w', encoding='utf-8', newline='', buffering=1 << 20)
+
+def _close_streams(source: TextIO, sink: TextIO):
+    if source.buffer is sys.stdin.buffer: source.detach()
+    else: source.close()
+    if sink is not sys.stdout: sink.close()
+
+def _run_score(args: argparse.Namespace) -> int:
+    input_format = args.format or _infer_format(args.input)
+    if input_format == 'vacl':
+        return _run_score_caseload(args)
+    output_format = args.output_format or (_infer_format(args.output, input_format) if args.output != '-' else input_format)
+    source, sink = _open_input(args.input), _open_output(args.output)
+    workers = args.workers or os.cpu_count() or 1
+    CLAIM_SCORE_CACHE.resize(args.cache_size)
+    store = ScoreStore(args.store) if args.store else None
+    if args.stats or args.profile:
+        SCORING_STATS.enable(profile=bool(args.profile))
+    try:
+        written, failed = score_stream(source, sink, input_format, output_format, args.chunk_size, workers, store)
+    finally:
+        _close_streams(source, sink)
+        SCORING_STATS.disable()
+        if store is not None:
+            store.close()
+    if store is not None:
+        print(f"store: {store.skipped} unchanged claims skipped, {store.rescored} new or changed claims rescored, "
+              f"{store.duplicates} repeated within this run (rules {store.rules_version}).", file=sys.stderr)
+    if args.stats:
+        print(json.dumps(SCORING_STATS.snapshot(), indent=2), file=sys.stderr)
+    if args.profile:
+        SCORING_STATS.profiler.dump_stats(args.profile)
+    if failed:
+        print(f"warning: {failed} of {written} claims could not be scored; see the 'error' column.", file=sys.stderr)
+    return 0
+
+def _run_score_caseload(args: argparse.Namespace) -> int:
+    if args.input == '-':
+        print("error: a binary caseload must be a file.", file=sys.stderr)
+        return 2
+    output_format = args.output_format or (_infer_format(args.output) if args.output != '-' else 'csv')
+    sink = _open_output(args.output)
+    workers = args.workers or os.cpu_count() or 1
+    CLAIM_SCORE_CACHE.resize(args.cache_size)
+    store = ScoreStore(args.store) if args.store else None
+    if args.stats or args.profile:
+        SCORING_STATS.enable(profile=bool(args.profile))
+    try:
+        written, failed = score_caseload(args.input, sink, output_format, args.chunk_size, workers, store)
+    except ValueError as exc:  # not a caseload, or its claim index is corrupt
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        if sink is not sys.stdout: sink.close()
+        SCORING_STATS.disable()
+        if store is not None:
+            store.close()
+    if store is not None:
+        print(f"store: {store.skipped} unchanged claims skipped, {store.rescored} new or changed claims rescored, "
+              f"{store.duplicates} repeated within this run (rules {store.rules_version}).", file=sys.stderr)
+    if args.stats:
+        print(json.dumps(SCORING_STATS.snapshot(), indent=2), file=sys.stderr)
+    if args.profile:
+        SCORING_STATS.profiler.dump_stats(args.profile)
+    if failed:
+        print(f"warning: {failed} of {written} claims could not be scored; see the 'error' column.", file=sys.stderr)
+    return 0
+
+def _run_pack(args: argparse.Namespace) -> int:
+    source = _open_input(args.input)
+    packed, unreadable = 0, 0
+
+    def claims() -> Iterator[Tuple[str, ClaimRatings]]:
+        nonlocal packed, unreadable
+        for record in read_claim_records(source, args.format or _infer_format(args.input)):
+            try:
+                if '_error' in record: raise ValueError(record['_error'])
+                claim = parse_claim_record(record)
+            except (ValueError, TypeError) as exc:
+                unreadable += 1
+                print(f"skipped claim {record.get('claim_id')!r}: {exc}", file=sys.stderr)
+                continue
+            packed += 1
+            yield record['claim_id'], claim
+    try:
+        write_caseload(args.output, claims())
+    finally:
+        _close_streams(source, sys.stdout)
+    print(f"packed {packed} claims into {args.output}" + (f"; {unreadable} unreadable claims skipped" if unreadable else "") + ".", file=sys.stderr)
+    return 0
+
+def thresholds_to_record(claim_id: str, thresholds: NextAwardThresholds) -> Dict[str, Any]:
+    record: Dict[str, Any] = {'claim_id': claim_id}
+    for report in thresholds:
+        record[report.method] = {'award': report.award, 'target_award': report.target_award,
+                                 'raises': [change._asdict() for change in report.raises],
+                                 'additions': [change._asdict() for change in report.additions]}
+    return record
+
+def _run_thresholds(args: argparse.Namespace) -> int:
+    input_format = args.format or _infer_format(args.input)
+    source, sink = _open_input(args.input), _open_output(args.output)
+    try:
+        for chunk in iter_chunks(read_claim_records(source, input_format), args.chunk_size):
+            lines = []
+            for record in chunk:
+                try:
+                    if '_error' in record: raise ValueError(record['_error'])
+                    result = thresholds_to_record(record['claim_id'], next_award_thresholds(parse_claim_record(record), args.step))
+                except (ValueError, TypeError) as exc:
+                    result = {'claim_id': record['claim_id'], 'error': str(exc)}
+                lines.append(json.dumps(result) + '\n')
+            sink.write(''.join(lines))
+        sink.flush()
+    finally:
+        _close_streams(source, sink)
+    return 0
+
+CHECK_FIELDS = ('claim_id', 'method', 'combined', 'exact_combined', 'award', 'exact_award')
+
+def _run_check(args: argparse.Namespace) -> int:
+    input_format = args.format or _infer_format(args.input)
+    output_format = args.output_format or (_infer_format(args.output, input_format) if args.output != '-' else input_format)
+    source, sink = _open_input(args.input), _open_output(args.output)
+    checked, unreadable, differing = 0, 0, 0
+    try:
+        if output_format == 'csv':
+            sink.write(','.join(CHECK_FIELDS) + '\n')
+        for chunk in iter_chunks(read_claim_records(source, input_format), args.chunk_size):
+            claims, claim_ids = [], []
+            for record in chunk:
+                try:
+                    if '_error' in record: raise ValueError(record['_error'])
+                    claims.append(parse_claim_record(record))
+                    claim_ids.append(record['claim_id'])
+                except (ValueError, TypeError):
+                    unreadable += 1
+            rows = [(claim_ids[index], method, getattr(score, 'combined_' + method), str(getattr(exact, 'combined_' + method)),
+                     getattr(score, 'award_' + method), getattr(exact, 'award_' + method))
+                    for index, method, score, exact in exact_award_differences(claims)]
+            if output_format == 'jsonl':
+                sink.write(''.join(json.dumps(dict(zip(CHECK_FIELDS, row))) + '\n' for row in rows))
+            else:
+                csv.writer(sink, lineterminator='\n').writerows(rows)
+            checked += len(claims)
+            differing += len({row[0] for row in rows})
+        sink.flush()
+    finally:
+        _close_streams(source, sink)
+    print(f"checked {checked} claims: {differing} with float/exact award differences"
+          + (f", {unreadable} unreadable" if unreadable else "") + ".", file=sys.stderr)
+    return 1 if differing else 0
+
+# --- Incremental re-scoring ---
+# Stored results are only reused under the same rules version. Bump this whenever a change to the
+# precise, table or bilateral rules -- scalar or vectorized (score_batch) -- can change a stored result.
+SCORING_RULES_VERSION = '1'
+
+def claim_content_hash(claim: ClaimRatings) -> bytes:
+    """128-bit hash of the claim's canonical rating set (ClaimScoreCache.canonical_key)."""
+    return _canonical_key_hash(ClaimScoreCache.canonical_key(claim))
+
+def _canonical_key_hash(key: tuple) -> bytes:
+    import hashlib
+    return hashlib.blake2b(repr(key).encode('ascii'), digest_size=16).digest()
+
+def record_chunk_hashes(chunk: List[Dict[str, Any]]) -> Tuple[List[str], List[Optional[bytes]]]:
+    """Claim ids and content hashes of a chunk of raw records; a record that cannot be parsed has no hash."""
+    hashes: List[Optional[bytes]] = []
+    for record in chunk:
+        try:
+            if '_error' in record: raise ValueError(record['_error'])
+            hashes.append(claim_content_hash(parse_claim_record(record)))
+        except (ValueError, TypeError):
+            hashes.append(None)
+    return [record['claim_id'] for record in chunk], hashes
+
+def caseload_chunk_hashes(caseload: "CaseloadFile", start: int, stop: int) -> Tuple[List[str], List[Optional[bytes]]]:
+    """
+    Claim ids and content hashes of claims start..stop of a binary caseload, hashed from
+    ClaimColumns.canonical_keys() -- the same hashes record_chunk_hashes gives the same claims.
+    A claim with corrupt records has no hash.
+    """
+    try:
+        keys: List[Optional[tuple]] = list(caseload.columns(start, stop).canonical_keys())
+    except ValueError:  # find the corrupt claims one at a time
+        keys = []
+        for index in range(start, stop):
+            try:
+                keys.append(ClaimScoreCache.canonical_key(caseload[index]))
+            except ValueError:
+                keys.append(None)
+    return ([caseload.claim_id(index) for index in range(start, stop)],
+            [None if key is None else _canonical_key_hash(key) for key in keys])
+
+class ScoreStore:
+    """
+    Persistent score results in SQLite, keyed by claim content hash and rules version. A re-run
+    over a stored caseload scores only claims whose ratings are new or changed; when the rules
+    version changes nothing matches and every claim is scored again. Counts are taken against the
+    store as it was when the run started: skipped claims were already stored, rescored claims were
+    scored and added, and duplicates repeat a claim first seen earlier in the same run. Each row
+    records the run that stored it, so telling the last two apart needs no memory beyond the
+    chunks still being scored.
+    """
+    _LOOKUP_BATCH = 900  # stays under SQLite's bound-parameter limit (999 before 3.32)
+
+    def __init__(self, path: str, rules_version: Optional[str] = None):
+        self.rules_version = rules_version or SCORING_RULES_VERSION
+        self._db = sqlite3.connect(path)
+        self._db.execute("CREATE TABLE IF NOT EXISTS scores (content_hash BLOB NOT NULL, rules_version TEXT NOT NULL, "
+                         "result TEXT NOT NULL, run INTEGER NOT NULL DEFAULT 0, "
+                         "PRIMARY KEY (content_hash, rules_version)) WITHOUT ROWID")
+        if 'run' not in {column[1] for column in self._db.execute("PRAGMA table_info(scores)")}:
+            self._db.execute("ALTER TABLE scores ADD COLUMN run INTEGER NOT NULL DEFAULT 0")  # a store from before runs were recorded
+        self._db.execute("CREATE TABLE IF NOT EXISTS runs (id INTEGER PRIMARY KEY AUTOINCREMENT, rules_version TEXT NOT NULL)")
+        self.run = self._db.execute("INSERT INTO runs (rules_version) VALUES (?)", (self.rules_version,)).lastrowid
+        self._db.commit()
+        self.skipped = 0
+        self.rescored = 0
+        self.duplicates = 0
+
+    def lookup(self, hashes: Sequence[bytes]) -> Dict[bytes, Tuple[tuple, int]]:
+        """Stored result rows (SCORE_FIELDS without claim_id and error), and the run that stored each, for those hashes that have one."""
+        found: Dict[bytes, Tuple[tuple, int]] = {}
+        for start in range(0, len(hashes), self._LOOKUP_BATCH):
+            batch = hashes[start:start + self._LOOKUP_BATCH]
+            query = (f"SELECT content_hash, result, run FROM scores WHERE rules_version = ? "
+                     f"AND content_hash IN ({','.join('?' * len(batch))})")
+            for content_hash, result, run in self._db.execute(query, (self.rules_version, *batch)):
+                found[content_hash] = (tuple(json.loads(result)), run)
+        return found
+
+    def store(self, results: Iterable[Tuple[bytes, tuple]]):
+        self._db.executemany("INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?)",
+                             ((content_hash, self.rules_version, json.dumps(result), self.run) for content_hash, result in results))
+        self._db.commit()
+
+    def rescore_chunks(self, chunks: Iterable[Any], score_chunks: Callable[[Iterator[Any]], Iterator[List[tuple]]],
+                       identify: Callable[[Any], Tuple[List[str], List[Optional[bytes]]]] = record_chunk_hashes,
+                       select: Callable[[Any, List[int]], Any] = lambda chunk, positions: [chunk[position] for position in positions]
+                       ) -> Iterator[List[tuple]]:
+        """
+        Answers each chunk's stored claims here and passes only the rest on to score_chunks
+        (which may run them on a process pool), then stores the new results in input order.
+        A chunk is a list of raw records by default; identify gives a chunk's claim ids and
+        content hashes, and select(chunk, positions) the part of it still to be scored.
+        """
+        plans: collections.deque = collections.deque()
+        in_flight: Set[bytes] = set()  # first seen in a chunk that is planned but not yet stored
+
+        def pending_chunks() -> Iterator[Any]:
+            for chunk in chunks:
+                claim_ids, hashes = identify(chunk)  # a claim without a hash is scored anyway, so the output gets its error row
+                found = self.lookup(list(dict.fromkeys(content_hash for content_hash in hashes if content_hash is not None)))
+                rows: List[Optional[tuple]] = [None] * len(hashes)
+                positions = []
+                first_seen = []
+                for position, (claim_id, content_hash) in enumerate(zip(claim_ids, hashes)):
+                    # A claim seen earlier in this run is either stored under this run or still in
+                    # flight, whichever way score_chunks is pacing, so the counts never vary with it.
+                    stored = found.get(content_hash)
+                    if content_hash in in_flight or (stored is not None and stored[1] == self.run):
+                        self.duplicates += 1
+                    elif stored is not None:
+                        self.skipped += 1
+                    elif content_hash is not None:
+                        in_flight.add(content_hash)
+                        first_seen.append(content_hash)
+                        self.rescored += 1
+                    if stored is not None:
+                        rows[position] = (claim_id,) + stored[0] + (None,)
+                    else:
+                        positions.append(position)
+                plans.append((rows, positions, hashes, first_seen))
+                yield select(chunk, positions)
+
+        for scored in score_chunks(pending_chunks()):
+            rows, positions, hashes, first_seen = plans.popleft()
+            results = []
+            for position, row in zip(positions, scored):
+                rows[position] = row
+                if row[-1] is None and hashes[position] is not None:
+                    results.append((hashes[position], row[1:-1]))
+            self.store(results)
+            in_flight.difference_update(first_seen)  # now found in the store under this run
+            yield rows
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM scores WHERE rules_version = ?", (self.rules_version,)).fetchone()[0]
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self) -> "ScoreStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# --- Method-disagreement explorer ---
+EXPLORE_RATINGS = tuple(range(100, 0, -10))
+EXPLORE_KINDS = ('methods', 'bilateral')  # award_bva vs award_table, award_bva vs award_no_bilateral
+_EXPLORE_MAGIC = b'VADX'
+_EXPLORE_HEADER = struct.Struct('<4sHHI')      # magic, version, record width, parameter JSON length
+_EXPLORE_ENTRY = struct.Struct('<BBBxQQ')      # kind, first award, second award, block offset, record count
+
+class Disagreement(NamedTuple):
+    claim: ClaimRatings
+    award_bva: int
+    award_table: int
+    award_no_bilateral: int
+
+class ExploreResult(NamedTuple):
+    max_ratings: int
+    max_pairs: int
+    visited: int
+    pruned: int
+    blocks: Dict[Tuple[int, int, int], bytearray]  # (kind, award, award) -> packed records
+
+    def counts(self) -> Dict[str, int]:
+        width = self.max_ratings + 3
+        return {kind: sum(len(block) // width for (index, _, _), block in self.blocks.items() if index == number)
+                for number, kind in enumerate(EXPLORE_KINDS)}
+
+def _explore_pairs(max_ratings: int, max_pairs: int,
+                   values: Sequence[float] = EXPLORE_RATINGS) -> Iterator[Tuple[Tuple[Tuple[float, ...], Tuple[float, ...]], ...]]:
+    """
+    Every bilateral layout up to the limits, once each, smallest first and generated lazily. Left/right
+    and upper/lower are scored symmetrically and a one-sided extremity scores like general ratings, so
+    only layouts with both sides rated, left >= right and first pair >= second pair are produced.
+    values must be in descending order.
+    """
+    values = tuple(map(float, values))
+
+    def pairs(size: int) -> Iterator[Tuple[Tuple[float, ...], Tuple[float, ...]]]:
+        for left_size in range(1, size):
+            for left in itertools.combinations_with_replacement(values, left_size):
+                for right in itertools.combinations_with_replacement(values, size - left_size):
+                    if left >= right:
+                        yield left, right
+
+    yield ()
+    if max_pairs >= 1:
+        for size in range(2, max_ratings + 1):
+            for pair in pairs(size):
+                yield (pair,)
+    if max_pairs >= 2:
+        for size in range(4, max_ratings + 1):
+            for first_size in range(2, size - 1):
+                for first in pairs(first_size):
+                    for second in pairs(size - first_size):
+                        if first >= second:
+                            yield (first, second)
+
+def _explore_tasks(max_ratings: int, max_pairs: int) -> Iterator[tuple]:
+    """One task per bilateral layout and highest general rating (0 for no general ratings)."""
+    for pairs in _explore_pairs(max_ratings, max_pairs):
+        budget = max_ratings - sum(len(left) + len(right) for left, right in pairs)
+        if pairs:
+            yield pairs, 0, budget
+        if budget:
+            for top in EXPLORE_RATINGS:
+                yield pairs, top, budget
+
+def _explore_chunk(tasks: List[tuple]) -> Tuple[int, int, Dict[Tuple[int, int, int], bytes]]:
+    """
+    Scores every claim under a chunk of tasks, adding general ratings in descending order. The bilateral
+    layout is fixed per task, so its pairs are processed once. Adding a rating never lowers an award,
+    so once all three awards are 100 the rest of that branch is skipped.
+    """
+    visited, pruned = 0, 0
+    blocks: Dict[Tuple[int, int, int], bytearray] = collections.defaultdict(bytearray)
+    for pairs, top, budget in tasks:
+        max_ratings = budget + sum(len(left) + len(right) for left, right in pairs)
+        extremities = [[], [], [], []]
+        prefix = bytearray()
+        for number, (left, right) in enumerate(pairs):
+            extremities[2 * number], extremities[2 * number + 1] = list(left), list(right)
+            prefix += bytes(((2 * number + 1) << 4) | int(r) // 10 for r in left)
+            prefix += bytes(((2 * number + 2) << 4) | int(r) // 10 for r in right)
+        upper_l, upper_r, lower_l, lower_r = extremities
+        bilateral = (process_bilateral_bva(upper_l, upper_r), process_bilateral_bva(lower_l, lower_r),
+                     process_bilateral_table(upper_l, upper_r), process_bilateral_table(lower_l, lower_r))
+        stack = [(float(top),)] if top else [()]
+        while stack:
+            general = stack.pop()
+            score = combine_claim(ClaimRatings(list(general), *extremities), *bilateral)
+            visited += 1
+            awards = (score.award_bva, score.award_table, score.award_no_bilateral)
+            if score.award_bva != score.award_table or score.award_bva != score.award_no_bilateral:
+                record = prefix + bytes(int(r) // 10 for r in general)
+                record += bytes(max_ratings - len(record)) + bytes(awards)
+                if score.award_bva != score.award_table:
+                    blocks[(0, score.award_bva, score.award_table)] += record
+                if score.award_bva != score.award_no_bilateral:
+                    blocks[(1, score.award_bva, score.award_no_bilateral)] += record
+            if awards == (100, 100, 100):
+                pruned += 1
+            elif general and len(general) < budget:
+                stack.extend(general + (float(r),) for r in EXPLORE_RATINGS if r <= general[-1])
+    return visited, pruned, blocks
+
+def explore_disagreements(max_ratings: int = 5, max_pairs: int = 2, workers: int = 1, chunk_size: int = 256) -> ExploreResult:
+    """
+    Scores every claim of up to max_ratings ratings (multiples of 10), with up to max_pairs bilateral
+    pairs, and collects each one where the BVA award differs from the table award or from the
+    no-bilateral award. Tasks are spread over a process pool when workers is above 1.
+    """
+    chunks = iter_chunks(_explore_tasks(max_ratings, max_pairs), chunk_size)
+    results = ordered_parallel_map(_explore_chunk, chunks, workers) if workers > 1 else map(_explore_chunk, chunks)
+    visited, pruned = 0, 0
+    blocks: Dict[Tuple[int, int, int], bytearray] = collections.defaultdict(bytearray)
+    for chunk_visited, chunk_pruned, chunk_blocks in results:
+        visited += chunk_visited
+        pruned += chunk_pruned
+        for key, block in chunk_blocks.items():
+            blocks[key] += block
+    return ExploreResult(max_ratings, max_pairs, visited, pruned, dict(blocks))
+
+def write_disagreement_index(path: str, result: ExploreResult):
+    """
+    Writes the disagreements as a header, a directory of (kind, award, award) blocks and the blocks
+    themselves. Each record is max_ratings bytes of (group << 4 | rating // 10), zero-padded, then
+    the BVA, table and no-bilateral awards as one byte each.
+    """
+    params = json.dumps({'max_ratings': result.max_ratings, 'max_pairs': result.max_pairs, 'visited': result.visited,
+                         'pruned': result.pruned, 'counts': result.counts()}).encode('utf-8')
+    keys = sorted(result.blocks)
+    offset = _EXPLORE_HEADER.size + len(params) + 4 + _EXPLORE_ENTRY.size * len(keys)
+    width = result.max_ratings + 3
+    with open(path, 'wb') as handle:
+        handle.write(_EXPLORE_HEADER.pack(_EXPLORE_MAGIC, 1, width, len(params)) + params + struct.pack('<I', len(keys)))
+        for key in keys:
+            handle.write(_EXPLORE_ENTRY.pack(*key, offset, len(result.blocks[key]) // width))
+            offset += len(result.blocks[key])
+        for key in keys:
+            handle.write(result.blocks[key])
+
+class DisagreementIndex:
+    """Reads a file from write_disagreement_index; only the directory is loaded, and queries read one block."""
+    def __init__(self, path: str):
+        self._handle = open(path, 'rb')
+        magic, version, self.width, length = _EXPLORE_HEADER.unpack(self._handle.read(_EXPLORE_HEADER.size))
+        if magic != _EXPLORE_MAGIC or version != 1:
+            self._handle.close()
+            raise ValueError(f"{path} is not a disagreement index")
+        self.params: Dict[str, Any] = json.loads(self._handle.read(length))
+        count, = struct.unpack('<I', self._handle.read(4))
+        self.directory: Dict[Tuple[str, int, int], Tuple[int, int]] = {}
+        for _ in range(count):
+            kind, first, second, offset, records = _EXPLORE_ENTRY.unpack(self._handle.read(_EXPLORE_ENTRY.size))
+            self.directory[(EXPLORE_KINDS[kind], first, second)] = (offset, records)
+
+    def close(self):
+        self._handle.close()
+
+    def __enter__(self) -> "DisagreementIndex":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def pairs(self, kind: Optional[str] = None) -> List[Tuple[str, int, int, int]]:
+        """(kind, BVA award, other award, count) for every award pair present."""
+        return [(key[0], key[1], key[2], records) for key, (_, records) in self.directory.items() if kind in (None, key[0])]
+
+    def query(self, kind: str, award_bva: int, other_award: int) -> Iterator[Disagreement]:
+        """Every claim where the BVA award is award_bva and the table (kind 'methods') or no-bilateral ('bilateral') award is other_award."""
+        offset, records = self.directory.get((kind, award_bva, other_award), (0, 0))
+        if not records:
+            return
+        self._handle.seek(offset)
+        block = self._handle.read(records * self.width)
+        for start in range(0, len(block), self.width):
+            record = block[start:start + self.width]
+            groups: List[List[float]] = [[], [], [], [], []]
+            for code in record[:-3]:
+                if code:
+                    groups[code >> 4].append(float((code & 15) * 10))
+            yield Disagreement(ClaimRatings(*groups), *record[-3:])
+
+def _run_explore(args: argparse.Namespace) -> int:
+    workers = args.workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    result = explore_disagreements(args.max_ratings, args.max_pairs, workers)
+    write_disagreement_index(args.output, result)
+    counts = result.counts()
+    print(f"scored {result.visited} claims in {time.perf_counter() - started:.1f}s ({result.pruned} branches cut at 100%): "
+          f"{counts['methods']} BVA/table and {counts['bilateral']} BVA/no-bilateral disagreements written to {args.output}.", file=sys.stderr)
+    return 0
+
+def _run_explore_query(args: argparse.Namespace) -> int:
+    with DisagreementIndex(args.index) as index:
+        if args.pair is None:
+            for kind, first, second, records in index.pairs(args.kind):
+                print(f"{kind},{first},{second},{records}")
+            return 0
+        if len(args.pair) != 2:
+            print("error: --pair takes two awards, e.g. 70,80", file=sys.stderr)
+            return 2
+        sink = _open_output(args.output)
+        try:
+            for disagreement in itertools.islice(index.query(args.kind or 'methods', *args.pair), args.limit):
+                claim = {field: ratings for field, ratings in disagreement.claim._asdict().items() if ratings}
+                sink.write(json.dumps({'claim': claim, 'award_bva': disagreement.award_bva, 'award_table': disagreement.award_table,
+                                       'award_no_bilateral': disagreement.award_no_bilateral}) + '\n')
+            sink.flush()
+        finally:
+            if sink is not sys.stdout:
+                sink.close()
+    return 0
+
+# --- Reverse award search ---
+def find_rating_sets(target_award: int, method: str = 'bva', max_ratings: int = 4, step: int = 10,
+                     bilateral_pairs: int = 0) -> Iterator[ClaimRatings]:
+    """
+    Lazily yields every claim of up to max_ratings ratings, each a multiple of step, whose final award
+    is target_award under method: 'bva' (corrected_va_disability_precise) or 'table'
+    (corrected_va_disability_table_method). With bilateral_pairs 1 or 2, claims with that many
+    bilateral extremity pairs are searched as well; mirror-image layouts are yielded once, as in explore.
+
+    General ratings are added in descending order. Adding a rating never lowers the combined value,
+    so a branch stops once its award passes the target, and a rating is not tried when filling every
+    remaining slot with it still falls short (nor is any smaller one).
+    """
+    if method not in ('bva', 'table'):
+        raise ValueError(f"unknown method {method!r}; expected 'bva' or 'table'")
+    if target_award not in range(0, 101, 10):
+        raise ValueError("target_award must be a multiple of 10 from 0 to 100")
+    if not 1 <= step <= 100:
+        raise ValueError("step must be from 1 to 100")
+    combine = corrected_va_disability_precise if method == 'bva' else corrected_va_disability_table_method
+    process_bilateral = process_bilateral_bva if method == 'bva' else process_bilateral_table
+    final_values = final_values_bva if method == 'bva' else final_values_table
+    values = tuple(float(value) for value in range(step * (100 // step), 0, -step))
+
+    for pairs in _explore_pairs(max_ratings, bilateral_pairs, values):
+        extremities: List[List[float]] = [[], [], [], []]
+        for number, (left, right) in enumerate(pairs):
+            extremities[2 * number], extremities[2 * number + 1] = list(left), list(right)
+        upper_l, upper_r, lower_l, lower_r = extremities
+        fixed = (final_values(process_bilateral(upper_l, upper_r), upper_l, upper_r)
+                 + final_values(process_bilateral(lower_l, lower_r), lower_l, lower_r))
+        budget = max_ratings - sum(len(left) + len(right) for left, right in pairs)
+
+        def award(general: Tuple[float, ...]) -> int:
+            return round_to_va_award(combine(fixed + list(general)))
+
+        stack: List[Tuple[float, ...]] = [()]
+        while stack:
+            general = stack.pop()
+            if fixed or general:
+                reached = award(general)
+                if reached == target_award:
+                    yield ClaimRatings(list(general), *(list(group) for group in extremities))
+                # A lone value above 100 is the one case where adding a rating lowers the result (it is capped at 100).
+                if target_award < reached <= 100:
+                    continue
+            remaining = budget - len(general)
+            if not remaining:
+                continue
+            children = []
+            for value in values:
+                if general and value > general[-1]:
+                    continue
+                if award(general + (value,) * remaining) < target_award:
+                    break
+                children.append(general + (value,))
+            stack.extend(reversed(children))
+
+def _run_reverse(args: argparse.Namespace) -> int:
+    if args.step > 100:
+        print("error: --step must be from 1 to 100.", file=sys.stderr)
+        return 2
+    sink = _open_output(args.output)
+    found = 0
+    try:
+        matches = find_rating_sets(args.award, args.method, args.max_ratings, args.step, args.pairs)
+        for claim in itertools.islice(matches, args.limit):
+            sink.write(json.dumps({field: ratings for field, ratings in claim._asdict().items() if ratings}) + '\n')
+            found += 1
+        sink.flush()
+    finally:
+        if sink is not sys.stdout: sink.close()
+    print(f"{found} rating set(s) with a {args.method} award of {args.award}%" + (" (limit reached)" if found == args.limit else "") + ".", file=sys.stderr)
+    return 0
+
+# --- Local HTTP scoring service ---
+class MicroBatcher:
+    """
+    Collects claims submitted by concurrent requests and scores each group with one
+    score_batch call. A group closes when it reaches max_batch_size claims or when
+    max_wait seconds have passed since its first claim arrived.
+    """
+    def __init__(self, score_batch: Callable[[Sequence[ClaimRatings]], List[ClaimScore]],
+                 max_batch_size: int = 256, max_wait: float = 0.002):
+        self.score_batch = score_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self.claims = 0
+        self.largest_batch = 0
+        self._queue: Optional["asyncio.Queue"] = None
+        self._task: Optional["asyncio.Task"] = None
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def score(self, claim: ClaimRatings) -> ClaimScore:
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((claim, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[ClaimRatings, "asyncio.Future"]]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    def _score(self, claims: List[ClaimRatings]) -> List[Any]:
+        """score_batch(claims), except that a claim which cannot be scored gets its exception in place of a score."""
+        try:
+            return self.score_batch(claims)
+        except Exception:
+            # Isolate the claim(s) that failed, as score_record_chunk does.
+            results: List[Any] = []
+            for claim in claims:
+                try:
+                    results.append(score_claim(claim))
+                except Exception as exc:
+                    results.append(exc)
+            return results
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            # Scored on the loop's default thread pool, so the loop keeps reading requests (which
+            # form the next batch) while this one is scored.
+            results = await loop.run_in_executor(None, self._score, [claim for claim, _ in batch])
+            self.batches += 1
+            self.claims += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        return {'batches': self.batches, 'claims': self.claims, 'largest_batch': self.largest_batch,
+                'max_batch_size': self.max_batch_size, 'max_wait_ms': self.max_wait * 1000.0}
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+_HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                 413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+class ScoringService:
+    """
+    A small HTTP/1.1 JSON service over the scoring core, for local intake tools.
+
+        GET  /health  -> {"status": "ok", "batcher": {...}, "cache": {...}}
+        POST /score   -> body is one claim record, or {"claims": [record, ...]}; records use the
+                         same fields as the 'score' command. Each result has the SCORE_FIELDS keys.
+
+    Claims from concurrent requests are scored together through a MicroBatcher.
+    """
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765, max_batch_size: int = 256,
+                 max_wait: float = 0.002, max_body: int = 1 << 20):
+        self.host = host
+        self.port = port
+        self.max_body = max_body
+        self.batcher = MicroBatcher(CLAIM_SCORE_CACHE.score_batch, max_batch_size, max_wait)
+        self.server: Optional["asyncio.AbstractServer"] = None
+
+    async def start(self) -> "ScoringService":
+        self.batcher.start()
+        self.server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]  # the real port when 0 was asked for
+        return self
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        await self.batcher.stop()
+
+    async def _score_record(self, position: int, record: Any) -> Dict[str, Any]:
+        claim_id = position
+        try:
+            if not isinstance(record, dict):
+                raise ValueError("Each claim must be a JSON object.")
+            claim_id = record.get('claim_id', position)
+            row = score_to_row(claim_id, await self.batcher.score(parse_claim_record(record)))
+        except (ValueError, TypeError) as exc:
+            row = error_row(claim_id, exc)
+        return dict(zip(SCORE_FIELDS, row))
+
+    async def _route(self, method: str, path: str, body: bytes) -> Any:
+        if path == '/health':
+            if method != 'GET':
+                raise HTTPError(405, "Use GET.")
+            return {'status': 'ok', 'batcher': self.batcher.stats(), 'cache': CLAIM_SCORE_CACHE.stats()}
+        if path == '/score':
+            if method != 'POST':
+                raise HTTPError(405, "Use POST.")
+            try:
+                payload = json.loads(body or b'null')
+            except ValueError as exc:
+                raise HTTPError(400, f"Invalid JSON: {exc}")
+            if isinstance(payload, dict) and 'claims' in payload:
+                if not isinstance(payload['claims'], list):
+                    raise HTTPError(400, "'claims' must be a list.")
+                results = await asyncio.gather(*(self._score_record(position, record)
+                                                 for position, record in enumerate(payload['claims'])))
+                return {'results': results}
+            if not isinstance(payload, dict):
+                raise HTTPError(400, "Expected a claim object or {\"claims\": [...]}.")
+            return await self._score_record(0, payload)
+        raise HTTPError(404, f"No such endpoint: {path}")
+
+    async def _handle_connection(self, reader: "asyncio.StreamReader", writer: "asyncio.StreamWriter"):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, {'error': "Malformed request line."}, keep_alive=False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+                try:
+                    length = int(headers.get('content-length') or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {'error': "Invalid Content-Length header."}, keep_alive=False)
+                    break
+                if length > self.max_body:
+                    await self._respond(writer, 413, {'error': f"Body larger than {self.max_body} bytes."}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+                try:
+                    status, result = 200, await self._route(method.upper(), target.split('?', 1)[0], body)
+                except HTTPError as exc:
+                    status, result = exc.status, {'error': str(exc)}
+                except Exception as exc:
+                    status, result = 500, {'error': str(exc)}
+                await self._respond(writer, status, result, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: "asyncio.StreamWriter", status: int, payload: Any, keep_alive: bool):
+        body = json.dumps(payload).encode('utf-8')
+        writer.write(f"HTTP/1.1 {status} {_HTTP_REASONS.get(status, '')}\r\n"
+                     f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+                     f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + body)
+        await writer.drain()
+
+def _run_serve(args: argparse.Namespace) -> int:
+    CLAIM_SCORE_CACHE.resize(args.cache_size)
+    service = ScoringService(args.host, args.port, args.max_batch_size, args.max_wait_ms / 1000.0)
+
+    async def serve():
+        await service.start()
+        print(f"Scoring service listening on http://{service.host}:{service.port} (POST /score, GET /health)", file=sys.stderr)
+        try:
+            await service.server.serve_forever()
+        finally:
+            await service.close()
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+# --- Benchmarks ---
+def _mix_typical(rng: random.Random) -> ClaimRatings:
+    pick = lambda: rng.choice((10, 10, 20, 20, 30, 40, 50, 60, 70, rng.randint(1, 100)))
+    return ClaimRatings(*([pick() for _ in range(rng.randint(low, high))] for low, high in ((1, 6), (0, 2), (0, 2), (0, 2), (0, 2))))
+
+def _mix_many_general(rng: random.Random) -> ClaimRatings:
+    return ClaimRatings([rng.choice((0, 10, 10, 20, 30, 50, 70)) for _ in range(rng.randint(10, 20))], [], [], [], [])
+
+def _mix_heavy_bilateral(rng: random.Random) -> ClaimRatings:
+    pick = lambda: rng.choice((10, 10, 20, 30, 40, 60))
+    return ClaimRatings(*([pick() for _ in range(rng.randint(low, high))] for low, high in ((0, 2), (1, 4), (1, 4), (1, 4), (1, 4))))
+
+def _mix_all_zero(rng: random.Random) -> ClaimRatings:
+    return ClaimRatings(*([0.0] * rng.randint(0, 3) for _ in range(5)))
+
+BENCH_MIXES: Dict[str, Callable[[random.Random], ClaimRatings]] = {
+    'typical': _mix_typical,
+    'many_general': _mix_many_general,
+    'heavy_bilateral': _mix_heavy_bilateral,
+    'all_zero': _mix_all_zero,
+}
+
+def synthetic_caseload(size: int, mix: str = 'typical', seed: int = 0) -> List[ClaimRatings]:
+    """A reproducible list of claims drawn from one of the BENCH_MIXES rating mixes."""
+    rng = random.Random(f"{mix}:{seed}")
+    return [BENCH_MIXES[mix](rng) for _ in range(size)]
+
+def _all_ratings(claims: List[ClaimRatings]) -> List[List[float]]:
+    return [list(itertools.chain(*claim)) for claim in claims]
+
+# name -> (prepare caseload into call arguments, function, whether one call takes the whole caseload)
+BENCHMARKS: Dict[str, Tuple[Callable[[List[ClaimRatings]], List[Any]], Callable[[Any], Any], bool]] = {
+    'precise': (_all_ratings, corrected_va_disability_precise, False),
+    'table': (_all_ratings, corrected_va_disability_table_method, False),
+    'round_to_va_award': (lambda claims: [corrected_va_disability_precise(r) for r in _all_ratings(claims)], round_to_va_award, False),
+    'score_claim': (list, score_claim, False),
+    'score_claims_batch': (lambda claims: [claims], score_claims_batch, True),
+    'next_award': (list, next_award_thresholds, False),
+    'next_award_rescoring': (list, next_award_thresholds_by_rescoring, False),
+}
+
+class BenchResult(NamedTuple):
+    benchmark: str
+    mix: str
+    size: int
+    throughput: float  # claims per second, best round
+    p50_us: float      # per-call latency percentiles (per claim, or per whole caseload for batch benchmarks)
+    p90_us: float
+    p99_us: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.benchmark}/{self.mix}/{self.size}"
+
+def _percentile(ordered: List[int], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] / 1000.0
+
+def run_benchmark(name: str, claims: List[ClaimRatings], repeat: int = 5) -> BenchResult:
+    """Times one benchmark on one caseload: best-of-repeat throughput, then one pass of per-call latencies."""
+    prepare, function, batched = BENCHMARKS[name]
+    items = prepare(claims)
+    perf_counter = time.perf_counter
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        for item in items:
+            function(item)
+        best = min(best, perf_counter() - start)
+
+    clock = time.perf_counter_ns
+    latencies = []
+    for _ in range(repeat if batched else 1):
+        for item in items:
+            start = clock()
+            function(item)
+            latencies.append(clock() - start)
+    latencies.sort()
+    return BenchResult(name, '', len(claims), len(claims) / best if best > 0 else float('inf'),
+                       _percentile(latencies, 0.5), _percentile(latencies, 0.9), _percentile(latencies, 0.99))
+
+def run_benchmarks(benchmarks: Sequence[str], mixes: Sequence[str], sizes: Sequence[int],
+                   repeat: int = 5, seed: int = 0) -> List[BenchResult]:
+    results = []
+    for mix in mixes:
+        for size in sizes:
+            claims = synthetic_caseload(size, mix, seed)
+            for name in benchmarks:
+                results.append(run_benchmark(name, claims, repeat)._replace(mix=mix))
+    return results
+
+def benchmark_environment() -> Dict[str, Any]:
+    import platform
+    return {'python': platform.python_version(), 'implementation': platform.python_implementation(),
+            'machine': platform.machine(), 'system': platform.system(),
+            'numpy': getattr(np, '__version__', None), 'cpus': os.cpu_count()}
+
+# Modules a headless import must not pull in: the GUI, the HTTP service, process pools and NumPy are all loaded on use.
+HEADLESS_EXCLUDED_MODULES = ('tkinter', '_tkinter', 'asyncio', 'concurrent.futures.process', 'multiprocessing', 'numpy')
+
+_STARTUP_PROBE = """
+import importlib.util, json, sys, time
+sys.stderr.write('-- startup probe --\\n')
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location('va_disability_calculator', sys.argv[1])
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+elapsed = time.perf_counter() - start
+print(json.dumps({'seconds': elapsed, 'loaded': [name for name in sys.argv[2:] if name in sys.modules]}))
+"""
+
+def measure_startup(runs: int = 5, path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Imports this module headlessly in fresh interpreters under -X importtime. Reports the best
+    import time, which HEADLESS_EXCLUDED_MODULES got loaded, and the largest direct imports.
+    """
+    import subprocess
+    command = [sys.executable, '-X', 'importtime', '-c', _STARTUP_PROBE,
+               os.path.abspath(path or __file__), *HEADLESS_EXCLUDED_MODULES]
+    # Time a warm start: the first run writes the bytecode cache (even under PYTHONDONTWRITEBYTECODE) and is not counted.
+    environment = {name: value for name, value in os.environ.items() if name != 'PYTHONDONTWRITEBYTECODE'}
+    best, loaded, largest = float('inf'), [], []
+    for run in range(runs + 1):
+        completed = subprocess.run(command, capture_output=True, text=True, check=True, env=environment)
+        probe = json.loads(completed.stdout)
+        loaded = probe['loaded']
+        if run and probe['seconds'] < best:
+            best = probe['seconds']
+            imports = []
+            for line in completed.stderr.split('-- startup probe --', 1)[-1].splitlines():
+                fields = line.split('|')
+                # Direct imports of the module are the least indented entries after the probe marker.
+                if len(fields) == 3 and fields[0].startswith('import time:') and fields[1].strip().isdigit():
+                    name = fields[2]
+                    if len(name) - len(name.lstrip()) == 1:
+                        imports.append((name.strip(), int(fields[1]) / 1000.0))
+            largest = sorted(imports, key=lambda item: item[1], reverse=True)[:5]
+    return {'import_ms': best * 1000.0, 'runs': runs, 'excluded_loaded': loaded,
+            'largest_imports': [{'module': name, 'ms': ms} for name, ms in largest]}
+
+def format_startup(startup: Dict[str, Any]) -> str:
+    loaded = ', '.join(startup['excluded_loaded']) or 'none'
+    largest = ', '.join(f"{item['module']} {item['ms']:.1f} ms" for item in startup['largest_imports'])
+    return (f"headless import: {startup['import_ms']:.1f} ms (best of {startup['runs']}); "
+            f"GUI/service/NumPy modules loaded: {loaded}; largest imports: {largest or 'none'}\n")
+
+def save_baseline(path: str, results: List[BenchResult], startup: Optional[Dict[str, Any]] = None):
+    with open(path, 'w', encoding='utf-8') as handle:
+        json.dump({'environment': benchmark_environment(),
+                   'results': {result.key: result._asdict() for result in results},
+                   'startup': startup}, handle, indent=2)
+
+def compare_to_baseline(results: List[BenchResult], baseline: Dict[str, Any], threshold: float = 0.10) -> List[str]:
+    """A message for every result whose throughput fell more than threshold (a fraction) below the baseline."""
+    regressions = []
+    for result in results:
+        previous = baseline.get('results', {}).get(result.key)
+        if previous is None:
+            continue
+        change = result.throughput / previous['throughput'] - 1.0
+        if change < -threshold:
+            regressions.append(f"{result.key}: {previous['throughput']:,.0f} -> {result.throughput:,.0f} claims/s ({change:+.1%})")
+    return regressions
+
+def compare_startup(startup: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.10) -> List[str]:
+    """Flags excluded modules in a headless import, and import time grown more than threshold over the baseline."""
+    regressions = [f"headless import loads {name}" for name in startup['excluded_loaded']]
+    previous = baseline.get('startup')
+    if previous:
+        change = startup['import_ms'] / previous['import_ms'] - 1.0
+        if change > threshold:
+            regressions.append(f"headless import: {previous['import_ms']:.1f} -> {startup['import_ms']:.1f} ms ({change:+.1%})")
+    return regressions
+
+def format_bench_results(results: List[BenchResult]) -> str:
+    lines = [f"{'benchmark':<20} {'mix':<16} {'size':>8} {'claims/s':>12} {'p50 us':>10} {'p90 us':>10} {'p99 us':>10}"]
+    lines += [f"{r.benchmark:<20} {r.mix:<16} {r.size:>8} {r.throughput:>12,.0f} {r.p50_us:>10.2f} {r.p90_us:>10.2f} {r.p99_us:>10.2f}"
+              for r in results]
+    return '\n'.join(lines) + '\n'
+
+def _run_bench(args: argparse.Namespace) -> int:
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as handle:
+            baseline = json.load(handle)
+    results = run_benchmarks(args.benchmarks, args.mixes, args.sizes, args.repeat, args.seed)
+    sys.stdout.write(format_bench_results(results))
+    startup = measure_startup(args.startup_runs) if args.startup_runs else None
+    if startup is not None:
+        sys.stdout.write(format_startup(startup))
+    if args.save:
+        save_baseline(args.save, results, startup)
+    if baseline is not None:
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if startup is not None:
+            regressions += compare_startup(startup, baseline, args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} against {args.compare}.", file=sys.stderr)
+    return 0
+
+def _csv_list(choices: Optional[Sequence[str]] = None, cast: Callable[[str], Any] = str) -> Callable[[str], List[Any]]:
+    def parse(value: str) -> List[Any]:
+        items = [cast(item) for item in value.split(',') if item]
+        unknown = [item for item in items if choices is not None and item not in choices]
+        if unknown or not items:
+            raise argparse.ArgumentTypeError(f"expected a comma-separated list of {', '.join(choices) if choices else 'values'}")
+        return items
+    return parse
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return number
+
+def _non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("must be zero or a positive integer")
+    return number
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="VA disability calculator. Run without arguments to open the GUI.")
+    commands = parser.add_subparsers(dest='command')
+
+    score = commands.add_parser('score', help="Score claims from a CSV or JSONL file (or stdin) and stream one result per claim.")
+    score.add_argument('input', nargs='?', default='-', help="Claims file, or '-' for stdin (default).")
+    score.add_argument('-o', '--output', default='-', help="Results file, or '-' for stdout (default).")
+    score.add_argument('--format', choices=('csv', 'jsonl', 'vacl'), help="Input format; vacl is the binary caseload from 'pack' (default: from the file extension, else csv).")
+    score.add_argument('--output-format', choices=('csv', 'jsonl'), help="Output format (default: same as the input).")
+    score.add_argument('--chunk-size', type=_positive_int, default=4096, help="Claims scored per batch (default: 4096).")
+    score.add_argument('--cache-size', type=_non_negative_int, default=CLAIM_SCORE_CACHE.maxsize,
+                       help=f"Distinct rating sets kept in the per-process result cache; 0 disables it (default: {CLAIM_SCORE_CACHE.maxsize}).")
+    score.add_argument('--workers', type=_non_negative_int, default=1,
+                       help="Worker processes; chunks are scored in parallel when above 1. 0 uses every CPU (default: 1).")
+    score.add_argument('--store', metavar='PATH', help="SQLite results store: claims already scored under the current rules are taken from it, new results are added.")
+    score.add_argument('--stats', action='store_true', help="Print per-stage timings and counters as JSON on stderr when done.")
+    score.add_argument('--profile', metavar='PATH', help="Run under cProfile and write pstats data to PATH (this process only).")
+
+    pack = commands.add_parser('pack', help=f"Convert a CSV or JSONL claims file to the binary caseload format ({CASELOAD_SUFFIX}), which score reads without parsing.")
+    pack.add_argument('input', nargs='?', default='-', help="Claims file, or '-' for stdin (default).")
+    pack.add_argument('-o', '--output', required=True, help=f"Caseload file to write (e.g. claims{CASELOAD_SUFFIX}).")
+    pack.add_argument('--format', choices=('csv', 'jsonl'), help="Input format (default: from the file extension, else csv).")
+
+    thresholds = commands.add_parser('thresholds', help="For each claim, list the one-step raises and smallest new ratings that reach the next award (JSONL output).")
+    thresholds.add_argument('input', nargs='?', default='-', help="Claims file, or '-' for stdin (default).")
+    thresholds.add_argument('-o', '--output', default='-', help="Results file, or '-' for stdout (default).")
+    thresholds.add_argument('--format', choices=('csv', 'jsonl'), help="Input format (default: from the file extension, else csv).")
+    thresholds.add_argument('--step', type=float, default=10.0, help="Rating step used for raises and new ratings (default: 10).")
+    thresholds.add_argument('--chunk-size', type=_positive_int, default=1024, help="Claims per output write (default: 1024).")
+
+    check = commands.add_parser('check', help="Score claims with both float and exact arithmetic and list every award they disagree on. Exits 1 if any do.")
+    check.add_argument('input', nargs='?', default='-', help="Claims file, or '-' for stdin (default).")
+    check.add_argument('-o', '--output', default='-', help="Report file, or '-' for stdout (default).")
+    check.add_argument('--format', choices=('csv', 'jsonl'), help="Input format (default: from the file extension, else csv).")
+    check.add_argument('--output-format', choices=('csv', 'jsonl'), help="Output format (default: same as the input).")
+    check.add_argument('--chunk-size', type=_positive_int, default=4096, help="Claims checked per batch (default: 4096).")
+
+    explore = commands.add_parser('explore', help="Score every claim of up to N ratings (multiples of 10) and index those where the BVA award differs from the table or no-bilateral award.")
+    explore.add_argument('-o', '--output', required=True, help="Index file to write.")
+    explore.add_argument('--max-ratings', type=_positive_int, default=5, help="Most ratings per claim, all groups together (default: 5).")
+    explore.add_argument('--max-pairs', type=int, choices=(0, 1, 2), default=2, help="Most bilateral pairs (upper, lower) per claim (default: 2).")
+    explore.add_argument('--workers', type=_non_negative_int, default=0, help="Worker processes; 0 uses every CPU (default: 0).")
+
+    explore_query = commands.add_parser('explore-query', help="List the award pairs in an explore index, or the claims for one pair (JSONL).")
+    explore_query.add_argument('index', help="Index file written by explore.")
+    explore_query.add_argument('--kind', choices=EXPLORE_KINDS, help="'methods' (BVA vs table) or 'bilateral' (BVA vs no bilateral); default: both when listing, methods for --pair.")
+    explore_query.add_argument('--pair', type=_csv_list(cast=_non_negative_int), metavar='BVA,OTHER', help="Award pair to list claims for, e.g. 70,80.")
+    explore_query.add_argument('--limit', type=_positive_int, help="Most claims to print.")
+    explore_query.add_argument('-o', '--output', default='-', help="Claims file, or '-' for stdout (default).")
+
+    reverse = commands.add_parser('reverse', help="List the rating sets that produce a given final award (JSONL, one claim per line).")
+    reverse.add_argument('award', type=int, choices=range(0, 101, 10), metavar='AWARD', help="Target final award: 0, 10, ... 100.")
+    reverse.add_argument('--method', choices=('bva', 'table'), default='bva', help="bva (precise) or table (step-rounded) method (default: bva).")
+    reverse.add_argument('--max-ratings', type=_positive_int, default=4, help="Most ratings per set, all groups together (default: 4).")
+    reverse.add_argument('--step', type=_positive_int, default=10, help="Rating granularity: ratings are multiples of this (default: 10).")
+    reverse.add_argument('--pairs', type=int, choices=(0, 1, 2), default=0, help="Also search sets with up to this many bilateral extremity pairs (default: 0).")
+    reverse.add_argument('--limit', type=_positive_int, help="Stop after this many sets.")
+    reverse.add_argument('-o', '--output', default='-', help="Results file, or '-' for stdout (default).")
+
+    serve = commands.add_parser('serve', help="Run a local HTTP/JSON scoring service (POST /score, GET /health).")
+    serve.add_argument('--host', default='127.0.0.1', help="Address to bind (default: 127.0.0.1, local only).")
+    serve.add_argument('--port', type=_non_negative_int, default=8765, help="Port to listen on; 0 picks a free one (default: 8765).")
+    serve.add_argument('--max-batch-size', type=_positive_int, default=256, help="Most claims scored in one batch (default: 256).")
+    serve.add_argument('--max-wait-ms', type=float, default=2.0, help="How long a batch waits for more claims after its first one (default: 2).")
+    serve.add_argument('--cache-size', type=_non_negative_int, default=CLAIM_SCORE_CACHE.maxsize,
+                       help=f"Distinct rating sets kept in the result cache; 0 disables it (default: {CLAIM_SCORE_CACHE.maxsize}).")
+
+    bench = commands.add_parser('bench', help="Benchmark the combination functions and claim scoring on synthetic caseloads.")
+    bench.add_argument('--benchmarks', type=_csv_list(BENCHMARKS), default=list(BENCHMARKS),
+                       help=f"Comma-separated benchmarks (default: all of {','.join(BENCHMARKS)}).")
+    bench.add_argument('--mixes', type=_csv_list(BENCH_MIXES), default=list(BENCH_MIXES),
+                       help=f"Comma-separated rating mixes (default: all of {','.join(BENCH_MIXES)}).")
+    bench.add_argument('--sizes', type=_csv_list(cast=_positive_int), default=[1000, 10000], help="Comma-separated caseload sizes (default: 1000,10000).")
+    bench.add_argument('--repeat', type=_positive_int, default=5, help="Timed rounds per benchmark; the best is reported (default: 5).")
+    bench.add_argument('--seed', type=int, default=0, help="Caseload seed (default: 0).")
+    bench.add_argument('--startup-runs', type=_non_negative_int, default=5,
+                       help="Fresh interpreters used to time the headless import with -X importtime; 0 skips it (default: 5).")
+    bench.add_argument('--save', metavar='PATH', help="Write the results as a JSON baseline.")
+    bench.add_argument('--compare', metavar='PATH', help="Compare against a saved baseline; exits 1 on a regression.")
+    bench.add_argument('--threshold', type=float, default=0.10, help="Throughput drop counted as a regression (default: 0.10).")
+    return parser
+
+def run_gui():
     root = tk.Tk()
     app = VADisabilityCalculatorApp(root)
     root.mainloop()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    if args.command == 'score':
+        return _run_score(args)
+    if args.command == 'pack':
+        return _run_pack(args)
+    if args.command == 'thresholds':
+        return _run_thresholds(args)
+    if args.command == 'check':
+        return _run_check(args)
+    if args.command == 'explore':
+        return _run_explore(args)
+    if args.command == 'explore-query':
+        return _run_explore_query(args)
+    if args.command == 'reverse':
+        return _run_reverse(args)
+    if args.command == 'bench':
+        return _run_bench(args)
+    if args.command == 'serve':
+        return _run_serve(args)
+    run_gui()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
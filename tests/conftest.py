@@ -0,0 +1,15 @@
+import importlib.util
+import pathlib
+
+import pytest
+
+MODULE_PATH = pathlib.Path(__file__).resolve().parent.parent / "VA_Disability-Rating-Calculator.py"
+
+
+@pytest.fixture(scope="session")
+def calculator():
+    # The script's file name has hyphens, so it is loaded from its path rather than imported.
+    spec = importlib.util.spec_from_file_location("va_disability_rating_calculator", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
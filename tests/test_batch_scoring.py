@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+
+def random_claims(calculator, count, seed=0):
+    rng = random.Random(seed)
+
+    def rating():
+        roll = rng.random()
+        if roll < 0.6:
+            return float(rng.randrange(0, 101, 10))
+        if roll < 0.9:
+            return round(rng.uniform(0, 100), rng.choice((1, 2)))
+        return float(rng.randint(0, 100))
+
+    return [calculator.ClaimRatings(*([rating() for _ in range(rng.randint(low, high))]
+                                      for low, high in ((0, 8), (0, 3), (0, 3), (0, 3), (0, 3))))
+            for _ in range(count)]
+
+
+def edge_claims(calculator):
+    ClaimRatings = calculator.ClaimRatings
+    return [
+        ClaimRatings([], [], [], [], []),
+        ClaimRatings([0.0, 0.0], [0.0], [0.0], [0.0], [0.0]),        # all zero
+        ClaimRatings([], [100.0], [100.0], [], []),                   # 100/100 bilateral pair
+        ClaimRatings([50.0], [100.0], [100.0], [100.0], [100.0]),
+        ClaimRatings([100.0, 10.0], [], [], [], []),
+        ClaimRatings([33.33, 12.5, 0.01], [27.5], [62.25], [], []),   # decimal ratings
+        ClaimRatings([], [], [], [10.0], []),                         # lone limb: no bilateral factor
+        ClaimRatings([10.0] * 12, [10.0] * 3, [10.0] * 3, [], []),
+    ]
+
+
+@pytest.fixture(scope="module")
+def caseload(calculator):
+    return random_claims(calculator, 3000) + edge_claims(calculator)
+
+
+def test_batch_matches_score_claim(calculator, caseload):
+    pytest.importorskip("numpy")
+    expected = [calculator.score_claim(claim) for claim in caseload]
+    assert calculator.score_claims_batch(caseload) == expected
+
+
+def test_batch_from_columns_matches_score_claim(calculator, caseload):
+    pytest.importorskip("numpy")
+    columns = calculator.ClaimColumns.from_claims(caseload)
+    assert list(columns) == caseload
+    assert calculator.score_claims_batch(columns) == [calculator.score_claim(claim) for claim in caseload]
+
+
+def test_fallback_without_numpy_matches(calculator, caseload, monkeypatch):
+    expected = [calculator.score_claim(claim) for claim in caseload]
+    monkeypatch.setattr(calculator, "np", None)
+    assert calculator.score_claims_batch(caseload) == expected
+    assert calculator.score_claims_batch(calculator.ClaimColumns.from_claims(caseload)) == expected
+
+
+def test_edge_case_awards(calculator):
+    scores = calculator.score_claims_batch(edge_claims(calculator))
+    assert (scores[0].award_bva, scores[0].award_table) == (0, 0)
+    assert (scores[1].award_bva, scores[1].award_table) == (0, 0)
+    assert scores[2].upper_bva.is_bilateral and scores[2].upper_table.is_bilateral
+    assert scores[6].upper_bva.is_bilateral is False and scores[6].award_bva == 10
@@ -0,0 +1,37 @@
+import pytest
+
+G, LA, RA, LL, RL = (0, 0), (1, 1), (2, 1), (1, 2), (2, 2)  # (side, extremity) codes
+
+
+@pytest.mark.parametrize("text, entries, errors", [
+    ("", [], []),
+    ("General: 30", [(30, G)], []),
+    ("Left Arm: 20 10", [(20, LA), (10, LA)], []),
+    ("right arm=40", [(40, RA)], []),
+    ("LEFT LEG, 10, 20", [(10, LL), (20, LL)], []),
+    ("Right Leg 30,10", [(30, RL), (10, RL)], []),
+    ("general :  50 , 12.5", [(50, G), (12.5, G)], []),
+    ("70 50", [(70, G), (50, G)], []),
+    ("10, 0, 100", [(10, G), (0, G), (100, G)], []),
+    ("# header\n\n   \nLeft Arm: 20\n  # indented comment\nRight Arm: 20", [(20, LA), (20, RA)], []),
+    ("Left Elbow: 20", [], ["Line 1: unknown body part 'Left'."]),
+    ("arm, 20", [], ["Line 1: unknown body part 'arm'."]),
+    ("Left Arm:", [], ["Line 1: no ratings given for Left Arm."]),
+    ("General: 30 abc 10", [(30, G), (10, G)], ["Line 1: 'abc' is not a number."]),
+    ("Right Leg: 120 -10", [], ["Line 1: rating '120.0' is out of range (0-100).", "Line 1: rating '-10.0' is out of range (0-100)."]),
+    ("General: nan", [], ["Line 1: rating 'nan' is out of range (0-100)."]),
+    ("NaN 20", [(20, G)], ["Line 1: rating 'nan' is out of range (0-100)."]),
+    ("General: inf", [], ["Line 1: rating 'inf' is out of range (0-100)."]),
+    ("Left Arm: 20\nNeck: 10\n\nRight Leg: 200\n30",
+     [(20, LA), (30, G)], ["Line 2: unknown body part 'Neck:'.", "Line 4: rating '200.0' is out of range (0-100)."]),
+])
+def test_parse_bulk_ratings(calculator, text, entries, errors):
+    disabilities, messages = calculator.parse_bulk_ratings(text)
+    assert [(disc.rating, (disc.side, disc.extremity)) for disc in disabilities] == entries
+    assert messages == errors
+
+
+def test_entries_use_the_body_part_codes(calculator):
+    disabilities, _ = calculator.parse_bulk_ratings("Left Leg: 10\nGeneral 20")
+    assert [disc.body_part for disc in disabilities] == ["Left Leg", "General"]
+    assert calculator.group_disabilities(disabilities) == calculator.ClaimRatings([20.0], [], [], [10.0], [])
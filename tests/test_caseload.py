@@ -0,0 +1,114 @@
+import io
+
+import pytest
+
+
+@pytest.fixture
+def claims(calculator):
+    Disability = calculator.Disability
+    return [("a", calculator.ClaimRatings([50, 30], [20], [10], [], [])),
+            ("b", [Disability(30.0, 2, 1), Disability(10.0), Disability(0.0)]),
+            ("", calculator.ClaimRatings([], [], [], [40], [40])),
+            ("d", calculator.ClaimRatings([], [], [], [], [])),
+            ("é", calculator.ClaimRatings([70.5], [], [], [], []))]
+
+
+def grouped(calculator, claim):
+    return claim if isinstance(claim, calculator.ClaimRatings) else calculator.group_disabilities(claim)
+
+
+def fields(disabilities):
+    return [(disc.rating, disc.side, disc.extremity) for disc in disabilities]
+
+
+def without_zeros(calculator, claim):
+    return calculator.ClaimRatings(*([rating for rating in group if rating > 0] for group in claim))
+
+
+@pytest.mark.parametrize("with_ids", [True, False])
+def test_round_trip(calculator, tmp_path, claims, with_ids):
+    path = str(tmp_path / "claims.vacl")
+    written = [(claim_id if with_ids else "", claim) for claim_id, claim in claims]
+    calculator.write_caseload(path, written)
+    with calculator.CaseloadFile(path) as caseload:
+        assert len(caseload) == len(claims)
+        assert [caseload.claim_id(index) for index in range(len(caseload))] == [claim_id for claim_id, _ in written]
+        assert list(caseload) == [grouped(calculator, claim) for _, claim in claims]
+        assert fields(caseload.disabilities(1)) == fields(claims[1][1])  # kept exactly as given, zero rating included
+        assert caseload[-1] == caseload[len(claims) - 1]
+        with pytest.raises(IndexError):
+            caseload[len(claims)]
+
+
+def test_columns_match_getitem(calculator, tmp_path, claims, monkeypatch):
+    # Columns keep a written zero rating, which __getitem__ drops; neither changes a score.
+    path = str(tmp_path / "claims.vacl")
+    calculator.write_caseload(path, claims)
+    with calculator.CaseloadFile(path) as caseload:
+        for start, stop in [(0, len(claims)), (1, 3), (2, 2), (4, 5)]:
+            columns = caseload.columns(start, stop)
+            expected = [caseload[index] for index in range(start, stop)]
+            assert [without_zeros(calculator, claim) for claim in columns] == expected
+            assert columns.canonical_keys() == [calculator.ClaimScoreCache.canonical_key(claim) for claim in expected]
+            assert [fields(columns.disabilities(index)) for index in range(len(columns))] == \
+                [fields(caseload.disabilities(index)) for index in range(start, stop)]
+        monkeypatch.setattr(calculator, "np", None)
+        assert [without_zeros(calculator, claim) for claim in caseload.columns()] == list(caseload)
+
+
+def test_empty_caseload(calculator, tmp_path):
+    path = str(tmp_path / "empty.vacl")
+    calculator.write_caseload(path, [])
+    with calculator.CaseloadFile(path) as caseload:
+        assert len(caseload) == 0
+        assert list(caseload.columns()) == []
+
+
+def score(calculator, path, **options):
+    sink = io.StringIO()
+    result = calculator.score_caseload(path, sink, **options)
+    return sink.getvalue(), result
+
+
+def test_corrupt_side_code_is_one_error_row(calculator, tmp_path, claims):
+    path = str(tmp_path / "claims.vacl")
+    calculator.write_caseload(path, claims)
+    data = bytearray(open(path, "rb").read())
+    # Claim a has four records; the first record of claim b gets side code 7.
+    data[calculator._CASELOAD_HEADER.size + 4 * calculator._CASELOAD_RECORD.size + 8] = 7
+    open(path, "wb").write(data)
+    for chunk_size in (1, 100):
+        output, (written, failed) = score(calculator, path, chunk_size=chunk_size)
+        assert (written, failed) == (len(claims), 1)
+        rows = output.splitlines()[1:]
+        assert rows[1].startswith("b,,") and "side or extremity" in rows[1]
+        assert all(row.endswith(",") for index, row in enumerate(rows) if index != 1)
+
+
+def test_truncated_and_unfinished_files_are_rejected(calculator, tmp_path, claims):
+    path = str(tmp_path / "claims.vacl")
+    calculator.write_caseload(path, claims)
+    data = open(path, "rb").read()
+    header = calculator._CASELOAD_HEADER.size
+    for name, broken in [("truncated", data[:-10]), ("unfinished", bytes(header) + data[header:]),
+                         ("header only", data[:header]), ("empty", b"")]:
+        broken_path = str(tmp_path / (name + ".vacl"))
+        open(broken_path, "wb").write(broken)
+        with pytest.raises(ValueError):
+            calculator.CaseloadFile(broken_path)
+
+
+def test_store_is_shared_with_record_input(calculator, tmp_path, claims):
+    path = str(tmp_path / "claims.vacl")
+    calculator.write_caseload(path, claims + claims[:2])
+    plain, _ = score(calculator, path)
+    db = str(tmp_path / "scores.db")
+    with calculator.ScoreStore(db) as store:
+        assert score(calculator, path, chunk_size=2, store=store)[0] == plain
+        assert (store.skipped, store.rescored, store.duplicates) == (0, 5, 2)
+    records = [dict(zip(("claim_id",) + calculator.CLAIM_FIELDS, (claim_id,) + tuple(" ".join(map(str, group)) for group in grouped(calculator, claim))))
+               for claim_id, claim in claims]
+    with calculator.ScoreStore(db) as store:
+        rows = [row for chunk in calculator.score_record_chunks(records, 2, store=store) for row in chunk]
+        assert (store.skipped, store.rescored, store.duplicates) == (len(claims), 0, 0)
+    assert calculator.format_rows(rows, "csv", header=True) == "".join(plain.splitlines(True)[:len(claims) + 1])
@@ -0,0 +1,70 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+
+def random_claims(calculator, seed, count, sizes, pool):
+    rng = random.Random(seed)
+    claims = []
+    for _ in range(count):
+        groups = [[] for _ in range(5)]
+        for _ in range(rng.choice(sizes)):
+            groups[rng.choice([0, 0, 1, 2, 3, 4])].append(rng.choice(pool))
+        claims.append(calculator.ClaimRatings(*groups))
+    return claims
+
+
+@pytest.fixture
+def whole_claims(calculator):
+    return random_claims(calculator, 8, 3000, range(0, 10), list(range(1, 101)))
+
+
+@pytest.fixture
+def long_claims(calculator):
+    # Past _EXACT_INT64_MAX_RATINGS, and led by 100 or by a 100/100 bilateral pair, which combines to 110.
+    ClaimRatings = calculator.ClaimRatings
+    more = calculator._EXACT_INT64_MAX_RATINGS + 1
+    claims = random_claims(calculator, 9, 300, range(more, more + 6), list(range(10, 101, 10)))
+    claims += [ClaimRatings([], [100], [100], [], []),
+               ClaimRatings([10] * more, [100], [100], [], []),
+               ClaimRatings([100] + [20] * more, [], [], [], []),
+               ClaimRatings([100], [], [], [], []),
+               ClaimRatings([10] * 7, [100], [100], [], []),
+               ClaimRatings([], [100], [100], [100], [100])]
+    return claims
+
+
+def test_batch_matches_scalar_on_whole_numbers(calculator, whole_claims):
+    assert calculator.score_claims_exact_batch(whole_claims) == [calculator.score_claim_exact(claim) for claim in whole_claims]
+
+
+def test_batch_matches_scalar_past_the_int64_limit(calculator, whole_claims, long_claims):
+    mixed = [claim for pair in zip(whole_claims, long_claims) for claim in pair]  # both paths in one batch
+    for claims in (long_claims, mixed):
+        assert calculator.score_claims_exact_batch(claims) == [calculator.score_claim_exact(claim) for claim in claims]
+
+
+def test_lone_bilateral_pair_of_100s(calculator):
+    exact = calculator.score_claim_exact(calculator.ClaimRatings([], [100], [100], [], []))
+    assert exact.combined_bva == Decimal(110) and exact.award_bva == 110
+
+
+def test_exact_awards_match_float_awards_on_whole_numbers(calculator, whole_claims, long_claims):
+    claims = whole_claims + long_claims
+    assert calculator.exact_award_differences(claims) == []
+    for score, exact in zip(calculator.score_claims_batch(claims), calculator.score_claims_exact_batch(claims)):
+        assert (score.award_bva, score.award_table, score.award_no_bilateral) == \
+            (exact.award_bva, exact.award_table, exact.award_no_bilateral)
+
+
+def test_checker_reports_a_half_boundary(calculator):
+    # 20 and 30.6249375 combine to exactly 44.49995: round(x, 4) on the float lands on 44.4999,
+    # which awards 40, while rounding half up gives 44.5000 and an award of 50.
+    claim = calculator.ClaimRatings([20, 30.6249375], [], [], [], [])
+    plain = calculator.ClaimRatings([20, 30], [], [], [], [])
+    differences = calculator.exact_award_differences([plain, claim])
+    assert [(index, method) for index, method, _, _ in differences] == [(1, "bva"), (1, "no_bilateral")]
+    _, _, score, exact = differences[0]
+    assert (score.combined_bva, score.award_bva) == (44.4999, 40)
+    assert (exact.combined_bva, exact.award_bva) == (Decimal("44.5000"), 50)
@@ -0,0 +1,103 @@
+import itertools
+
+import pytest
+
+MAX_RATINGS = 3
+
+
+def canonical(calculator, claim):
+    """The one layout the explorer scores for claim: pairs ordered left >= right, first pair >= second."""
+    groups = [tuple(sorted(group, reverse=True)) for group in claim]
+    pairs = sorted((max(left, right), min(left, right)) for left, right in ((groups[1], groups[2]), (groups[3], groups[4])) if left)
+    pairs.reverse()
+    extremities = [side for pair in pairs for side in pair] + [()] * (4 - 2 * len(pairs))
+    return calculator.ClaimRatings(*(tuple(group) for group in [groups[0]] + extremities))
+
+
+def as_tuples(calculator, claim):
+    return calculator.ClaimRatings(*(tuple(group) for group in claim))
+
+
+@pytest.fixture(scope="module")
+def enumerated(calculator):
+    """Every claim of up to MAX_RATINGS ratings, scored without pruning: {(kind, claim, awards)}."""
+    items = [(group, float(value)) for group in range(5) for value in calculator.EXPLORE_RATINGS]
+    found, awards_by_layout = set(), {}
+    for size in range(1, MAX_RATINGS + 1):  # an empty claim has no no-bilateral award and is never explored
+        for entries in itertools.combinations_with_replacement(items, size):
+            groups = [[] for _ in range(5)]
+            for group, value in entries:
+                groups[group].append(value)
+            claim = calculator.ClaimRatings(*groups)
+            score = calculator.score_claim(claim)
+            awards = (score.award_bva, score.award_table, score.award_no_bilateral)
+            if bool(claim.upper_left) != bool(claim.upper_right) or bool(claim.lower_left) != bool(claim.lower_right):
+                # A one-sided extremity scores like general ratings, which the explorer covers.
+                general, extremities = list(claim.general), []
+                for left, right in ((claim.upper_left, claim.upper_right), (claim.lower_left, claim.lower_right)):
+                    if left and right:
+                        extremities += [left, right]
+                    else:
+                        general += left + right
+                        extremities += [[], []]
+                moved = calculator.score_claim(calculator.ClaimRatings(general, *extremities))
+                assert awards == (moved.award_bva, moved.award_table, moved.award_no_bilateral)
+                continue
+            layout = canonical(calculator, claim)
+            assert awards_by_layout.setdefault(layout, awards) == awards  # mirrored layouts score the same
+            if awards[0] != awards[1]:
+                found.add(("methods", layout, awards))
+            if awards[0] != awards[2]:
+                found.add(("bilateral", layout, awards))
+    return found
+
+
+def explored(calculator, result):
+    width = result.max_ratings + 3
+    found = set()
+    for (kind, first, second), block in result.blocks.items():
+        for start in range(0, len(block), width):
+            record = block[start:start + width]
+            groups = [[] for _ in range(5)]
+            for code in record[:-3]:
+                if code:
+                    groups[code >> 4].append(float((code & 15) * 10))
+            awards = tuple(record[-3:])
+            assert (first, second) == (awards[0], awards[1 + kind])
+            found.add((calculator.EXPLORE_KINDS[kind], as_tuples(calculator, groups), awards))
+    return found
+
+
+@pytest.mark.parametrize("chunk_size", [1, 256])
+def test_matches_unpruned_enumeration(calculator, enumerated, chunk_size):
+    result = calculator.explore_disagreements(MAX_RATINGS, 2, chunk_size=chunk_size)
+    assert result.pruned > 0
+    assert explored(calculator, result) == enumerated
+    assert sum(result.counts().values()) == len(enumerated)
+
+
+def test_index_round_trip(calculator, enumerated, tmp_path):
+    result = calculator.explore_disagreements(MAX_RATINGS, 2)
+    path = str(tmp_path / "disagreements.vadx")
+    calculator.write_disagreement_index(path, result)
+    with calculator.DisagreementIndex(path) as index:
+        assert index.params["counts"] == result.counts()
+        assert (index.params["max_ratings"], index.params["max_pairs"]) == (MAX_RATINGS, 2)
+        queried = set()
+        for kind, first, second, records in index.pairs():
+            disagreements = list(index.query(kind, first, second))
+            assert len(disagreements) == records > 0
+            for disagreement in disagreements:
+                awards = (disagreement.award_bva, disagreement.award_table, disagreement.award_no_bilateral)
+                assert (disagreement.award_bva, awards[1 if kind == "methods" else 2]) == (first, second)
+                queried.add((kind, as_tuples(calculator, disagreement.claim), awards))
+        assert {kind for kind, _, _, _ in index.pairs("methods")} == {"methods"}
+        assert list(index.query("methods", 10, 10)) == []
+    assert queried == enumerated
+
+
+def test_index_rejects_other_files(calculator, tmp_path):
+    path = tmp_path / "other.vadx"
+    path.write_bytes(b"VACL" + bytes(40))
+    with pytest.raises(ValueError):
+        calculator.DisagreementIndex(str(path))
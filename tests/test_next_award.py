@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+
+def random_claims(calculator, count, seed):
+    rng = random.Random(seed)
+
+    def ratings(most):
+        return [float(rng.randrange(10, 101, 10)) if rng.random() < 0.6 else round(rng.uniform(1, 100), rng.choice((0, 1)))
+                for _ in range(rng.randint(0, most))]
+
+    return [calculator.ClaimRatings(ratings(5), ratings(2), ratings(2), ratings(2), ratings(2)) for _ in range(count)]
+
+
+EDGE_CASES = [
+    ([], [], [], [], []),
+    ([10.0], [], [], [], []),
+    ([], [100.0], [100.0], [], []),     # a 100/100 bilateral pair
+    ([], [30.0], [], [], []),           # a lone limb: additions match the general ones
+    ([20.0], [10.0], [10.0], [20.0], [20.0]),
+    ([94.0], [], [], [], []),           # just below a band edge
+]
+
+
+@pytest.mark.parametrize("step", [10.0, 5.0, 1.0])
+def test_matches_rescoring_every_candidate(calculator, step):
+    claims = random_claims(calculator, 400, seed=int(step)) + [calculator.ClaimRatings(*groups) for groups in EDGE_CASES]
+    for claim in claims:
+        assert calculator.next_award_thresholds(claim, step) == calculator.next_award_thresholds_by_rescoring(claim, step), claim
+
+
+def test_first_reaching(calculator):
+    values = [False] * 7 + [True] * 5
+    for guess in (None, 0, 6, 7, 8, 11, 20):
+        assert calculator._first_reaching(len(values), values.__getitem__, guess) == 7
+    assert calculator._first_reaching(3, lambda index: False, 1) is None
+    assert calculator._first_reaching(0, lambda index: True) is None
@@ -0,0 +1,75 @@
+import collections
+import itertools
+
+import pytest
+
+# (step, bilateral pairs, max_ratings): small enough to enumerate every claim outright.
+SEARCHES = [(step, pairs, max_ratings) for step, limits in ((20, (5, 4, 4)), (10, (5, 3, 4)), (5, (4, 3, 3)))
+            for pairs, max_ratings in enumerate(limits) if not (step == 5 and pairs == 2)]
+
+
+def as_tuples(claim):
+    return tuple(tuple(group) for group in claim)
+
+
+def is_canonical(claim):
+    """The explorer's layout rules: every extremity pair has both sides, left >= right, first pair >= second, lists descending."""
+    groups = as_tuples(claim)
+    if any(list(group) != sorted(group, reverse=True) for group in groups):
+        return False
+    upper, lower = (groups[1], groups[2]), (groups[3], groups[4])
+    if any(bool(left) != bool(right) or left < right for left, right in (upper, lower)):
+        return False
+    return not lower[0] or (upper[0] and upper >= lower)
+
+
+@pytest.fixture(scope="module")
+def brute_force(calculator):
+    """(step, pairs, max_ratings) -> {(method, award): set of claims}, from scoring every canonical claim."""
+    cache = {}
+
+    def search(step, pairs, max_ratings):
+        if (step, pairs, max_ratings) not in cache:
+            values = [float(value) for value in range(step * (100 // step), 0, -step)]
+            items = [(group, value) for group in range(1 + 2 * pairs) for value in values]
+            found = collections.defaultdict(set)
+            for size in range(1, max_ratings + 1):
+                for entries in itertools.combinations_with_replacement(items, size):
+                    groups = [[] for _ in range(5)]
+                    for group, value in entries:
+                        groups[group].append(value)
+                    claim = calculator.ClaimRatings(*(sorted(group, reverse=True) for group in groups))
+                    if not is_canonical(claim):
+                        continue
+                    score = calculator.score_claim(claim)
+                    found[("bva", score.award_bva)].add(as_tuples(claim))
+                    found[("table", score.award_table)].add(as_tuples(claim))
+            cache[step, pairs, max_ratings] = found
+        return cache[step, pairs, max_ratings]
+    return search
+
+
+@pytest.mark.parametrize("step, pairs, max_ratings", SEARCHES)
+@pytest.mark.parametrize("method", ["bva", "table"])
+def test_matches_brute_force(calculator, brute_force, method, step, pairs, max_ratings):
+    expected = brute_force(step, pairs, max_ratings)
+    for target in range(0, 101, 10):
+        found = [as_tuples(claim) for claim in calculator.find_rating_sets(target, method, max_ratings, step, pairs)]
+        assert len(found) == len(set(found)), "a rating set was yielded twice"
+        assert set(found) == expected[(method, target)], (method, target)
+
+
+@pytest.mark.parametrize("method", ["bva", "table"])
+def test_lone_bilateral_pair_of_100s(calculator, method):
+    # The pair alone is 110, above every target, yet adding any rating brings the claim back to 100.
+    ClaimRatings = calculator.ClaimRatings
+    found = list(calculator.find_rating_sets(100, method, max_ratings=3, step=10, bilateral_pairs=1))
+    assert ClaimRatings([], [100.0], [100.0], [], []) not in found
+    for value in range(10, 101, 10):
+        assert ClaimRatings([float(value)], [100.0], [100.0], [], []) in found
+
+
+@pytest.mark.parametrize("arguments", [(55,), (50, "other"), (50, "bva", 4, 0), (50, "bva", 4, 101)])
+def test_rejects_bad_arguments(calculator, arguments):
+    with pytest.raises(ValueError):
+        next(calculator.find_rating_sets(*arguments))
@@ -0,0 +1,61 @@
+import io
+
+import pytest
+
+# Eight claims, three of them repeats: b repeats a in the same chunk, e repeats a from an
+# earlier chunk, and h repeats c. The last record cannot be parsed.
+CLAIMS = """claim_id,general,upper_left,upper_right,lower_left,lower_right
+a,50 30,,,,
+b,30 50,,,,
+c,70,10,20,,
+d,40,,,10,
+e,50 30,,,,
+f,20 20 20,,,,
+g,60,,,,30
+h,70,10,20,,
+bad,abc,,,,
+"""
+
+
+def run(calculator, store, chunk_size=2):
+    sink = io.StringIO()
+    written, failed = calculator.score_stream(io.StringIO(CLAIMS), sink, chunk_size=chunk_size, store=store)
+    return sink.getvalue(), written, failed
+
+
+def counts(store):
+    return store.skipped, store.rescored, store.duplicates
+
+
+@pytest.fixture
+def plain_output(calculator):
+    return run(calculator, None)[0]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 4, 100])
+def test_counts_across_runs(calculator, tmp_path, plain_output, chunk_size):
+    path = str(tmp_path / "scores.db")
+    with calculator.ScoreStore(path) as store:
+        assert run(calculator, store, chunk_size) == (plain_output, 9, 1)
+        assert counts(store) == (0, 5, 3)
+        assert len(store) == 5
+    with calculator.ScoreStore(path) as store:
+        assert run(calculator, store, chunk_size)[0] == plain_output
+        assert counts(store) == (8, 0, 0)  # repeats were stored by the earlier run, so they are skipped too
+    with calculator.ScoreStore(path, rules_version="changed") as store:
+        assert run(calculator, store, chunk_size)[0] == plain_output
+        assert counts(store) == (0, 5, 3)
+        assert len(store) == 5
+
+
+def test_store_from_before_runs_were_recorded(calculator, tmp_path, plain_output):
+    import sqlite3
+    path = str(tmp_path / "old.db")
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE scores (content_hash BLOB NOT NULL, rules_version TEXT NOT NULL, result TEXT NOT NULL, "
+               "PRIMARY KEY (content_hash, rules_version)) WITHOUT ROWID")
+    db.commit()
+    db.close()
+    with calculator.ScoreStore(path) as store:
+        assert run(calculator, store)[0] == plain_output
+        assert counts(store) == (0, 5, 3)
@@ -0,0 +1,106 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+
+async def request(port, raw):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(raw)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+def http(method, path, body=b"", headers=None):
+    headers = {"Content-Length": str(len(body)), "Connection": "close", **(headers or {})}
+    lines = [f"{method} {path} HTTP/1.1"] + [f"{name}: {value}" for name, value in headers.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+def run_service(calculator, check, **options):
+    async def main():
+        service = await calculator.ScoringService(port=0, **options).start()
+        try:
+            await check(service)
+        finally:
+            await service.close()
+    asyncio.run(main())
+
+
+def test_concurrent_requests_share_a_batch(calculator):
+    claims = [calculator.ClaimRatings([10 * (1 + index % 9), 20], [], [], [10], [10 * (index % 3)]) for index in range(40)]
+
+    async def check(service):
+        bodies = [json.dumps({"claim_id": str(index), "general": claim.general, "lower_left": claim.lower_left,
+                              "lower_right": claim.lower_right}).encode() for index, claim in enumerate(claims)]
+        responses = await asyncio.gather(*(request(service.port, http("POST", "/score", body)) for body in bodies))
+        for index, (status, result) in enumerate(responses):
+            assert status == 200
+            assert result == dict(zip(calculator.SCORE_FIELDS, calculator.score_to_row(str(index), calculator.score_claim(claims[index]))))
+        assert service.batcher.stats()["largest_batch"] > 1
+        assert service.batcher.stats()["claims"] == len(claims)
+
+        status, result = await request(service.port, http("GET", "/health"))
+        assert status == 200 and result["status"] == "ok"
+        assert result["batcher"] == service.batcher.stats()
+
+    run_service(calculator, check, max_wait=0.05)
+
+
+def test_loop_keeps_serving_while_a_batch_is_scored(calculator):
+    started, release = threading.Event(), threading.Event()
+
+    def slow_score_batch(claims):
+        started.set()
+        release.wait(5)
+        return calculator.score_claims_batch(claims)
+
+    async def check(service):
+        service.batcher.score_batch = slow_score_batch
+        scoring = asyncio.ensure_future(request(service.port, http("POST", "/score", b'{"general": [50]}')))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        status, result = await asyncio.wait_for(request(service.port, http("GET", "/health")), 2)
+        assert status == 200 and result["batcher"]["batches"] == 0
+        release.set()
+        status, result = await scoring
+        assert status == 200 and result["award_bva"] == 50
+
+    run_service(calculator, check)
+
+
+def test_many_claims_in_one_request(calculator):
+    async def check(service):
+        body = json.dumps({"claims": [{"claim_id": "A", "general": [30]}, {"general": "50 20"}, {"general": "abc"}, 7]}).encode()
+        status, result = await request(service.port, http("POST", "/score", body))
+        assert status == 200
+        results = result["results"]
+        assert [row["claim_id"] for row in results] == ["A", 1, 2, 3]
+        assert [row["award_bva"] for row in results[:2]] == [30, 60]
+        assert results[2]["error"] and results[3]["error"] == "Each claim must be a JSON object."
+
+    run_service(calculator, check)
+
+
+@pytest.mark.parametrize("raw, status", [
+    (http("POST", "/score", b"{}", {"Content-Length": "nope"}), 400),
+    (http("POST", "/score", b"{}", {"Content-Length": "-3"}), 400),
+    (http("POST", "/score", b"{not json"), 400),
+    (http("POST", "/score", b"[1, 2]"), 400),
+    (http("POST", "/score", b'{"claims": 5}'), 400),
+    (b"NONSENSE\r\n\r\n", 400),
+    (http("GET", "/score"), 405),
+    (http("POST", "/health"), 405),
+    (http("GET", "/missing"), 404),
+    (http("POST", "/score", b"x" * 2000), 413),
+])
+def test_bad_requests(calculator, raw, status):
+    async def check(service):
+        code, result = await request(service.port, raw)
+        assert code == status and result["error"]
+
+    run_service(calculator, check, max_body=1000)
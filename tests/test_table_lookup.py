@@ -0,0 +1,10 @@
+import pytest
+
+
+def test_table_lookup_matches_table_method(calculator):
+    assert calculator.verify_combined_ratings_table() == []
+
+
+@pytest.mark.parametrize("ratings, expected", [([], 0), ([50, 30], 65), ([60, 40, 20], 81), ([100, 50], 100)])
+def test_table_lookup_values(calculator, ratings, expected):
+    assert calculator.va_disability_table_lookup(ratings) == expected